@@ -0,0 +1,71 @@
+#!/bin/env python3
+"""
+Measures how long ``from mazegen import MazeGenerator`` takes in a fresh
+interpreter and checks that the visualizer stack (MLX, OpenCV, NumPy) is
+not loaded by it. Exits with an error if any of them is imported or if the
+median import time goes over the given limit.
+
+Usage: python3 benchmarks/bench_headless_import.py [--runs 15] [--max-ms 150]
+"""
+
+from pathlib import Path
+from statistics import median
+import argparse
+import json
+import subprocess
+import sys
+
+SRC_FOLDER = Path(__file__).resolve().parent.parent / "src"
+HEAVY_MODULES = ("mlx", "cv2", "numpy")
+
+PROBE = f"""
+import json, sys, time
+sys.path.insert(0, {str(SRC_FOLDER)!r})
+start = time.perf_counter()
+from mazegen import MazeGenerator
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "ms": elapsed * 1000,
+    "loaded": [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+
+def probe() -> tuple[float, list[str]]:
+    """
+    Imports the package in a new interpreter and returns the time it took,
+    in milliseconds, and the heavy modules that got loaded.
+    """
+    output = subprocess.run([sys.executable, "-c", PROBE], check=True,
+                            capture_output=True, text=True).stdout
+    result = json.loads(output)
+    return (float(result["ms"]), list(result["loaded"]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=150.0,
+                        help="highest accepted median import time")
+    args = parser.parse_args()
+
+    times: list[float] = []
+    loaded: set[str] = set()
+    for _ in range(args.runs):
+        elapsed, modules = probe()
+        times.append(elapsed)
+        loaded.update(modules)
+
+    print(f"headless import: median {median(times):.1f} ms, "
+          f"min {min(times):.1f} ms, max {max(times):.1f} ms "
+          f"({args.runs} runs)")
+    if loaded:
+        print(f"ERROR: headless import loaded {', '.join(sorted(loaded))}")
+        sys.exit(1)
+    if median(times) > args.max_ms:
+        print(f"ERROR: headless import is slower than {args.max_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
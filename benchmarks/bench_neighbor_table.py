@@ -0,0 +1,109 @@
+#!/bin/env python3
+"""
+Compares the DFS generation speed of the old dict-of-dicts implementation
+(one ``get_adjacent_cells`` dictionary per step) against the current one,
+which walks the precomputed ``CellGrid`` neighbor table.
+
+Usage: python3 benchmarks/bench_neighbor_table.py [--sizes 500,2000]
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+from random import seed, shuffle
+from time import perf_counter
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mazegen.generator import Maze  # noqa: E402
+from mazegen.generator.src import NORTH, EAST, SOUTH, WEST  # noqa: E402
+
+WALLS = {NORTH: 0b0001, EAST: 0b0010, SOUTH: 0b0100, WEST: 0b1000}
+OPPOSITE = {NORTH: SOUTH, EAST: WEST, SOUTH: NORTH, WEST: EAST}
+
+
+def adjacent_cells(point: tuple[int, int], width: int,
+                   height: int) -> dict[str, tuple[int, int] | None]:
+    return {
+        WEST: None if point[0] == 1 else (point[0] - 1, point[1]),
+        EAST: None if point[0] == width else (point[0] + 1, point[1]),
+        NORTH: None if point[1] == 1 else (point[0], point[1] - 1),
+        SOUTH: None if point[1] == height else (point[0], point[1] + 1),
+    }
+
+
+def legacy_dfs(width: int, height: int) -> int:
+    """
+    The generation loop as it was before the neighbor table, without the
+    logo. Returns the number of carved cells.
+    """
+    cells = {(x, y): {"state": 0b1111, "visited": False, "fixed": False}
+             for x in range(1, width + 1) for y in range(1, height + 1)}
+    entry = (1, 1)
+    point = entry
+    cells[point]["visited"] = True
+    directions = [NORTH, EAST, SOUTH, WEST]
+    passed_cells = [point]
+    adjacents = adjacent_cells(point, width, height)
+    advanced = True
+    carved = 0
+    while not (point == entry and not advanced):
+        advanced = False
+        shuffle(directions)
+        for dir in directions:
+            adjacent = adjacents[dir]
+            if adjacent is None:
+                continue
+            data = cells[adjacent]
+            if not data["visited"] and not data["fixed"]:
+                cells[point]["state"] -= WALLS[dir]
+                data["state"] -= WALLS[OPPOSITE[dir]]
+                data["visited"] = True
+                point = adjacent
+                passed_cells.append(point)
+                adjacents = adjacent_cells(point, width, height)
+                advanced = True
+                carved += 1
+                break
+        if not advanced:
+            passed_cells.pop()
+            point = passed_cells[-1]
+            adjacents = adjacent_cells(point, width, height)
+    return carved
+
+
+def current_dfs(width: int, height: int) -> int:
+    maze = Maze(width, height, (1, 1), (width, height), seed_num=42,
+                ft_logo=False, perfect=True)
+    return sum(maze.get_grid().get_visited()) - 1
+
+
+def measure(name: str, size: int,
+            function: Callable[[int, int], int]) -> float:
+    seed(42)
+    start = perf_counter()
+    carved = function(size, size)
+    elapsed = perf_counter() - start
+    # Every carved cell is entered once and backtracked once
+    steps_per_second = 2 * carved / elapsed
+    print(f"{name:>8} {size:>5}x{size:<5} {elapsed:>9.2f}s "
+          f"{steps_per_second:>14,.0f} steps/s")
+    return steps_per_second
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="500,2000",
+                        help="comma separated side lengths of the grids")
+    args = parser.parse_args()
+
+    print(f"{'':>8} {'grid':^11} {'time':>10} {'speed':>20}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        before = measure("before", size, legacy_dfs)
+        after = measure("after", size, current_dfs)
+        print(f"{'speedup':>8} {after / before:>26.2f}x\n")
+
+
+if __name__ == "__main__":
+    main()
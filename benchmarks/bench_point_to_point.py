@@ -0,0 +1,75 @@
+#!/bin/env python3
+"""
+Compares the point to point searches of ``PathFinder`` (A* and the
+bidirectional breadth-first search) against the plain breadth-first
+search of ``shortest_path``, on random pairs of cells of imperfect mazes
+of several sizes and wall opening densities. A density of 0 builds a
+perfect maze.
+
+Usage: python3 benchmarks/bench_point_to_point.py [--sizes 100,300,1000]
+       [--densities 0,0.05,0.2] [--queries 20]
+"""
+
+from pathlib import Path
+from random import Random
+from time import perf_counter
+from typing import Callable, Optional
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mazegen.generator import Maze, Coords, Pathway  # noqa: E402
+from mazegen.generator.src.pathfinder import PathFinder  # noqa: E402
+
+Search = Callable[[Maze, Coords, Coords], Optional[Pathway]]
+
+SEARCHES: tuple[tuple[str, Search], ...] = (
+    ("bfs", PathFinder.shortest_path),
+    ("astar", PathFinder.astar),
+    ("bidirectional", PathFinder.bidirectional_search),
+)
+
+
+def measure(search: Search, maze: Maze,
+            pairs: list[tuple[Coords, Coords]]) -> float:
+    start = perf_counter()
+    for src, dst in pairs:
+        search(maze, src, dst)
+    return (perf_counter() - start) / len(pairs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100,300,1000",
+                        help="comma separated side lengths of the grids")
+    parser.add_argument("--densities", default="0,0.05,0.2",
+                        help="comma separated wall opening densities")
+    parser.add_argument("--queries", type=int, default=20,
+                        help="random pairs of cells searched per maze")
+    parser.add_argument("--seed", type=int, default=42,
+                        help="seed of the mazes and the pairs")
+    args = parser.parse_args()
+
+    print(f"{'grid':^11} {'density':>7} "
+          + " ".join(f"{name:>13}" for name, _ in SEARCHES)
+          + " " + " ".join(f"{name + '/bfs':>17}"
+                           for name, _ in SEARCHES[1:]))
+    for size in (int(s) for s in args.sizes.split(",")):
+        for density in (float(d) for d in args.densities.split(",")):
+            maze = Maze(size, size, (1, 1), (size, size),
+                        seed_num=args.seed, perfect=not density,
+                        wall_opening_density=density or None)
+            rng = Random(args.seed)
+            pairs = [((rng.randint(1, size), rng.randint(1, size)),
+                      (rng.randint(1, size), rng.randint(1, size)))
+                     for _ in range(args.queries)]
+            times = [measure(search, maze, pairs) for _, search in SEARCHES]
+            print(f"{size:>5}x{size:<5} {density:>7.2f} "
+                  + " ".join(f"{t * 1e3:>10.2f} ms" for t in times)
+                  + " " + " ".join(f"{times[0] / t:>16.2f}x"
+                                   for t in times[1:]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/bin/env python3
+"""
+Measures how fast ``Maze.print_output`` writes the output file, in MB/s,
+for growing maze sizes. The old cell by cell writer is measured on the
+same mazes as a reference.
+
+Usage: python3 benchmarks/bench_print_output.py [--sizes 250,500,1000,2000]
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import argparse
+import os
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mazegen.generator import Maze  # noqa: E402
+
+
+def legacy_print_output(maze: Maze, output_file: str) -> None:
+    """
+    The hexadecimal grid writer as it was before, one write per cell.
+    """
+    walls = maze.get_grid().get_walls()
+    width = maze.get_width()
+    with open(output_file, "w") as f:
+        for y in range(maze.get_height()):
+            for x in range(width):
+                f.write(str(format(walls[y * width + x], 'X')))
+            f.write("\n")
+
+
+def measure(name: str, size: int, write: Callable[[], None],
+            output_file: str, runs: int) -> None:
+    best = float("inf")
+    for _ in range(runs):
+        start = perf_counter()
+        write()
+        best = min(best, perf_counter() - start)
+    megabytes = os.path.getsize(output_file) / 1e6
+    print(f"{name:>8} {size:>5}x{size:<5} {megabytes:>9.2f} MB "
+          f"{best:>8.3f}s {megabytes / best:>9.1f} MB/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="250,500,1000,2000",
+                        help="comma separated side lengths of the mazes")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as folder:
+        output_file = os.path.join(folder, "maze.txt")
+        print(f"{'':>8} {'maze':^11} {'size':>12} {'time':>9} {'speed':>14}")
+        for size in (int(s) for s in args.sizes.split(",")):
+            maze = Maze(size, size, (1, 1), (size, size),
+                        output_file=output_file, seed_num=42, perfect=True)
+            measure("before", size,
+                    lambda: legacy_print_output(maze, output_file),
+                    output_file, args.runs)
+            measure("after", size, maze.print_output, output_file, args.runs)
+
+
+if __name__ == "__main__":
+    main()
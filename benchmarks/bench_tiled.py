@@ -0,0 +1,67 @@
+#!/bin/env python3
+"""
+Compares the generation time of tiled generation (see
+``TiledGenerator``) with several numbers of worker processes against the
+DFS generator, with the 42 logo on.
+
+Tiles are only carved in parallel with more than one CPU, so the speedup
+by worker count is bounded by the CPUs of the machine, printed first.
+
+Usage: python3 benchmarks/bench_tiled.py [--sizes 1000,2000]
+                                         [--workers 1,2,4] [--tile-size 256]
+"""
+
+from pathlib import Path
+from time import perf_counter
+import argparse
+import os
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mazegen.generator import Maze  # noqa: E402
+
+
+def measure(algorithm: str, size: int, repeats: int, workers: int = 1,
+            tile_size: int = Maze.DEFAULT_TILE_SIZE) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = perf_counter()
+        Maze(size, size, (1, 1), (size, size), seed_num=42, perfect=True,
+             algorithm=algorithm, workers=workers, tile_size=tile_size)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,2000",
+                        help="comma separated side lengths of the grids")
+    parser.add_argument("--workers", default="1,2,4",
+                        help="comma separated numbers of worker processes")
+    parser.add_argument("--tile-size", type=int,
+                        default=Maze.DEFAULT_TILE_SIZE,
+                        help="side of the tiles")
+    parser.add_argument("--repeats", type=int, default=1,
+                        help="runs per configuration, the best one is kept")
+    args = parser.parse_args()
+
+    print(f"CPUs: {os.cpu_count()}")
+    print(f"{'':>10} {'grid':^11} {'time':>10} {'vs dfs':>8} "
+          f"{'vs 1 worker':>12}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        dfs = measure("dfs", size, args.repeats)
+        print(f"{'dfs':>10} {size:>5}x{size:<5} {dfs:>9.3f}s {1:>7.2f}x")
+        single = None
+        for workers in (int(w) for w in args.workers.split(",")):
+            elapsed = measure("tiled", size, args.repeats, workers,
+                              args.tile_size)
+            single = single or elapsed
+            print(f"{f'tiled x{workers}':>10} {size:>5}x{size:<5} "
+                  f"{elapsed:>9.3f}s {dfs / elapsed:>7.2f}x "
+                  f"{single / elapsed:>11.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    main()
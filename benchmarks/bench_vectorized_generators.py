@@ -0,0 +1,72 @@
+#!/bin/env python3
+"""
+Compares the generation time of the DFS generator against the vectorized
+binary tree, sidewinder and Kruskal ones, with the 42 logo on. Kruskal
+is measured with its union-find loop and with ``spanning_walls``
+(``Generator.KRUSKAL_BORUVKA``).
+
+Usage: python3 benchmarks/bench_vectorized_generators.py [--sizes 1000]
+                                                         [--min-speedup 0]
+"""
+
+from pathlib import Path
+from time import perf_counter
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mazegen.generator import Maze, Generator  # noqa: E402
+
+ALGORITHMS = ("dfs", "binary_tree", "sidewinder", "kruskal", "boruvka")
+
+
+def measure(algorithm: str, size: int, repeats: int) -> float:
+    Generator.KRUSKAL_BORUVKA = algorithm == "boruvka"
+    if algorithm == "boruvka":
+        algorithm = "kruskal"
+    best = float("inf")
+    for _ in range(repeats):
+        start = perf_counter()
+        Maze(size, size, (1, 1), (size, size), seed_num=42, perfect=True,
+             algorithm=algorithm)
+        best = min(best, perf_counter() - start)
+    Generator.KRUSKAL_BORUVKA = False
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000",
+                        help="comma separated side lengths of the grids")
+    parser.add_argument("--repeats", type=int, default=3,
+                        help="runs per algorithm, the best one is kept")
+    parser.add_argument("--min-speedup", type=float, default=0,
+                        help="fail if a vectorized generator is not at "
+                             "least this many times faster than DFS")
+    args = parser.parse_args()
+
+    # Loading numpy before measuring anything
+    measure("binary_tree", 16, 1)
+
+    failed = False
+    print(f"{'':>12} {'grid':^11} {'time':>10} {'speedup':>9}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        dfs = measure("dfs", size, args.repeats)
+        for algorithm in ALGORITHMS:
+            elapsed = (dfs if algorithm == "dfs"
+                       else measure(algorithm, size, args.repeats))
+            speedup = dfs / elapsed
+            print(f"{algorithm:>12} {size:>5}x{size:<5} {elapsed:>9.3f}s "
+                  f"{speedup:>8.1f}x")
+            if algorithm != "dfs" and speedup < args.min_speedup:
+                failed = True
+        print()
+    if failed:
+        print(f"A vectorized generator is under {args.min_speedup}x faster "
+              "than DFS!")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
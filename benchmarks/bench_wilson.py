@@ -0,0 +1,58 @@
+#!/bin/env python3
+"""
+Compares the generation time of Wilson's algorithm (uniform spanning
+trees, see ``Generator.wilson_generation``) against the DFS generator,
+with the 42 logo on.
+
+The time of Wilson's algorithm depends a lot on the seed, since the first
+random walks, before they hit the small tree, can be very long. Every
+seed is run once and the median and the slowest time are reported, not
+the fastest one.
+
+Usage: python3 benchmarks/bench_wilson.py [--sizes 100,300,1000]
+                                          [--seeds 5]
+"""
+
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mazegen.generator import Maze  # noqa: E402
+
+
+def measure(algorithm: str, size: int, seeds: int) -> list[float]:
+    times = []
+    for seed in range(1, seeds + 1):
+        start = perf_counter()
+        Maze(size, size, (1, 1), (size, size), seed_num=seed, perfect=True,
+             algorithm=algorithm)
+        times.append(perf_counter() - start)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100,300,1000",
+                        help="comma separated side lengths of the grids")
+    parser.add_argument("--seeds", type=int, default=5,
+                        help="seeds run per algorithm, once each")
+    args = parser.parse_args()
+
+    print(f"{'grid':^11} {'dfs median':>11} {'dfs max':>9} "
+          f"{'wilson median':>14} {'wilson max':>11} {'median ratio':>13} "
+          f"{'max ratio':>10}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        dfs = measure("dfs", size, args.seeds)
+        wilson = measure("wilson", size, args.seeds)
+        print(f"{size:>5}x{size:<5} {median(dfs):>10.3f}s {max(dfs):>8.3f}s "
+              f"{median(wilson):>13.3f}s {max(wilson):>10.3f}s "
+              f"{median(wilson) / median(dfs):>12.2f}x "
+              f"{max(wilson) / median(dfs):>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 # flake8: noqa: F401
 
-from .generator import Maze, MazeGenerator, ConfigValidator
-from .generator import Cell, Coords, Pathway
+from .generator import Maze, MazeGenerator, MazeIO, ConfigValidator
+from .generator import Cell, CellGrid, Coords, Pathway, BinaryMazeFile
+from .generator import Generator, DfsStepper, MazeCache, MemoryMazeCache
+from .generator import PathIndex, JunctionGraph
 from .generator import ConfigError, MazeError
-from . import __main__
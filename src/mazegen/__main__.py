@@ -16,17 +16,25 @@ def check_environment() -> None:
 def main() -> None:
     check_environment()
 
-    if len(sys.argv) < 2:
+    expected_args = 2
+    if len(sys.argv) > 1 and sys.argv[1] == MazeVisualizer.LOAD_ARGUMENT:
+        # Opening a saved maze: a_maze_ing --load <maze file>
+        expected_args = 3
+    if len(sys.argv) < expected_args:
         print("Not enough arguments were given! "
               "Config file is required."
               "\nUsage: a_maze_ing <config file>: python3 a_maze_ing.py "
-              "config.txt")
+              "config.txt"
+              "\n       a_maze_ing --load <maze file>: python3 "
+              "a_maze_ing.py --load maze.txt")
         return
-    elif len(sys.argv) > 2:
+    elif len(sys.argv) > expected_args:
         print("Too many arguments were given! "
               "Only config file is required."
               "\nUsage: a_maze_ing <config file>: python3 a_maze_ing.py "
-              "config.txt")
+              "config.txt"
+              "\n       a_maze_ing --load <maze file>: python3 "
+              "a_maze_ing.py --load maze.txt")
         return
     MazeVisualizer.show_visualizer()
 
@@ -2,3 +2,5 @@
 
 from .main import MazeGenerator
 from .src import Maze, ConfigValidator, MazeError, ConfigError, Cell, Coords, Pathway
+from .src import CellGrid, MazeIO, BinaryMazeFile, Generator, DfsStepper
+from .src import MazeCache, MemoryMazeCache, PathIndex, JunctionGraph
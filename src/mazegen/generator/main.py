@@ -1,11 +1,30 @@
-from .src import ConfigValidator, Maze, Coords
-from typing import cast
+from .src import ConfigValidator, Maze, MazeIO, Coords
+from .src.generator import Generator
+from .src.maze_cache import MazeCache, MemoryMazeCache
+from .src.ft_logo_cells import FtLogoCells
+from .src.predefined import ELLER
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from random import Random
+from typing import Any, Optional, cast
+
+
+def _generate_packed(parameters: dict[str, Any]) -> bytes:
+    """
+    Process pool worker: generates one maze and sends it back packed, so
+    only a few buffers are pickled instead of the whole maze.
+    """
+    return MazeIO.pack(Maze(**parameters))
 
 
 class MazeGenerator:
 
     @staticmethod
-    def generate(config_file: str) -> Maze:
+    def read_parameters(config_file: str) -> dict[str, Any]:
+        """
+        Reads the given config file and returns the keyword arguments
+        that ``Maze`` must be built with.
+        """
         # Stablishing values for the maze.
         config = ConfigValidator.read_config(config_file)
 
@@ -31,17 +50,208 @@ class MazeGenerator:
         scale: bool = (
             cast(bool,
                  config[ConfigValidator.AvailableKeys.FT_LOGO_SCALE.value]))
+        binary_output: bool = (
+            cast(bool,
+                 config[ConfigValidator.AvailableKeys.BINARY_OUTPUT.value]))
+        algorithm: str = (
+            cast(str, config[ConfigValidator.AvailableKeys.ALGORITHM.value]))
+        tile_size: int = (
+            cast(int, config[ConfigValidator.AvailableKeys.TILE_SIZE.value]))
+        workers: int = (
+            cast(int, config[ConfigValidator.AvailableKeys.WORKERS.value]))
+        wall_opening_density: float = (
+            cast(float, config[
+                ConfigValidator.AvailableKeys.WALL_OPENING_DENSITY.value]))
+        dead_end_removal: float = (
+            cast(float, config[
+                ConfigValidator.AvailableKeys.DEAD_END_REMOVAL.value]))
+
+        return {"width": width,
+                "height": height,
+                "entry": entry,
+                "exit": exit,
+                "output_file": output_file,
+                "ft_logo": ft_logo,
+                "perfect": perfect,
+                "seed_num": seed_num,
+                "path_finder": path_finder,
+                "ft_logo_scale": scale,
+                "binary_output": binary_output,
+                "algorithm": algorithm,
+                "tile_size": tile_size,
+                "workers": workers,
+                "wall_opening_density": wall_opening_density,
+                "dead_end_removal": dead_end_removal
+                }
+
+    @staticmethod
+    def generate(config_file: str,
+                 cache: Optional[MazeCache] = None,
+                 memory: Optional[MemoryMazeCache] = None) -> Maze:
+        """
+        Generates the maze of the given config file.
 
-        maze = Maze(width=width,
-                    height=height,
-                    entry=entry,
-                    exit=exit,
-                    output_file=output_file,
-                    ft_logo=ft_logo,
-                    perfect=perfect,
-                    seed_num=seed_num,
-                    path_finder=path_finder,
-                    ft_logo_scale=scale
-                    )
+        Parameters
+        ----------
+        config_file: str
+            Path of the config file.
+        cache: Optional[MazeCache]
+            If given, the maze is loaded from it when the same
+            configuration was already generated, and saved into it
+            otherwise (see ``MazeCache`` for the mazes that are cached).
+        memory: Optional[MemoryMazeCache]
+            If given, the config file is only parsed again when it
+            changes, and the maze is looked for in memory before ``cache``.
+            Every hit returns a new copy of the maze.
+        """
+        if memory is not None:
+            parameters = memory.read_parameters(config_file)
+            maze = memory.get(parameters)
+            if maze is not None:
+                return maze
+        else:
+            parameters = MazeGenerator.read_parameters(config_file)
+        maze = cache.get(parameters) if cache is not None else None
+        if maze is None:
+            maze = Maze(**parameters)
+            if cache is not None:
+                cache.put(parameters, maze)
+        if memory is not None:
+            memory.put(parameters, maze)
         # maze.print_output()
         return maze
+
+    @staticmethod
+    def load(maze_file: str) -> Maze:
+        """
+        Loads a maze saved with ``Maze.print_output`` instead of
+        generating a new one.
+        """
+        return Maze.from_file(maze_file)
+
+    @staticmethod
+    def stream(config_file: str) -> int:
+        """
+        Generates the maze of the given config file with Eller's algorithm
+        and writes it to its ``OUTPUT_FILE`` row by row, so memory only
+        depends on the width of the maze and not on its height.
+
+        The ``ALGORITHM`` and ``DEAD_END_REMOVAL`` keys are ignored and no
+        ``Maze`` is built: the output has an empty directions line (see
+        ``MazeIO.write_stream``) and the pathfinder keys have no effect.
+
+        Returns
+        -------
+        seed: int
+            The seed used, so the same maze can be streamed again.
+        """
+        parameters = MazeGenerator.read_parameters(config_file)
+        width: int = parameters["width"]
+        height: int = parameters["height"]
+        entry: Coords = parameters["entry"]
+        exit: Coords = parameters["exit"]
+        output_file: str = parameters["output_file"]
+        seed = Maze.resolve_seed(parameters["seed_num"])
+
+        flags = 0
+        fixed_cells: tuple[Coords, ...] = ()
+        if parameters["ft_logo"]:
+            flags |= MazeIO.FLAG_FT_LOGO
+            fixed_cells = FtLogoCells.logo_cells(
+                width, height, parameters["ft_logo_scale"]) or ()
+        if parameters["ft_logo_scale"]:
+            flags |= MazeIO.FLAG_FT_LOGO_SCALE
+        if parameters["perfect"]:
+            flags |= MazeIO.FLAG_PERFECT
+
+        rows = Generator.eller_rows(width, height, entry, exit, fixed_cells,
+                                    Random(seed), parameters["perfect"],
+                                    parameters["wall_opening_density"])
+        MazeIO.write_stream(output_file, rows, width, height, entry, exit,
+                            binary_path=(MazeIO.binary_path(output_file)
+                                         if parameters["binary_output"]
+                                         else None),
+                            seed=seed, algorithm=ELLER, flags=flags)
+        return seed
+
+    # BATCH GENERATION --------------------------------------------------------
+    @staticmethod
+    def derive_seed(base_seed: int, index: int) -> int:
+        """
+        Returns the seed of the maze at position ``index`` of a batch.
+        It only depends on both values, never on the number of workers
+        or on the order in which the mazes are finished.
+        """
+        return Random(f"{base_seed}:{index}").randint(1, Maze.MAX_RANDOM_SEED)
+
+    @staticmethod
+    def __batch_parameters(configs: Iterable[str],
+                           base_seed: Optional[int]
+                           ) -> list[dict[str, Any]]:
+        """
+        Reads every different config file only once and returns the
+        parameters of every maze of the batch.
+        """
+        read: dict[str, dict[str, Any]] = {}
+        batch: list[dict[str, Any]] = []
+        for index, config_file in enumerate(configs):
+            if config_file not in read:
+                read[config_file] = MazeGenerator.read_parameters(config_file)
+            parameters = dict(read[config_file])
+            if base_seed is not None:
+                parameters["seed_num"] = MazeGenerator.derive_seed(
+                    base_seed, index)
+            batch.append(parameters)
+        return batch
+
+    @staticmethod
+    def generate_many(configs: Iterable[str],
+                      workers: Optional[int] = None,
+                      base_seed: Optional[int] = None) -> list[Maze]:
+        """
+        Generates one maze per given config file, spreading the work
+        across a pool of processes.
+
+        Parameters
+        ----------
+        configs: Iterable[str]
+            Config files, the same file can be given many times.
+        workers: Optional[int]
+            Number of processes to use. ``None`` uses every CPU and ``1``
+            generates everything in the current process.
+        base_seed: Optional[int]
+            If given, the seed of every maze is derived from it and from
+            its position in ``configs`` (see ``derive_seed``), replacing
+            the ``SEED`` of the config file.
+
+        Returns
+        -------
+        mazes: list[Maze]
+            The generated mazes, in the same order as ``configs``.
+        """
+        batch = MazeGenerator.__batch_parameters(configs, base_seed)
+        if workers == 1:
+            return [Maze(**parameters) for parameters in batch]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return [MazeIO.unpack(packed) for packed in
+                    executor.map(_generate_packed, batch)]
+
+    @staticmethod
+    def iter_generate_many(configs: Iterable[str],
+                           workers: Optional[int] = None,
+                           base_seed: Optional[int] = None
+                           ) -> Iterator[tuple[int, Maze]]:
+        """
+        Same as ``generate_many``, but yields every maze as soon as it is
+        finished, together with its position in ``configs``.
+        """
+        batch = MazeGenerator.__batch_parameters(configs, base_seed)
+        if workers == 1:
+            for index, parameters in enumerate(batch):
+                yield (index, Maze(**parameters))
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_generate_packed, parameters): index
+                       for index, parameters in enumerate(batch)}
+            for future in as_completed(futures):
+                yield (futures[future], MazeIO.unpack(future.result()))
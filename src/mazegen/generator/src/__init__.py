@@ -1,6 +1,13 @@
 # flake8: noqa: F401
 
 from .maze import Maze
+from .cell_grid import CellGrid
+from .maze_io import MazeIO, BinaryMazeFile
+from .generator import Generator
+from .dfs_stepper import DfsStepper
+from .maze_cache import MazeCache, MemoryMazeCache
+from .path_index import PathIndex
+from .junction_graph import JunctionGraph
 from .exceptions import MazeError, ConfigError
 from .config_validator import ConfigValidator
 from .gen_types import Cell, Coords, Pathway, Config_Value
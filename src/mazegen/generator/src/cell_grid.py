@@ -0,0 +1,231 @@
+#!/bin/env python3
+
+from .gen_types import Coords, Cell, NeighborTable, ByteBuffer
+
+# Other imports
+from array import array
+from collections.abc import Iterator, Mapping
+from typing import Optional, Union
+
+
+class CellGrid:
+    """
+    Contiguous storage for every cell of a maze.
+
+    The walls, visited and fixed flags are kept in three ``bytearray``
+    buffers of ``width * height`` bytes, indexed in row-major order with
+    ``(y - 1) * width + (x - 1)`` for the 1-based coordinates used by the
+    rest of the generator.
+
+    Notes
+    -----
+    The wall bits are the same ones used in ``Maze.WALLS``, so the low
+    nibble of ``walls[i]`` is exactly the hexadecimal digit written in the
+    output file for that cell.
+
+    Code writing directly into the walls buffer of a finished maze must
+    call ``mark_changed`` afterwards, so anything computed from the walls
+    (like distance fields) gets recomputed.
+    """
+
+    CLOSED = 0b1111
+    NO_NEIGHBOR = -1
+
+    # Wall bit of every direction, in ``POSSIBLE_DIRECTIONS`` order
+    WALL_BITS = (0b0001, 0b0010, 0b0100, 0b1000)
+    OPPOSITE_WALL_BITS = (0b0100, 0b1000, 0b0001, 0b0010)
+
+    def __init__(self, width: int, height: int) -> None:
+        self._width = width
+        self._height = height
+        size = width * height
+        self._walls = bytearray([CellGrid.CLOSED]) * size
+        self._visited = bytearray(size)
+        self._fixed = bytearray(size)
+        self._neighbors: Optional[NeighborTable] = None
+        self._version = 0
+
+    @classmethod
+    def from_buffers(cls, width: int, height: int,
+                     walls: ByteBuffer, visited: ByteBuffer,
+                     fixed: ByteBuffer) -> "CellGrid":
+        """
+        Builds a grid from copies of already filled buffers.
+        """
+        size = width * height
+        if len(walls) != size or len(visited) != size or len(fixed) != size:
+            raise ValueError(f"Buffers don't match a {width}x{height} grid!")
+        grid = cls(0, 0)
+        grid._width = width
+        grid._height = height
+        grid._walls = bytearray(walls)
+        grid._visited = bytearray(visited)
+        grid._fixed = bytearray(fixed)
+        return grid
+
+    # DIMENSIONS --------------------------------------------------------------
+    def get_width(self) -> int:
+        return self._width
+
+    def get_height(self) -> int:
+        return self._height
+
+    def get_size(self) -> int:
+        return self._width * self._height
+
+    # BUFFERS -----------------------------------------------------------------
+    def get_walls(self) -> bytearray:
+        return self._walls
+
+    def get_visited(self) -> bytearray:
+        return self._visited
+
+    def get_fixed(self) -> bytearray:
+        return self._fixed
+
+    # INDEXING ----------------------------------------------------------------
+    def contains(self, coords: Coords) -> bool:
+        return (1 <= coords[0] <= self._width and
+                1 <= coords[1] <= self._height)
+
+    def index(self, coords: Coords) -> int:
+        """
+        Returns the position of the given coordinate inside the buffers.
+        """
+        return (coords[1] - 1) * self._width + coords[0] - 1
+
+    def coords(self, index: int) -> Coords:
+        """
+        Returns the coordinate stored at the given position of the buffers.
+        """
+        y, x = divmod(index, self._width)
+        return (x + 1, y + 1)
+
+    # VERSION -----------------------------------------------------------------
+    def get_version(self) -> int:
+        """
+        Returns a counter that changes every time the walls are modified.
+        """
+        return self._version
+
+    def mark_changed(self) -> None:
+        self._version += 1
+
+    # NEIGHBORS ---------------------------------------------------------------
+    def get_neighbors(self) -> NeighborTable:
+        """
+        Returns the neighbor index table of the grid.
+
+        The table is built only once per grid and holds one flat ``array``
+        per direction, in ``POSSIBLE_DIRECTIONS`` order (north, east,
+        south, west). ``table[d][i]`` is the index of the cell next to
+        ``i`` in direction ``d``, or ``NO_NEIGHBOR`` if ``i`` is on that
+        border.
+
+        Notes
+        -----
+        Algorithms walking the grid should read from this table instead of
+        calling ``Maze.get_adjacent_cells``, so no dictionary or tuple is
+        allocated on every step.
+        """
+        if self._neighbors is None:
+            width = self._width
+            height = self._height
+            size = width * height
+            border_row = array("i", [CellGrid.NO_NEIGHBOR]) * width
+            border_col = array("i", [CellGrid.NO_NEIGHBOR]) * height
+
+            north = border_row + array("i", range(0, size - width))
+            south = array("i", range(width, size)) + border_row
+            east = array("i", range(1, size + 1))
+            east[width - 1::width] = border_col
+            west = array("i", range(-1, size - 1))
+            west[0::width] = border_col
+            self._neighbors = (north, east, south, west)
+        return self._neighbors
+
+    # CELLS -------------------------------------------------------------------
+    def set_cell(self, coords: Coords, cell: Cell) -> None:
+        """
+        Copies the values of a ``Cell`` mapping into the buffers.
+        Missing keys leave the stored value untouched.
+        """
+        i = self.index(coords)
+        if "state" in cell:
+            self._walls[i] = int(cell["state"]) & CellGrid.CLOSED
+        if "visited" in cell:
+            self._visited[i] = bool(cell["visited"])
+        if "fixed" in cell:
+            self._fixed[i] = bool(cell["fixed"])
+        self.mark_changed()
+
+
+class CellView(Mapping[str, Union[int, bool]]):
+    """
+    Read-only ``Cell`` look-alike backed by a ``CellGrid``.
+
+    It keeps the ``{"state", "visited", "fixed"}`` interface of the old
+    dictionary cells, reading the buffers on every access so it always
+    reflects the current state of the maze.
+    """
+
+    KEYS = ("state", "visited", "fixed")
+
+    __slots__ = ("_grid", "_index")
+
+    def __init__(self, grid: CellGrid, index: int) -> None:
+        self._grid = grid
+        self._index = index
+
+    def __getitem__(self, key: str) -> Union[int, bool]:
+        if key == "state":
+            return self._grid.get_walls()[self._index]
+        if key == "visited":
+            return bool(self._grid.get_visited()[self._index])
+        if key == "fixed":
+            return bool(self._grid.get_fixed()[self._index])
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(CellView.KEYS)
+
+    def __len__(self) -> int:
+        return len(CellView.KEYS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def get_coords(self) -> Coords:
+        return self._grid.coords(self._index)
+
+
+class CellsView(Mapping[Coords, Cell]):
+    """
+    Read-only ``dict[Coords, Cell]`` look-alike over a ``CellGrid``.
+
+    Cells are created on demand, so no per-cell object is kept alive
+    unless the caller holds on to it.
+    """
+
+    __slots__ = ("_grid",)
+
+    def __init__(self, grid: CellGrid) -> None:
+        self._grid = grid
+
+    def __getitem__(self, coords: Coords) -> Cell:
+        if not self._grid.contains(coords):
+            raise KeyError(coords)
+        return CellView(self._grid, self._grid.index(coords))
+
+    def __contains__(self, coords: object) -> bool:
+        if not isinstance(coords, tuple) or len(coords) != 2:
+            return False
+        return self._grid.contains(coords)
+
+    def __iter__(self) -> Iterator[Coords]:
+        for y in range(1, self._grid.get_height() + 1):
+            for x in range(1, self._grid.get_width() + 1):
+                yield (x, y)
+
+    def __len__(self) -> int:
+        return self._grid.get_size()
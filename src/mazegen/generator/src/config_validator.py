@@ -2,9 +2,11 @@
 
 from enum import Enum
 from .exceptions import ConfigError
+from .maze import Maze
 from .gen_types import Config_Value
 from typing import Any, cast
 from .gen_types import Coords
+from .predefined import DFS, ALGORITHMS
 
 
 class ConfigValidator:
@@ -21,13 +23,24 @@ class ConfigValidator:
         FT_LOGO = "FT_LOGO"
         FT_LOGO_SCALE = "FT_LOGO_SCALE"
         PATH_FINDER = "PATH_FINDER"
+        BINARY_OUTPUT = "BINARY_OUTPUT"
+        ALGORITHM = "ALGORITHM"
+        TILE_SIZE = "TILE_SIZE"
+        WORKERS = "WORKERS"
+        WALL_OPENING_DENSITY = "WALL_OPENING_DENSITY"
+        DEAD_END_REMOVAL = "DEAD_END_REMOVAL"
 
         DEFAULT_VALUES = {WIDTH: 0, HEIGHT: 0,
                           ENTRY: (0, 0), EXIT: (0, 0),
                           OUTPUT_FILE: None,
                           PERFECT: None, SEED: None,
                           FT_LOGO: True, PATH_FINDER: False,
-                          FT_LOGO_SCALE: False}
+                          FT_LOGO_SCALE: False, BINARY_OUTPUT: False,
+                          ALGORITHM: DFS, TILE_SIZE: Maze.DEFAULT_TILE_SIZE,
+                          WORKERS: Maze.DEFAULT_WORKERS,
+                          WALL_OPENING_DENSITY: (
+                              Maze.DEFAULT_WALL_OPENING_DENSITY),
+                          DEAD_END_REMOVAL: Maze.DEFAULT_DEAD_END_REMOVAL}
 
     @classmethod
     def __parse_width(cls, value: str) -> int:
@@ -191,6 +204,79 @@ class ConfigValidator:
                               f"{cls.AvailableKeys.FT_LOGO_SCALE.value}. "
                               "Only 'True' or 'False' are accepted values!")
 
+    @classmethod
+    def __parse_binary_output(cls, value: str) -> bool:
+        if value != "True" and value != "False":
+            raise ConfigError(f"Given value '{value}' doesn't work for "
+                              f"{cls.AvailableKeys.BINARY_OUTPUT.value}. "
+                              "Only 'True' or 'False' are accepted values!")
+        return value == "True"
+
+    @classmethod
+    def __parse_algorithm(cls, value: str) -> str:
+        if value.lower() not in ALGORITHMS:
+            raise ConfigError(f"Given value '{value}' doesn't work for "
+                              f"{cls.AvailableKeys.ALGORITHM.value}. "
+                              f"Only {', '.join(ALGORITHMS)} are accepted "
+                              "values!")
+        return value.lower()
+
+    @classmethod
+    def __parse_tile_size(cls, value: str) -> int:
+        try:
+            tile_size = int(value)
+        except ValueError:
+            raise ConfigError(f"Given value '{value}' doesn't work for "
+                              f"{cls.AvailableKeys.TILE_SIZE.value}. Only "
+                              "single integers are accepted!")
+        if tile_size < 1:
+            raise ConfigError(f"Given value '{value}' doesn't work for "
+                              f"{cls.AvailableKeys.TILE_SIZE.value}. It "
+                              "can't be lower than 1!")
+        return tile_size
+
+    @classmethod
+    def __parse_workers(cls, value: str) -> int:
+        try:
+            workers = int(value)
+        except ValueError:
+            raise ConfigError(f"Given value '{value}' doesn't work for "
+                              f"{cls.AvailableKeys.WORKERS.value}. Only "
+                              "single integers are accepted!")
+        if workers < 0:
+            raise ConfigError(f"Given value '{value}' doesn't work for "
+                              f"{cls.AvailableKeys.WORKERS.value}. It "
+                              "can't be negative!")
+        return workers
+
+    @classmethod
+    def __parse_wall_opening_density(cls, value: str) -> float:
+        try:
+            density = float(value)
+        except ValueError:
+            raise ConfigError(f"Given value '{value}' doesn't work for "
+                              f"{cls.AvailableKeys.WALL_OPENING_DENSITY.value}"
+                              ". Only single numbers are accepted!")
+        if not 0 <= density <= 1:
+            raise ConfigError(f"Given value '{value}' doesn't work for "
+                              f"{cls.AvailableKeys.WALL_OPENING_DENSITY.value}"
+                              ". It must be between 0 and 1!")
+        return density
+
+    @classmethod
+    def __parse_dead_end_removal(cls, value: str) -> float:
+        try:
+            percentage = float(value)
+        except ValueError:
+            raise ConfigError(f"Given value '{value}' doesn't work for "
+                              f"{cls.AvailableKeys.DEAD_END_REMOVAL.value}. "
+                              "Only single numbers are accepted!")
+        if not 0 <= percentage <= 100:
+            raise ConfigError(f"Given value '{value}' doesn't work for "
+                              f"{cls.AvailableKeys.DEAD_END_REMOVAL.value}. "
+                              "It must be between 0 and 100!")
+        return percentage
+
     @classmethod
     def __parse_config(cls, key: str, value: str) -> (
             tuple[str, Config_Value]):
@@ -221,17 +307,30 @@ class ConfigValidator:
                 result = cls.__parse_path_finder(value)
             case cls.AvailableKeys.FT_LOGO_SCALE.value:
                 result = cls.__parse_ft_logo_scale(value)
+            case cls.AvailableKeys.BINARY_OUTPUT.value:
+                result = cls.__parse_binary_output(value)
+            case cls.AvailableKeys.ALGORITHM.value:
+                result = cls.__parse_algorithm(value)
+            case cls.AvailableKeys.TILE_SIZE.value:
+                result = cls.__parse_tile_size(value)
+            case cls.AvailableKeys.WORKERS.value:
+                result = cls.__parse_workers(value)
+            case cls.AvailableKeys.WALL_OPENING_DENSITY.value:
+                result = cls.__parse_wall_opening_density(value)
+            case cls.AvailableKeys.DEAD_END_REMOVAL.value:
+                result = cls.__parse_dead_end_removal(value)
         return (key, result)
 
     @classmethod
     def read_config(cls, config_file: str = "config.txt"
                     ) -> dict[str, Config_Value]:
-        available_keys: dict[str, int | str | tuple[Coords, ...] | bool] = {}
+        available_keys: dict[str, (int | float | str | tuple[Coords, ...]
+                                   | bool)] = {}
         for key in cls.AvailableKeys:
             if key is cls.AvailableKeys.DEFAULT_VALUES:
                 break
             available_keys[key.value] = cast((
-                int | str | tuple[Coords, ...] | bool),
+                int | float | str | tuple[Coords, ...] | bool),
                 cls.AvailableKeys.DEFAULT_VALUES.value[key.value]
                 )
         with open(config_file, "r") as f:
@@ -0,0 +1,268 @@
+#!/bin/env python3
+
+# Main imports
+from .cell_grid import CellGrid
+from .gen_types import Coords, Pathway
+from .exceptions import MazeError
+from .predefined import POSSIBLE_DIRECTIONS, DIRECTION_ORDERS
+
+# Other imports
+from array import array
+from collections.abc import Iterator
+from random import Random
+from struct import Struct, error as StructError
+from typing import Optional
+
+
+class DfsStepper(Iterator[list[tuple[Coords, Coords]]]):
+    """
+    The DFS of ``Generator.dfs_generation``, split in steps that can be
+    paused at any carved passage and resumed later, even in another
+    process.
+
+    Iterating it yields lists of at most ``batch_size`` carved passages,
+    each one as the pair of cells it joins, until the whole maze is
+    carved. ``save`` turns the current state (cells, backtracking stack,
+    pathway found and random generator) into bytes and ``load`` rebuilds
+    a stepper that continues exactly where it was left.
+
+    Notes
+    -----
+    Pausing doesn't change the result: the same random calls are done in
+    the same order, so a stepper run to the end in one go or in many
+    batches, saved and loaded in between, carves the same maze.
+    """
+
+    DEFAULT_BATCH_SIZE = 1024
+
+    # Saved state: header, walls, visited, fixed, stack, directions of the
+    # stack, pathway to the exit and its directions, random generator
+    STATE_MAGIC = b"MZST"
+    STATE_HEADER = Struct("<4sIIiiIiHd?")
+    RNG_VERSION = 3
+    RNG_WORDS = 625
+
+    def __init__(self, grid: CellGrid, entry: int, exit: int, rng: Random,
+                 batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        """
+        Starts a DFS at the ``entry`` cell index of a grid with every wall
+        closed and its fixed cells marked.
+        """
+        if batch_size < 1:
+            raise MazeError("Batch size can't be lower than 1!")
+        self._grid = grid
+        self._entry = entry
+        self._exit = exit
+        self._rng = rng
+        self._batch_size = batch_size
+        self._passed_cells = array("i", [entry])
+        self._directions = bytearray()
+        self._exit_path: Optional[array] = None
+        self._exit_directions = bytearray()
+        self._done = False
+        grid.get_visited()[entry] = True
+
+    # STATE -------------------------------------------------------------------
+    def get_grid(self) -> CellGrid:
+        return self._grid
+
+    def get_batch_size(self) -> int:
+        return self._batch_size
+
+    def set_batch_size(self, batch_size: int) -> None:
+        if batch_size < 1:
+            raise MazeError("Batch size can't be lower than 1!")
+        self._batch_size = batch_size
+
+    def is_done(self) -> bool:
+        return self._done
+
+    def result(self) -> tuple[CellGrid, Pathway, list[str]]:
+        """
+        Returns the same as ``Generator.dfs_generation`` once every cell
+        is carved.
+
+        Raises
+        ------
+        MazeError
+            If the generation isn't finished or the exit can't be reached
+            from the entry.
+        """
+        if not self._done:
+            raise MazeError("Maze generation isn't finished yet!")
+        if self._exit_path is None:
+            raise MazeError("EXIT point can't be reached from ENTRY point!")
+        grid = self._grid
+        return (grid,
+                [grid.coords(i) for i in self._exit_path],
+                [POSSIBLE_DIRECTIONS[dir] for dir in self._exit_directions])
+
+    # STEPS -------------------------------------------------------------------
+    def __next__(self) -> list[tuple[Coords, Coords]]:
+        if self._done:
+            raise StopIteration
+        carved: list[tuple[int, int]] = []
+        self.__advance(self._batch_size, carved)
+        if not carved:
+            raise StopIteration
+        coords = self._grid.coords
+        return [(coords(a), coords(b)) for a, b in carved]
+
+    def run(self) -> None:
+        """
+        Carves everything left, without collecting the passages.
+        """
+        self.__advance(-1, None)
+
+    def __advance(self, limit: int,
+                  carved: Optional[list[tuple[int, int]]]) -> None:
+        """
+        Runs the DFS until ``limit`` passages are carved (never stopping
+        if negative) or the whole maze is done. Carved passages are added
+        to ``carved`` if given.
+        """
+        grid = self._grid
+        walls = grid.get_walls()
+        visited = grid.get_visited()
+        fixed = grid.get_fixed()
+        neighbors = grid.get_neighbors()
+        bits = CellGrid.WALL_BITS
+        op_bits = CellGrid.OPPOSITE_WALL_BITS
+        choice = self._rng.choice
+        entry_i = self._entry
+        exit_i = self._exit
+        passed_cells = self._passed_cells
+        directions_followed = self._directions
+        point = passed_cells[-1]
+
+        while limit != 0:
+            advanced = False
+
+            # Randomized directions order
+            for dir in choice(DIRECTION_ORDERS):
+                adjacent = neighbors[dir][point]
+                if adjacent < 0 or visited[adjacent] or fixed[adjacent]:
+                    continue
+                # Changing current cell state
+                walls[point] -= bits[dir]
+
+                # Changing adjacent cell state
+                walls[adjacent] -= op_bits[dir]
+                visited[adjacent] = True
+
+                if carved is not None:
+                    carved.append((point, adjacent))
+                    limit -= 1
+
+                # Updating stuff
+                point = adjacent
+                passed_cells.append(point)
+                directions_followed.append(dir)
+                if point == exit_i:
+                    self._exit_path = passed_cells[:]
+                    self._exit_directions = directions_followed[:]
+                advanced = True
+                break
+            if advanced:
+                continue
+
+            # Not being able to move any direction and being at the starting
+            # point will mean that we already checked every possible way
+            if point == entry_i:
+                self._done = True
+                break
+
+            # Going backwards if point didn't advanced
+            passed_cells.pop()
+            directions_followed.pop()
+            point = passed_cells[-1]
+
+    # SERIALIZATION -----------------------------------------------------------
+    def save(self) -> bytes:
+        """
+        Returns the whole state of the stepper, to be rebuilt with
+        ``load``.
+        """
+        grid = self._grid
+        version, words, gauss_next = self._rng.getstate()
+        if version != DfsStepper.RNG_VERSION or \
+                len(words) != DfsStepper.RNG_WORDS:
+            raise MazeError("Unsupported random generator state!")
+        exit_path = self._exit_path
+        header = DfsStepper.STATE_HEADER.pack(
+            DfsStepper.STATE_MAGIC, grid.get_width(), grid.get_height(),
+            self._entry, self._exit, len(self._passed_cells),
+            -1 if exit_path is None else len(exit_path),
+            min(self._batch_size, 0xFFFF),
+            gauss_next or 0.0, gauss_next is not None)
+        return b"".join((
+            header,
+            bytes(grid.get_walls()), bytes(grid.get_visited()),
+            bytes(grid.get_fixed()),
+            self._passed_cells.tobytes(), bytes(self._directions),
+            b"" if exit_path is None else exit_path.tobytes(),
+            bytes(self._exit_directions),
+            array("I", words).tobytes()))
+
+    @classmethod
+    def load(cls, data: bytes) -> "DfsStepper":
+        """
+        Rebuilds a stepper saved with ``save``.
+
+        Raises
+        ------
+        MazeError
+            If the data is not a saved stepper or is truncated.
+        """
+        try:
+            (magic, width, height, entry, exit, stack_len, exit_len,
+             batch_size, gauss_next, has_gauss) = (
+                cls.STATE_HEADER.unpack_from(data))
+        except StructError:
+            raise MazeError("Saved generation state is truncated!")
+        if magic != cls.STATE_MAGIC:
+            raise MazeError("Given data is not a saved generation state!")
+
+        view = memoryview(data)
+        offset = cls.STATE_HEADER.size
+        size = width * height
+        item = array("i").itemsize
+
+        def take(length: int) -> memoryview:
+            nonlocal offset
+            if length < 0 or offset + length > len(view):
+                raise MazeError("Saved generation state is truncated!")
+            chunk = view[offset:offset + length]
+            offset += length
+            return chunk
+
+        grid = CellGrid.from_buffers(width, height,
+                                     take(size), take(size), take(size))
+        stepper = cls(grid, entry, exit, Random(), max(batch_size, 1))
+        stepper._passed_cells = array("i")
+        stepper._passed_cells.frombytes(take(stack_len * item))
+        stepper._directions = bytearray(take(stack_len - 1))
+        if exit_len >= 0:
+            stepper._exit_path = array("i")
+            stepper._exit_path.frombytes(take(exit_len * item))
+            stepper._exit_directions = bytearray(take(exit_len - 1))
+        words = array("I")
+        words.frombytes(take(cls.RNG_WORDS * words.itemsize))
+        stepper._rng.setstate((cls.RNG_VERSION, tuple(words),
+                               gauss_next if has_gauss else None))
+        stepper._done = (len(stepper._passed_cells) == 1
+                         and stepper.__is_stuck(entry))
+        return stepper
+
+    def __is_stuck(self, point: int) -> bool:
+        """
+        Whether no unvisited cell can be reached from ``point``.
+        """
+        visited = self._grid.get_visited()
+        fixed = self._grid.get_fixed()
+        for table in self._grid.get_neighbors():
+            adjacent = table[point]
+            if adjacent >= 0 and not visited[adjacent] and \
+                    not fixed[adjacent]:
+                return False
+        return True
@@ -0,0 +1,68 @@
+#!/bin/env python3
+
+# Other imports
+from array import array
+
+
+class DisjointSet:
+    """
+    Union-find over the integers ``0 .. size - 1``, stored in two flat
+    buffers: an ``array`` of parents and a ``bytearray`` of ranks.
+
+    Notes
+    -----
+    ``find`` halves the way to the root on every call and ``union`` hangs
+    the lower ranked root from the higher one, so any sequence of
+    operations runs in almost linear time.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._parents = array("i", range(size))
+        self._ranks = bytearray(size)
+        self._sets = size
+
+    def get_size(self) -> int:
+        return len(self._parents)
+
+    def get_sets(self) -> int:
+        """
+        Returns how many disjoint sets are left.
+        """
+        return self._sets
+
+    def find(self, item: int) -> int:
+        """
+        Returns the root of the set holding ``item``.
+        """
+        parents = self._parents
+        while parents[item] != item:
+            parents[item] = parents[parents[item]]
+            item = parents[item]
+        return item
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Joins the sets holding ``a`` and ``b``.
+
+        Returns
+        -------
+        joined: bool
+            ``False`` if both were already in the same set.
+        """
+        parents = self._parents
+        while parents[a] != a:
+            parents[a] = parents[parents[a]]
+            a = parents[a]
+        while parents[b] != b:
+            parents[b] = parents[parents[b]]
+            b = parents[b]
+        if a == b:
+            return False
+        ranks = self._ranks
+        if ranks[a] < ranks[b]:
+            a, b = b, a
+        parents[b] = a
+        if ranks[a] == ranks[b]:
+            ranks[a] += 1
+        self._sets -= 1
+        return True
@@ -3,6 +3,10 @@
 from .gen_types import Coords
 from .maze import Maze
 
+# Other imports
+from math import ceil
+from typing import Optional
+
 
 class FtLogoCells():
 
@@ -70,6 +74,29 @@ class FtLogoCells():
                                       block_origin_y + offset_y))
         return tuple(scaled_cells)
 
+    @classmethod
+    def logo_cells(cls, maze_width: int, maze_height: int,
+                   scale_logo: bool = False) -> Optional[tuple[Coords, ...]]:
+        """
+        Returns the coordinates of the 42 logo cells, centered in a maze of
+        the given size, or ``None`` if the maze is too small for it.
+
+        Parameters
+        ----------
+        maze_width, maze_height: int
+            Size of the maze.
+        scale_logo: bool
+            Whether the logo is scaled with ``choose_logo_scale`` or kept
+            at its default size.
+        """
+        scale = cls.choose_logo_scale(maze_width, maze_height)
+        if scale == 0:
+            return None
+        ft_logo = cls.scale_logo(scale if scale_logo else 1)
+        center_point = (ceil(maze_width / 2), ceil(maze_height / 2))
+        return tuple((center_point[0] + x, center_point[1] + y)
+                     for x, y in ft_logo)
+
     @classmethod
     def choose_logo_scale(cls, maze_width: int, maze_height: int) -> int:
         """
@@ -1,11 +1,15 @@
+from array import array
+from collections.abc import Mapping
 from typing import TypeAlias, Union
 
 # Alias
 
 # Maze and Cells
 Coords: TypeAlias = tuple[int, int]
-Cell: TypeAlias = dict[str, Union[int, bool]]
+Cell: TypeAlias = Mapping[str, Union[int, bool]]
 Pathway: TypeAlias = list[Coords]
+NeighborTable: TypeAlias = tuple[array, array, array, array]
+ByteBuffer: TypeAlias = Union[bytes, bytearray, memoryview]
 
 # Config
-Config_Value: TypeAlias = Union[int, str, tuple[Coords, ...], bool]
+Config_Value: TypeAlias = Union[int, float, str, tuple[Coords, ...], bool]
@@ -2,19 +2,94 @@
 
 # Main imports
 from .maze import Maze
-from .gen_types import Coords, Cell, Pathway
+from .cell_grid import CellGrid
+from .gen_types import Coords, Pathway
 from .exceptions import MazeError
-from .predefined import POSSIBLE_DIRECTIONS, OPPOSITE_DIRECTIONS
+from .dfs_stepper import DfsStepper
+from .predefined import (DIRECTION_ORDERS, DFS, ELLER, BINARY_TREE,
+                         SIDEWINDER, KRUSKAL, WILSON, TILED)
 
 # Other imports
-from random import shuffle
+from array import array
+from collections.abc import Iterable, Iterator
+from random import Random
+from typing import Any, Optional
 
 
 class Generator:
 
+    # Chance of joining two cells of different sets in Eller's algorithm
+    ELLER_MERGE_CHANCE = 1 / 2
+
+    # Whether Kruskal's algorithm picks its walls with ``spanning_walls``
+    # instead of the union-find loop. Both open the same walls, the first
+    # about twice as fast on big mazes but with a few more arrays in memory
+    KRUSKAL_BORUVKA = False
+
+    @classmethod
+    def generate(cls, maze: Maze) -> tuple[CellGrid, Pathway, list[str]]:
+        """
+        Generates the cells of the given maze with the algorithm it was
+        configured with (see ``Maze.get_algorithm``).
+
+        Raises
+        ------
+        MazeError
+            If the algorithm is unknown or the maze can't be generated.
+        """
+        algorithm = maze.get_algorithm()
+        if algorithm == DFS:
+            return cls.dfs_generation(maze)
+        if algorithm == ELLER:
+            return cls.eller_generation(maze)
+        if algorithm == KRUSKAL:
+            return cls.kruskal_generation(maze)
+        if algorithm == WILSON:
+            return cls.wilson_generation(maze)
+        if algorithm == TILED:
+            from .tiled_generator import TiledGenerator
+
+            return TiledGenerator.tiled_generation(maze)
+        if algorithm in (BINARY_TREE, SIDEWINDER):
+            from .vectorized_generator import VectorizedGenerator
+
+            if algorithm == BINARY_TREE:
+                return VectorizedGenerator.binary_tree_generation(maze)
+            return VectorizedGenerator.sidewinder_generation(maze)
+        raise MazeError(f"Unknown generation algorithm '{algorithm}'!")
+
+    @classmethod
+    def init_grid(cls, maze: Maze) -> CellGrid:
+        """
+        Creates the ``CellGrid`` of the given maze with every wall closed
+        and the 42 logo cells marked as fixed.
+
+        Raises
+        ------
+        MazeError
+            If the entry or the exit are placed in a fixed cell.
+        """
+        grid = CellGrid(maze.get_width(), maze.get_height())
+        fixed = grid.get_fixed()
+
+        # Stablishing fixed cells
+        if maze.get_ft_logo():
+            ft_logo_cells = maze.get_ft_logo_cells()
+            if ft_logo_cells:
+                for cell in ft_logo_cells:
+                    fixed[grid.index(cell)] = True
+            del ft_logo_cells
+
+        # Checking if entry or exit are in the logo
+        if fixed[grid.index(maze.get_entry())]:
+            raise MazeError("ENTRY point is in a protected cell!")
+        if fixed[grid.index(maze.get_exit())]:
+            raise MazeError("EXIT point is in a protected cell!")
+        return grid
+
     @classmethod
     def dfs_generation(cls, maze: Maze) -> tuple[
-                dict[Coords, Cell], Pathway, list[str]]:
+                CellGrid, Pathway, list[str]]:
         """
         Generate a perfect maze using a depth-first search (DFS) algorithm.
 
@@ -26,109 +101,773 @@ class Generator:
         ----------
         maze : Maze
             Maze configuration including dimensions, entry/exit points and
-            optional fixed cells.
+            optional fixed cells. Its random generator is used to pick
+            every direction.
 
         Returns
         -------
-        cells : dict[Coords, Cell_State]
-            Mapping of cell coordinates to their final state after generation.
-        exit_path : Pathway or None
-            Path from entry to exit if reachable, otherwise ``None``.
+        grid : CellGrid
+            Buffers with the final state of every cell after generation.
+        exit_path : Pathway
+            Path from entry to exit.
         directions_followed: list[str]
             List of every direction that was followed to reach the end.
 
+        Raises
+        ------
+        MazeError
+            If the exit can't be reached from the entry.
+
         Notes
         -----
         This implementation uses an iterative DFS with backtracking and random
-        neighbor selection to ensure maze randomness.
+        neighbor selection to ensure maze randomness. Neighbors are read from
+        the ``CellGrid`` neighbor table and the backtracking stack is an
+        ``array`` of cell indices, so the main loop doesn't allocate. The
+        loop lives in ``DfsStepper``, which ``iter_steps`` also uses to
+        carve the same maze in pausable steps.
 
         References
         ----------
         https://en.wikipedia.org/wiki/Maze_generation_algorithm#Depth-first_search
 
         """
-        # Initializing variables
-        width = maze.get_width()
-        height = maze.get_height()
-        ft_logo = maze.get_ft_logo()
-        entry = maze.get_entry()
-        exit = maze.get_exit()
+        stepper = cls.dfs_stepper(maze, maze.get_rng())
+        stepper.run()
+        return stepper.result()
 
-        # Initializing cells
-        cells: dict[Coords, Cell] = {}
-        for x in range(1, width + 1):
-            for y in range(1, height + 1):
-                cells[(x, y)] = {"state": 0b1111, "visited": False,
-                                 "fixed": False}
+    @classmethod
+    def dfs_stepper(cls, maze: Maze, rng: Random,
+                    batch_size: int = DfsStepper.DEFAULT_BATCH_SIZE
+                    ) -> DfsStepper:
+        """
+        Returns a ``DfsStepper`` that hasn't carved anything yet, for the
+        given maze configuration and random generator.
+        """
+        grid = cls.init_grid(maze)
+        return DfsStepper(grid, grid.index(maze.get_entry()),
+                          grid.index(maze.get_exit()), rng, batch_size)
 
-        # Stablishing fixed cells
-        if ft_logo:
-            ft_logo_cells = maze.get_ft_logo_cells()
-            if ft_logo_cells:
-                for cell in ft_logo_cells:
-                    cells[cell]["fixed"] = True
-            del ft_logo_cells
+    @classmethod
+    def iter_steps(cls, maze: Maze,
+                   batch_size: int = DfsStepper.DEFAULT_BATCH_SIZE,
+                   state: Optional[bytes] = None) -> DfsStepper:
+        """
+        Generates the cells of a maze step by step with the DFS of
+        ``dfs_generation``, to show the generation or to spread it over
+        time.
 
-        # Checking if entry or exit are in the logo
-        if cells[entry]["fixed"]:
-            raise MazeError("ENTRY point is in a protected cell!")
-        if cells[exit]["fixed"]:
-            raise MazeError("EXIT point is in a protected cell!")
+        Parameters
+        ----------
+        maze : Maze
+            Maze configuration. The random generator is a new one with its
+            seed, so once finished the cells are the same as the ones the
+            maze was generated with.
+        batch_size : int
+            Most carved passages yielded at once.
+        state : Optional[bytes]
+            State returned by ``DfsStepper.save`` to resume from. The
+            configuration of ``maze`` is then ignored.
+
+        Returns
+        -------
+        stepper : DfsStepper
+            Iterator of lists of carved passages, as pairs of ``Coords``.
+            ``result`` returns the same as ``dfs_generation`` when it is
+            exhausted.
+
+        Raises
+        ------
+        MazeError
+            If the batch size is lower than 1 or the state is not valid.
+
+        Examples
+        --------
+        >>> stepper = Generator.iter_steps(maze, batch_size=64)
+        >>> first = next(stepper)
+        >>> saved = stepper.save()
+        >>> for batch in Generator.iter_steps(maze, state=saved):
+        ...     draw(batch)
+        """
+        if state is None:
+            return cls.dfs_stepper(maze, Random(maze.get_seed()), batch_size)
+        stepper = DfsStepper.load(state)
+        stepper.set_batch_size(batch_size)
+        return stepper
+
+    @classmethod
+    def dfs_forest(cls, grid: CellGrid, rng: Random) -> tuple[array, int]:
+        """
+        Carves a perfect maze, with the same DFS as ``dfs_generation``, in
+        every group of connected free cells of the grid.
+
+        Parameters
+        ----------
+        grid : CellGrid
+            Grid with every wall closed and its fixed cells marked. Its
+            walls and visited buffers are filled in place.
+        rng : Random
+            Random generator used to pick every direction.
+
+        Returns
+        -------
+        labels : array
+            Flat ``array`` with the group of every cell, numbered from 0 in
+            row-major order of their first cell, or ``CellGrid.NO_NEIGHBOR``
+            for fixed cells.
+        groups : int
+            How many groups were found.
+
+        Notes
+        -----
+        The order of the directions is drawn inline, with the same calls
+        to ``getrandbits`` as ``rng.choice(DIRECTION_ORDERS)`` does, so
+        the maze is the same without the cost of a call per cell.
+        """
+        walls = grid.get_walls()
+        visited = grid.get_visited()
+        fixed = grid.get_fixed()
+        neighbors = grid.get_neighbors()
+        bits = CellGrid.WALL_BITS
+        op_bits = CellGrid.OPPOSITE_WALL_BITS
+        getrandbits = rng.getrandbits
+        orders = len(DIRECTION_ORDERS)
+        order_bits = orders.bit_length()
+
+        labels = array("i", [CellGrid.NO_NEIGHBOR]) * grid.get_size()
+        groups = 0
+        passed_cells = array("i")
+        for start in range(grid.get_size()):
+            if visited[start] or fixed[start]:
+                continue
+            visited[start] = True
+            labels[start] = groups
+            passed_cells.append(start)
+            point = start
+            while passed_cells:
+                order = getrandbits(order_bits)
+                while order >= orders:
+                    order = getrandbits(order_bits)
+                for dir in DIRECTION_ORDERS[order]:
+                    adjacent = neighbors[dir][point]
+                    if adjacent < 0 or visited[adjacent] or fixed[adjacent]:
+                        continue
+                    walls[point] -= bits[dir]
+                    walls[adjacent] -= op_bits[dir]
+                    visited[adjacent] = True
+                    labels[adjacent] = groups
+                    point = adjacent
+                    passed_cells.append(point)
+                    break
+                else:
+                    passed_cells.pop()
+                    if passed_cells:
+                        point = passed_cells[-1]
+            groups += 1
+        return (labels, groups)
+
+    @classmethod
+    def spanning_walls(cls, first: Any, second: Any, nodes: int,
+                       to_join: int) -> Any:
+        """
+        Picks the walls Kruskal's algorithm would open going through them
+        in order: every wall joining two nodes that are not connected yet.
+
+        Parameters
+        ----------
+        first, second : numpy.ndarray
+            Nodes, from 0 to ``nodes - 1``, at both sides of every wall,
+            in the order the walls are visited.
+        nodes : int
+            How many nodes there are.
+        to_join : int
+            Walls to open before stopping, ``nodes - 1`` when they can all
+            be connected.
+
+        Returns
+        -------
+        opened : numpy.ndarray
+            Boolean array with the walls to open.
+
+        Notes
+        -----
+        Opening the walls in order is building the minimum spanning tree
+        of the nodes, weighing every wall by its position. All the weights
+        are different, so that tree is unique and Boruvka's algorithm
+        finds the same one with whole-array rounds instead of a union-find
+        call per wall: every group of connected nodes opens its lightest
+        wall towards another group, and the groups joined are merged by
+        pointer jumping. Every round at least halves the number of
+        groups, so there are ``O(log n)`` rounds of ``O(n)`` work, and
+        they stop as soon as ``to_join`` walls are opened.
+
+        References
+        ----------
+        https://en.wikipedia.org/wiki/Bor%C5%AFvka%27s_algorithm
+        """
+        import numpy as np
+
+        # ``groups`` holds the group of every node and ``left`` the walls,
+        # by position, still between two groups
+        groups = np.arange(nodes)
+        left = np.arange(len(first))
+        opened = np.zeros(len(first), dtype=np.bool_)
+        joined = 0
+        while joined < to_join:
+            a = groups[first[left]]
+            b = groups[second[left]]
+            apart = a != b
+            left, a, b = left[apart], a[apart], b[apart]
+            if not len(left):
+                break
+
+            # Lightest wall of every group
+            lightest = np.full(nodes, len(first))
+            np.minimum.at(lightest, a, left)
+            np.minimum.at(lightest, b, left)
+            from_a = lightest[a] == left
+            from_b = lightest[b] == left
+            chosen = from_a | from_b
+            opened[left[chosen]] = True
+            joined += int(chosen.sum())
+
+            # Hanging every group from the one its wall leads to. Two groups
+            # choosing the same wall point to each other, the lowest one is
+            # kept as root
+            parents = np.arange(nodes)
+            parents[a[from_a]] = b[from_a]
+            parents[b[from_b]] = a[from_b]
+            indices = np.arange(nodes)
+            mutual = (parents[parents] == indices) & (indices < parents)
+            parents[mutual] = indices[mutual]
+            while True:
+                grandparents = parents[parents]
+                if np.array_equal(grandparents, parents):
+                    break
+                parents = grandparents
+            groups = parents[groups]
+        return opened
+
+    # KRUSKAL'S ALGORITHM -----------------------------------------------------
+    @classmethod
+    def kruskal_generation(cls, maze: Maze,
+                           boruvka: Optional[bool] = None) -> tuple[
+                CellGrid, Pathway, list[str]]:
+        """
+        Generate a perfect maze with Kruskal's algorithm: walls are visited
+        in random order and opened whenever the cells at both sides are
+        not connected yet.
+
+        Parameters
+        ----------
+        maze : Maze
+            Maze configuration, its random generator shuffles the walls.
+        boruvka : Optional[bool]
+            Whether to pick the walls with ``spanning_walls`` instead of
+            visiting them one by one. ``None`` uses ``KRUSKAL_BORUVKA``.
+            The maze is the same either way.
+
+        Returns
+        -------
+        The same as ``dfs_generation``, the pathway being the only path
+        from the entry to the exit, found with a breadth-first search
+        afterwards (or ``PathFinder.grid_dead_end_solution`` with
+        ``boruvka``).
+
+        Raises
+        ------
+        MazeError
+            If the exit can't be reached from the entry.
+
+        Notes
+        -----
+        Every wall is an integer: ``2 * i`` is the east wall of the cell
+        ``i`` and ``2 * i + 1`` its south wall. The walls between free
+        cells are ordered with a single ``numpy`` permutation, seeded from
+        the maze random generator, and the connected cells are kept in a
+        ``DisjointSet``, so there is no stack and the cost is almost
+        linear. The loop stops as soon as every free cell is connected.
+
+        ``spanning_walls`` opens the same walls with whole-array rounds
+        instead of a union-find call per wall.
+
+        References
+        ----------
+        https://en.wikipedia.org/wiki/Maze_generation_algorithm#Iterative_randomized_Kruskal's_algorithm_(with_sets)
+        """
+        from .disjoint_set import DisjointSet
+        from .pathfinder import PathFinder
+        import numpy as np
+
+        if boruvka is None:
+            boruvka = cls.KRUSKAL_BORUVKA
+        grid = cls.init_grid(maze)
+        width = grid.get_width()
+        size = grid.get_size()
+        walls = grid.get_walls()
+        fixed = grid.get_fixed()
+        north, east, south, west = CellGrid.WALL_BITS
+
+        # Walls between two free cells, in random order
+        free = np.frombuffer(fixed, dtype=np.uint8).reshape(-1, width) == 0
+        candidates = np.zeros((free.shape[0], width, 2), dtype=bool)
+        candidates[:, :-1, 0] = free[:, :-1] & free[:, 1:]
+        candidates[:-1, :, 1] = free[:-1] & free[1:]
+        order = np.random.default_rng(maze.get_rng().getrandbits(64)
+                                      ).permutation(
+                                          np.flatnonzero(candidates))
+        to_join = int(free.sum()) - 1
+
+        if boruvka:
+            points = order >> 1
+            is_south = (order & 1).astype(np.bool_)
+            adjacents = points + np.where(is_south, width, 1)
+            opened = cls.spanning_walls(points, adjacents, size, to_join)
+
+            # Every wall is opened once, so no cell is written twice per
+            # side
+            cells = np.frombuffer(walls, dtype=np.uint8)
+            for side, bit, op_bit in ((False, east, west),
+                                      (True, south, north)):
+                selected = opened & (is_south == side)
+                cells[points[selected]] -= bit
+                cells[adjacents[selected]] -= op_bit
+        else:
+            sets = DisjointSet(size)
+            union = sets.union
+            for wall in order.tolist():
+                if to_join <= 0:
+                    break
+                point = wall >> 1
+                is_south = wall & 1
+                adjacent = point + width if is_south else point + 1
+                if not union(point, adjacent):
+                    continue
+                if is_south:
+                    walls[point] -= south
+                    walls[adjacent] -= north
+                else:
+                    walls[point] -= east
+                    walls[adjacent] -= west
+                to_join -= 1
+        grid.get_visited()[:] = fixed.translate(
+            bytes.maketrans(b"\x00\x01", b"\x01\x00"))
+
+        if boruvka:
+            # The maze is a tree, so filling its dead ends leaves the pathway
+            pathway = PathFinder.grid_dead_end_solution(
+                grid, maze.get_entry(), maze.get_exit())
+        else:
+            pathway = PathFinder.grid_shortest_path(grid, maze.get_entry(),
+                                                    maze.get_exit())
+        if pathway is None:
+            raise MazeError("EXIT point can't be reached from ENTRY point!")
+        return (grid, pathway, PathFinder.directions_of(pathway))
+
+    # WILSON'S ALGORITHM ------------------------------------------------------
+    @classmethod
+    def wilson_generation(cls, maze: Maze) -> tuple[
+                CellGrid, Pathway, list[str]]:
+        """
+        Generate a perfect maze with Wilson's algorithm, which picks it
+        uniformly among every possible perfect maze of the free cells.
+
+        Starting from a tree with only the entry, every cell not in the
+        tree yet does a random walk until it hits the tree, and the walk,
+        with its loops erased, is added to the tree.
+
+        Parameters
+        ----------
+        maze : Maze
+            Maze configuration, its random generator drives the walks.
+
+        Returns
+        -------
+        The same as ``dfs_generation``, the pathway being the shortest
+        path from the entry to the exit, found with a breadth-first search
+        afterwards.
+
+        Raises
+        ------
+        MazeError
+            If the exit can't be reached from the entry.
+
+        Notes
+        -----
+        Only the free cells reachable from the entry take part, the rest
+        are left closed, like ``dfs_generation`` does. The walk only keeps
+        the last direction taken from every cell, in a ``bytearray``, so
+        going back over the walk from its start follows it with its loops
+        already erased, and no memory is allocated per step.
+
+        The first walks are long, since the tree is small and hard to
+        hit, and how long depends a lot on the seed: at 1000x1000 the
+        median over six seeds took about 1.3 times ``dfs_generation`` and
+        the slowest one about 5.4 times. ``benchmarks/bench_wilson.py``
+        reports the median and the slowest seed against
+        ``dfs_generation``.
+
+        References
+        ----------
+        https://en.wikipedia.org/wiki/Loop-erased_random_walk#Uniform_spanning_tree
+        """
+        from .pathfinder import PathFinder
+
+        grid = cls.init_grid(maze)
+        size = grid.get_size()
+        walls = grid.get_walls()
+        fixed = grid.get_fixed()
+        neighbors = grid.get_neighbors()
+        bits = CellGrid.WALL_BITS
+        op_bits = CellGrid.OPPOSITE_WALL_BITS
+        random_direction = maze.get_rng().getrandbits
+
+        # Free cells reachable from the entry, they are marked as visited
+        # once they are part of the tree
+        entry_i = grid.index(maze.get_entry())
+        region = bytearray(size)
+        region[entry_i] = True
+        pending = array("i", [entry_i])
+        while pending:
+            point = pending.pop()
+            for table in neighbors:
+                adjacent = table[point]
+                if (adjacent >= 0 and not region[adjacent]
+                        and not fixed[adjacent]):
+                    region[adjacent] = True
+                    pending.append(adjacent)
+
+        in_tree = grid.get_visited()
+        in_tree[entry_i] = True
+        next_dir = bytearray(size)
+        for start in range(size):
+            if in_tree[start] or not region[start]:
+                continue
+
+            # Random walk until the tree is hit
+            point = start
+            while not in_tree[point]:
+                dir = random_direction(2)
+                adjacent = neighbors[dir][point]
+                if adjacent < 0 or fixed[adjacent]:
+                    continue
+                next_dir[point] = dir
+                point = adjacent
+
+            # Adding the loop-erased walk to the tree
+            point = start
+            while not in_tree[point]:
+                dir = next_dir[point]
+                adjacent = neighbors[dir][point]
+                walls[point] -= bits[dir]
+                walls[adjacent] -= op_bits[dir]
+                in_tree[point] = True
+                point = adjacent
+
+        pathway = PathFinder.grid_shortest_path(grid, maze.get_entry(),
+                                                maze.get_exit())
+        if pathway is None:
+            raise MazeError("EXIT point can't be reached from ENTRY point!")
+        return (grid, pathway, PathFinder.directions_of(pathway))
+
+    # ELLER'S ALGORITHM -------------------------------------------------------
+    @classmethod
+    def eller_generation(cls, maze: Maze) -> tuple[
+                CellGrid, Pathway, list[str]]:
+        """
+        Generate a perfect maze with Eller's algorithm, see ``eller_rows``.
+
+        The rows are stored in a ``CellGrid`` and the pathway is the
+        shortest path from the entry to the exit, found with a
+        breadth-first search afterwards.
+
+        Returns
+        -------
+        The same as ``dfs_generation``.
+
+        Raises
+        ------
+        MazeError
+            If the exit can't be reached from the entry.
+        """
+        from .pathfinder import PathFinder
+
+        grid = cls.init_grid(maze)
+        width = grid.get_width()
+        walls = grid.get_walls()
+        fixed_cells = ((maze.get_ft_logo_cells() or ())
+                       if maze.get_ft_logo() else ())
+        rows = cls.eller_rows(width, grid.get_height(),
+                              maze.get_entry(), maze.get_exit(),
+                              fixed_cells, maze.get_rng())
+        for y, row in enumerate(rows):
+            walls[y * width:(y + 1) * width] = row
+        grid.get_visited()[:] = grid.get_fixed().translate(
+            bytes.maketrans(b"\x00\x01", b"\x01\x00"))
+
+        pathway = PathFinder.grid_shortest_path(grid, maze.get_entry(),
+                                                maze.get_exit())
+        if pathway is None:
+            raise MazeError("EXIT point can't be reached from ENTRY point!")
+        return (grid, pathway, PathFinder.directions_of(pathway))
+
+    @classmethod
+    def eller_rows(cls, width: int, height: int,
+                   entry: Coords, exit: Coords,
+                   fixed_cells: Iterable[Coords], rng: Random,
+                   perfect: bool = True,
+                   opening_density: float = (
+                       Maze.DEFAULT_WALL_OPENING_DENSITY)
+                   ) -> Iterator[bytearray]:
+        """
+        Generates a maze with Eller's algorithm, one row at a time.
+
+        Parameters
+        ----------
+        width, height : int
+            Size of the maze.
+        entry, exit : Coords
+            Entry and exit points, only checked to be valid cells since
+            every free cell ends up connected.
+        fixed_cells : Iterable[Coords]
+            Cells that must be left closed, like the 42 logo ones.
+        rng : Random
+            Random generator used for every decision.
+        perfect : bool
+            If ``False``, walls between free cells are also opened as every
+            row is finished.
+        opening_density : float
+            Chance of opening every closed wall between free cells when the
+            maze is not perfect, see ``Maze.get_wall_opening_density``.
+
+        Returns
+        -------
+        rows : Iterator[bytearray]
+            The wall state of every cell of each row, from top to bottom,
+            ready to be written with ``MazeIO.write_hex_rows``.
+
+        Raises
+        ------
+        MazeError
+            If the entry or the exit are outside of the maze, in the same
+            cell or in a fixed cell. Checked when this method is called,
+            before any row is generated.
+
+        Notes
+        -----
+        Only the set of every cell of the current row is kept, in a small
+        union-find that is renumbered on every row, so memory doesn't grow
+        with ``height``. The fixed cells are kept by row and, on the rows
+        around them, every cell knows whether a path going only down or
+        sideways can still reach the last row. Every set is sent down
+        through one of those cells, or merged with a neighbor set of its
+        row if it can't, so fixed cells don't split the maze as long as
+        every free cell can reach the last row without going up, which is
+        the case of the 42 logo.
+
+        References
+        ----------
+        http://www.neocomputer.org/projects/eller.html
+        """
+        for name, point in (("ENTRY", entry), ("EXIT", exit)):
+            if not (1 <= point[0] <= width and 1 <= point[1] <= height):
+                raise MazeError(f"{name} point is not inside the maze!")
+        if entry == exit:
+            raise MazeError("ENTRY point and EXIT point are in the same cell!")
+
+        fixed_rows: dict[int, bytearray] = {}
+        for x, y in fixed_cells:
+            if 1 <= x <= width and 1 <= y <= height:
+                fixed_rows.setdefault(y, bytearray(width))[x - 1] = True
+        for name, point in (("ENTRY", entry), ("EXIT", exit)):
+            if fixed_rows.get(point[1], b"\x00" * width)[point[0] - 1]:
+                raise MazeError(f"{name} point is in a protected cell!")
+
+        return cls.__eller_rows(width, height, fixed_rows,
+                                cls.__viable_rows(width, height, fixed_rows),
+                                rng, perfect, opening_density)
+
+    @classmethod
+    def __viable_rows(cls, width: int, height: int,
+                      fixed_rows: dict[int, bytearray]
+                      ) -> dict[int, bytearray]:
+        """
+        Marks, on the rows from the one above the first fixed cell down to
+        the last fixed cell, which free cells can reach the last row moving
+        only down or sideways. Rows outside of the returned ones are
+        viable everywhere.
+        """
+        viable_rows: dict[int, bytearray] = {}
+        if not fixed_rows:
+            return viable_rows
+        no_fixed = bytes(width)
+        below: Optional[bytearray] = None
+        for y in range(max(fixed_rows), max(min(fixed_rows) - 1, 1) - 1, -1):
+            fixed = fixed_rows.get(y, no_fixed)
+            fixed_below = fixed_rows.get(y + 1, no_fixed)
+            row = bytearray(width)
+            start = 0
+            while start < width:
+                if fixed[start]:
+                    start += 1
+                    continue
+                # Every cell of a run of free cells is viable if one is
+                end = start
+                viable = y == height
+                while end < width and not fixed[end]:
+                    if (not fixed_below[end]
+                            and (below is None or below[end])):
+                        viable = True
+                    end += 1
+                if viable:
+                    row[start:end] = b"\x01" * (end - start)
+                start = end
+            viable_rows[y] = row
+            below = row
+        return viable_rows
+
+    @classmethod
+    def __eller_rows(cls, width: int, height: int,
+                     fixed_rows: dict[int, bytearray],
+                     viable_rows: dict[int, bytearray],
+                     rng: Random, perfect: bool,
+                     opening_density: float) -> Iterator[bytearray]:
+        north, east, south, west = CellGrid.WALL_BITS
+        closed_row = bytearray([CellGrid.CLOSED]) * width
+        no_fixed = bytes(width)
+        random = rng.random
+        merge_chance = cls.ELLER_MERGE_CHANCE
+        no_set = CellGrid.NO_NEIGHBOR
+
+        # Set of the cell above every cell of the current row, if they are
+        # joined, and whether the wall between them is open
+        above_sets = array("i", [no_set]) * width
+        north_open = bytearray(width)
+
+        for y in range(1, height + 1):
+            fixed = fixed_rows.get(y, no_fixed)
+            fixed_below = fixed_rows.get(y + 1, no_fixed)
+            viable_below = viable_rows.get(y + 1)
+            last = y == height
+            row = closed_row[:]
+
+            # Renumbering the sets, so they always fit in ``width`` slots
+            sets = array("i", [no_set]) * width
+            renamed = array("i", [no_set]) * width
+            count = 0
+            for i in range(width):
+                if fixed[i]:
+                    continue
+                if north_open[i]:
+                    row[i] -= north
+                above = above_sets[i]
+                if above >= 0:
+                    if renamed[above] < 0:
+                        renamed[above] = count
+                        count += 1
+                    sets[i] = renamed[above]
+                else:
+                    sets[i] = count
+                    count += 1
+            parent = array("i", range(count))
+
+            def find(i: int) -> int:
+                while parent[i] != i:
+                    parent[i] = parent[parent[i]]
+                    i = parent[i]
+                return i
+
+            # Randomly joining adjacent cells of different sets, or all of
+            # them on the last row
+            for i in range(width - 1):
+                if fixed[i] or fixed[i + 1]:
+                    continue
+                a = find(sets[i])
+                b = find(sets[i + 1])
+                if a != b and (last or random() < merge_chance):
+                    parent[b] = a
+                    row[i] -= east
+                    row[i + 1] -= west
+
+            above_sets = array("i", [no_set]) * width
+            north_open = bytearray(width)
+            if not last:
+                # Sets that can't go down must join one that can
+                can_go_down = bytearray(count)
+                for i in range(width):
+                    if (not fixed[i] and not fixed_below[i]
+                            and (viable_below is None or viable_below[i])):
+                        can_go_down[find(sets[i])] = True
+                for i in range(width - 1):
+                    if fixed[i] or fixed[i + 1]:
+                        continue
+                    a = find(sets[i])
+                    b = find(sets[i + 1])
+                    if a != b and not (can_go_down[a] and can_go_down[b]):
+                        parent[b] = a
+                        can_go_down[a] = can_go_down[a] or can_go_down[b]
+                        row[i] -= east
+                        row[i + 1] -= west
+
+                # Going down: randomly, but at least once per set through a
+                # viable cell and once per dead end run of the next row
+                went_down = bytearray(count)
+                candidates = array("i", [0]) * count
+                picked = array("i", [no_set]) * count
+                run_opened = False
+                run_candidates = 0
+                run_picked = no_set
+                for i in range(width):
+                    if fixed_below[i]:
+                        if run_candidates and not run_opened:
+                            row[run_picked] -= south
+                            above_sets[run_picked] = find(sets[run_picked])
+                            north_open[run_picked] = True
+                        run_opened = False
+                        run_candidates = 0
+                        continue
+                    if fixed[i]:
+                        continue
+                    group = find(sets[i])
+                    opened = random() < merge_chance
+                    if viable_below is None or viable_below[i]:
+                        candidates[group] += 1
+                        if random() * candidates[group] < 1:
+                            picked[group] = i
+                        went_down[group] = went_down[group] or opened
+                    else:
+                        run_candidates += 1
+                        if random() * run_candidates < 1:
+                            run_picked = i
+                        run_opened = run_opened or opened
+                    if opened:
+                        row[i] -= south
+                        above_sets[i] = group
+                        north_open[i] = True
+                if run_candidates and not run_opened:
+                    row[run_picked] -= south
+                    above_sets[run_picked] = find(sets[run_picked])
+                    north_open[run_picked] = True
+                for group in range(count):
+                    if candidates[group] and not went_down[group]:
+                        i = picked[group]
+                        row[i] -= south
+                        above_sets[i] = group
+                        north_open[i] = True
 
-        # Initializing other variables
-        point = entry
-        cells[point]["visited"] = True
-        directions = list(POSSIBLE_DIRECTIONS)
-        passed_cells: Pathway = [point]
-        directions_followed: list[str] = []
-        exit_path: Pathway
-        path_dir: list[str]
-        op = OPPOSITE_DIRECTIONS
-        adjacents = maze.get_adjacent_cells(point)
-        advanced = True
-
-        # Not being able to move any direction and being at the starting point
-        # will mean that we already checked every possible way
-        # print("Generating maze with dfs algorithm...")
-        while not (point == entry and not advanced):
-            advanced = False
-
-            # Randomizing directions order
-            shuffle(directions)
-
-            for dir in directions:
-                if adjacents[dir]:
-                    adjacent_cell = adjacents[dir]
-                    if adjacent_cell is None:
+            if not perfect:
+                # Extra openings, they don't change the sets
+                for i in range(width):
+                    if fixed[i]:
                         continue
-                    ad_cell_data = cells[adjacent_cell]  # adjacent cell data
-                    if (not ad_cell_data["visited"] and
-                            not ad_cell_data["fixed"]):
-                        # Changing current cell state
-                        cells[point]["state"] -= Maze.WALLS[dir]
-
-                        # Changing adjacent cell state
-                        ad_cell_data["state"] -= (
-                            Maze.WALLS[op[dir]])
-                        ad_cell_data["visited"] = True
-
-                        # Updating stuff
-                        point = adjacent_cell
-                        passed_cells.append(point)
-                        directions_followed.append(dir)
-                        if point == exit:
-                            exit_path = passed_cells.copy()
-                            path_dir = directions_followed.copy()
-
-                        # Recalcing adjacents
-                        adjacents = maze.get_adjacent_cells(point)
-
-                        advanced = True
-                        break
-            # Going backwards if point didn't advanced
-            if not advanced:
-                passed_cells.pop()
-                directions_followed.pop()
-                point = passed_cells[-1]
-                adjacents = maze.get_adjacent_cells(point)
-        return (cells, exit_path, path_dir)
+                    if (i + 1 < width and not fixed[i + 1]
+                            and row[i] & east
+                            and random() < opening_density):
+                        row[i] -= east
+                        row[i + 1] -= west
+                    if (not last and not fixed_below[i]
+                            and row[i] & south
+                            and random() < opening_density):
+                        row[i] -= south
+                        north_open[i] = True
+            yield row
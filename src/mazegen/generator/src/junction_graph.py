@@ -0,0 +1,379 @@
+#!/bin/env python3
+
+# Main imports
+from .cell_grid import CellGrid
+from .gen_types import Coords, Pathway
+from .exceptions import MazeError
+
+# Other imports
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from heapq import heappush, heappop
+from typing import Optional
+
+
+class JunctionGraph:
+    """
+    Graph of a maze with its corridors contracted: the nodes are the
+    junctions, the dead ends and the kept cells (usually the entry and
+    the exit), and every edge is a corridor between two of them.
+
+    Parameters
+    ----------
+    grid: CellGrid
+        Cells of the maze.
+    keep: Iterable[Coords]
+        Cells that must be nodes even if they are in a corridor.
+
+    Notes
+    -----
+    A corridor cell has exactly two open walls, so most cells of a maze
+    are not nodes and searches over this graph visit far fewer of them.
+    Every edge stores its length (steps from one node to the other) and
+    the cells between both nodes, all of them in a single flat ``array``
+    in order from the first node to the second one.
+
+    Every corridor is walked once when the graph is built, so building it
+    costs about the same as a breadth-first search over the whole maze.
+    It pays off when many paths are searched in the same maze.
+
+    The trees hanging from the rest of the graph are also peeled, leaf by
+    leaf, when it is built. A path only goes into one of them to reach a
+    cell inside it, so searches skip every peeled node that is not
+    between the ends of the path and the rest of the graph. In a perfect
+    maze every node is peeled and a search only follows those ways.
+    """
+
+    def __init__(self, grid: CellGrid, keep: Iterable[Coords] = ()) -> None:
+        width = grid.get_width()
+        size = grid.get_size()
+        walls = grid.get_walls()
+        fixed = grid.get_fixed()
+        moves = tuple(zip(CellGrid.WALL_BITS, grid.get_neighbors()))
+        open_walls = bytes(4 - bin(state & CellGrid.CLOSED).count("1")
+                           for state in range(256))
+
+        # Every free cell that is not in a corridor is a node
+        node_ids = array("i", [CellGrid.NO_NEIGHBOR]) * size
+        nodes = array("i")
+        for point in range(size):
+            if not fixed[point] and open_walls[walls[point]] != 2:
+                node_ids[point] = len(nodes)
+                nodes.append(point)
+        for coords in keep:
+            if not grid.contains(coords):
+                raise MazeError(f"{coords} is outside of the maze!")
+            point = grid.index(coords)
+            if node_ids[point] < 0 and not fixed[point]:
+                node_ids[point] = len(nodes)
+                nodes.append(point)
+
+        # Walking every corridor from one of its ends. ``slots`` holds the
+        # position of every corridor cell in ``cells``.
+        slots = array("i", [CellGrid.NO_NEIGHBOR]) * size
+        cells = array("i")
+        starts = array("i", [0])
+        firsts = array("i")
+        seconds = array("i")
+        adjacency: list[list[int]] = [[] for _ in nodes]
+        for first in nodes:
+            state = walls[first]
+            for bit, table in moves:
+                if state & bit:
+                    continue
+                point = table[first]
+                if point < 0:
+                    continue
+                if node_ids[point] >= 0:
+                    # Two adjacent nodes, only added from the lower one
+                    if point < first:
+                        continue
+                elif slots[point] >= 0:
+                    continue
+                previous = first
+                while node_ids[point] < 0:
+                    slots[point] = len(cells)
+                    cells.append(point)
+                    state_here = walls[point]
+                    for bit_here, table_here in moves:
+                        following = table_here[point]
+                        if not state_here & bit_here and \
+                                following != previous:
+                            break
+                    previous, point = point, following
+                edge = len(firsts)
+                firsts.append(node_ids[first])
+                seconds.append(node_ids[point])
+                starts.append(len(cells))
+                adjacency[node_ids[first]].append(edge)
+                adjacency[node_ids[point]].append(edge)
+
+        # Adjacency of every node as offsets into flat arrays with the edge,
+        # the node at its other side and its length
+        offsets = array("i", [0])
+        edges_of = array("i")
+        others = array("i")
+        lengths = array("i")
+        for node, node_edges in enumerate(adjacency):
+            for edge in node_edges:
+                edges_of.append(edge)
+                others.append(seconds[edge] if firsts[edge] == node
+                              else firsts[edge])
+                lengths.append(starts[edge + 1] - starts[edge] + 1)
+            offsets.append(len(edges_of))
+
+        # Peeling the trees that hang from the rest of the graph, leaf by
+        # leaf, keeping for every peeled node the one it hangs from
+        degrees = array("i", [offsets[node + 1] - offsets[node]
+                              for node in range(len(nodes))])
+        hangs_from = array("i", [CellGrid.NO_NEIGHBOR]) * len(nodes)
+        peeled = bytearray(len(nodes))
+        leaves = [node for node in range(len(nodes)) if degrees[node] == 1]
+        while leaves:
+            node = leaves.pop()
+            if peeled[node]:
+                continue
+            peeled[node] = True
+            for position in range(offsets[node], offsets[node + 1]):
+                other = others[position]
+                if not peeled[other]:
+                    hangs_from[node] = other
+                    degrees[other] -= 1
+                    if degrees[other] == 1:
+                        leaves.append(other)
+
+        self._grid = grid
+        self._width = width
+        self._node_ids = node_ids
+        self._nodes = nodes
+        self._slots = slots
+        self._cells = cells
+        self._starts = starts
+        self._firsts = firsts
+        self._seconds = seconds
+        self._offsets = offsets
+        self._edges_of = edges_of
+        self._others = others
+        self._lengths = lengths
+        self._peeled = peeled
+        self._hangs_from = hangs_from
+        self._xs = array("i", [point % width for point in nodes])
+        self._ys = array("i", [point // width for point in nodes])
+
+    def get_grid(self) -> CellGrid:
+        return self._grid
+
+    def get_node_count(self) -> int:
+        return len(self._nodes)
+
+    def get_edge_count(self) -> int:
+        return len(self._firsts)
+
+    def nodes(self) -> Iterator[Coords]:
+        coords = self._grid.coords
+        return (coords(point) for point in self._nodes)
+
+    def edges(self) -> Iterator[tuple[Coords, Coords, int]]:
+        """
+        Yields every corridor as its two nodes and its length.
+        """
+        coords = self._grid.coords
+        nodes = self._nodes
+        for edge in range(len(self._firsts)):
+            yield (coords(nodes[self._firsts[edge]]),
+                   coords(nodes[self._seconds[edge]]),
+                   self.__length(edge))
+
+    def edge_cells(self, edge: int) -> Pathway:
+        """
+        Returns every cell of a corridor, both nodes included.
+        """
+        if not 0 <= edge < len(self._firsts):
+            raise MazeError(f"Edge {edge} is not in the graph!")
+        return [self._grid.coords(point)
+                for point in self.__walk(edge, True)]
+
+    # SEARCH ------------------------------------------------------------------
+    def shortest_path(self, src: Coords, dst: Coords) -> Optional[Pathway]:
+        """
+        Returns a shortest path between two cells, both included, or
+        ``None`` if they are not connected.
+
+        Notes
+        -----
+        The search is an A* over the nodes, with corridor lengths as costs
+        and the Manhattan distance to ``dst`` as heuristic, which never
+        overestimates. Cells in the middle of a corridor start or end the
+        search at both of its nodes. The nodes found are then expanded
+        back into every cell with the cells stored in their edges.
+        """
+        grid = self._grid
+        if not grid.contains(src) or not grid.contains(dst):
+            raise MazeError("Path endpoints must be inside the maze!")
+        start = grid.index(src)
+        goal = grid.index(dst)
+        if start == goal:
+            return [src]
+        node_ids = self._node_ids
+        slots = self._slots
+        if (node_ids[start] < 0 and slots[start] < 0) or \
+                (node_ids[goal] < 0 and slots[goal] < 0):
+            # Cells of a loop without any node, never reached from one
+            from .pathfinder import PathFinder
+            return PathFinder.grid_shortest_path(grid, src, dst)
+
+        firsts = self._firsts
+        seconds = self._seconds
+        offsets = self._offsets
+        edges_of = self._edges_of
+        others = self._others
+        lengths = self._lengths
+        peeled = self._peeled
+        xs = self._xs
+        ys = self._ys
+        goal_x, goal_y = goal % self._width, goal // self._width
+
+        # Ways into the graph from ``src`` and out of it to ``dst``, as
+        # (node, steps between the node and the cell, edge or -1)
+        entries = self.__ends(start)
+        exits: dict[int, tuple[int, int]] = {}
+        for node, steps, edge in self.__ends(goal):
+            if node not in exits or steps < exits[node][0]:
+                exits[node] = (steps, edge)
+
+        # Peeled nodes can only be in the way between the ends and the rest
+        # of the graph
+        allowed: set[int] = set()
+        for node in [node for node, _, _ in entries] + list(exits):
+            while node >= 0 and peeled[node] and node not in allowed:
+                allowed.add(node)
+                node = self._hangs_from[node]
+
+        # Both in the same corridor: walking straight along it
+        best = -1
+        best_node = CellGrid.NO_NEIGHBOR
+        if slots[start] >= 0 and slots[goal] >= 0:
+            edge = self.__edge_of(slots[start])
+            if edge == self.__edge_of(slots[goal]):
+                best = abs(slots[start] - slots[goal])
+
+        # Costs and the edge every node was reached through, -1 for the
+        # ones reached from ``src`` directly. Heap items are the estimated
+        # length of the whole path in the high bits and the node in the
+        # low ones.
+        costs = array("i", [CellGrid.NO_NEIGHBOR]) * len(self._nodes)
+        parents = array("i", [CellGrid.NO_NEIGHBOR]) * len(self._nodes)
+        heap: list[int] = []
+        for node, steps, edge in entries:
+            if costs[node] < 0 or steps < costs[node]:
+                costs[node] = steps
+                heappush(heap, (steps + abs(xs[node] - goal_x)
+                                + abs(ys[node] - goal_y)) << 32 | node)
+        while heap:
+            item = heappop(heap)
+            node = item & 0xFFFFFFFF
+            estimate = item >> 32
+            if best >= 0 and estimate >= best:
+                break
+            cost = costs[node]
+            if estimate > cost + abs(xs[node] - goal_x) + abs(
+                    ys[node] - goal_y):
+                continue
+            exit = exits.get(node)
+            if exit is not None and (best < 0 or cost + exit[0] < best):
+                best = cost + exit[0]
+                best_node = node
+            for position in range(offsets[node], offsets[node + 1]):
+                other = others[position]
+                other_cost = cost + lengths[position]
+                if costs[other] >= 0 and other_cost >= costs[other]:
+                    continue
+                if peeled[other] and other not in allowed:
+                    continue
+                costs[other] = other_cost
+                parents[other] = edges_of[position]
+                heappush(heap, (other_cost + abs(xs[other] - goal_x)
+                                + abs(ys[other] - goal_y)) << 32 | other)
+
+        if best < 0:
+            return None
+        if best_node < 0:
+            # Straight along the corridor
+            low, high = sorted((slots[start], slots[goal]))
+            points = list(self._cells[low:high + 1])
+            if slots[start] > slots[goal]:
+                points.reverse()
+            return [grid.coords(point) for point in points]
+
+        # Nodes from ``dst`` back to ``src``, expanded corridor by corridor
+        tail = self.__to_cell(best_node, exits[best_node][1], goal)
+        middle: list[int] = []
+        node = best_node
+        while parents[node] >= 0:
+            edge = parents[node]
+            forward = seconds[edge] == node
+            previous = firsts[edge] if forward else seconds[edge]
+            walk = self.__walk(edge, forward)
+            middle[:0] = walk[:-1]
+            node = previous
+        head = self.__to_cell(node, self.__entry_edge(entries, node),
+                              start)
+        head.reverse()
+        points = head[:-1] + middle + tail
+        return [grid.coords(point) for point in points]
+
+    def __length(self, edge: int) -> int:
+        return self._starts[edge + 1] - self._starts[edge] + 1
+
+    def __edge_of(self, slot: int) -> int:
+        return bisect_right(self._starts, slot) - 1
+
+    def __walk(self, edge: int, forward: bool) -> list[int]:
+        """
+        Returns the cells of a corridor, both nodes included, from its
+        first node if ``forward`` or from the second one if not.
+        """
+        points = [self._nodes[self._firsts[edge]]]
+        points.extend(self._cells[self._starts[edge]:self._starts[edge + 1]])
+        points.append(self._nodes[self._seconds[edge]])
+        if not forward:
+            points.reverse()
+        return points
+
+    def __ends(self, point: int) -> list[tuple[int, int, int]]:
+        """
+        Returns the nodes next to a cell, with the steps to them and the
+        corridor followed (-1 if the cell is the node).
+        """
+        node = self._node_ids[point]
+        if node >= 0:
+            return [(node, 0, CellGrid.NO_NEIGHBOR)]
+        slot = self._slots[point]
+        edge = self.__edge_of(slot)
+        position = slot - self._starts[edge]
+        return [(self._firsts[edge], position + 1, edge),
+                (self._seconds[edge], self.__length(edge) - position - 1,
+                 edge)]
+
+    @staticmethod
+    def __entry_edge(entries: list[tuple[int, int, int]], node: int) -> int:
+        for entry_node, _, edge in entries:
+            if entry_node == node:
+                return edge
+        return CellGrid.NO_NEIGHBOR
+
+    def __to_cell(self, node: int, edge: int, point: int) -> list[int]:
+        """
+        Returns the cells from a node to a cell of one of its corridors,
+        both included.
+        """
+        if edge < 0:
+            return [point]
+        forward = self._firsts[edge] == node
+        if self._firsts[edge] == self._seconds[edge]:
+            # A corridor going back to its own node: the shortest side
+            position = self._slots[point] - self._starts[edge]
+            forward = position + 1 <= self.__length(edge) - position - 1
+        walk = self.__walk(edge, forward)
+        return walk[:walk.index(point) + 1]
@@ -2,14 +2,18 @@
 
 from .exceptions import MazeError
 from .legacy import Player
+from .cell_grid import CellGrid, CellView, CellsView
+from .path_index import PathIndex
+from .junction_graph import JunctionGraph
 
 from .gen_types import Coords, Cell, Pathway
-from .predefined import NORTH, SOUTH, EAST, WEST
+from .predefined import NORTH, SOUTH, EAST, WEST, DFS
 
 # Other imports...
-from math import ceil
-from random import choice, random, seed
-from typing import Optional
+from array import array
+from collections.abc import Mapping
+from random import Random, SystemRandom
+from typing import Any, Optional
 import sys
 
 
@@ -21,18 +25,43 @@ class Maze:
     MIN_FT_WIDTH = 9
     MIN_FT_HEIGHT = 7
 
+    # Chance of every cell of an imperfect maze of trying to open one of its
+    # walls, picked at random, in the original wall opening
     WALL_OPENING_CHANCE = 1 / 10
-    PATH_ATTEMPTS = 10
+    # Chance of opening every closed wall between two free cells of an
+    # imperfect maze. A random wall of a cell of a perfect maze is a closed
+    # one between two free cells about half of the times, so this opens
+    # about as many walls as ``WALL_OPENING_CHANCE`` did, before skipping
+    # the ones that would open a 2x2 square (see ``open_random_walls``)
+    DEFAULT_WALL_OPENING_DENSITY = WALL_OPENING_CHANCE / 2
+    # Share of dead ends removed from imperfect mazes, from 0 to 100
+    DEFAULT_DEAD_END_REMOVAL = 0
+    # Shortest pathways listed by the pathfinder of imperfect mazes
+    PATHWAYS_FOUND = 10
+
+    # Range of the seeds picked when no seed is given
+    MAX_RANDOM_SEED = 2 ** 32 - 1
 
     DEFAULT_OUTPUT_FILE = "maze.txt"
 
+    # Tiled generation: side of every tile and processes used, 0 meaning
+    # one per CPU
+    DEFAULT_TILE_SIZE = 256
+    DEFAULT_WORKERS = 0
+
     def __init__(self, width: int, height: int,
                  entry: Coords, exit: Coords,
                  output_file: str = "maze.txt",
                  seed_num: int = 0,
                  ft_logo: bool = True, perfect: bool = False,
                  path_finder: bool = False,
-                 ft_logo_scale: bool = False
+                 ft_logo_scale: bool = False,
+                 binary_output: bool = False,
+                 algorithm: str = DFS,
+                 tile_size: int = DEFAULT_TILE_SIZE,
+                 workers: int = DEFAULT_WORKERS,
+                 wall_opening_density: float = DEFAULT_WALL_OPENING_DENSITY,
+                 dead_end_removal: float = DEFAULT_DEAD_END_REMOVAL
                  ) -> None:
         from .pathfinder import PathFinder
 
@@ -57,17 +86,46 @@ class Maze:
             path_finder = False
         if ft_logo_scale is None:
             ft_logo_scale = False
+        if binary_output is None:
+            binary_output = False
+        if algorithm is None:
+            algorithm = DFS
+        if tile_size is None:
+            tile_size = Maze.DEFAULT_TILE_SIZE
+        if workers is None:
+            workers = Maze.DEFAULT_WORKERS
+        if tile_size < 1:
+            raise MazeError("Tile size can't be lower than 1!")
+        if workers < 0:
+            raise MazeError("Workers can't be negative!")
+        if wall_opening_density is None:
+            wall_opening_density = Maze.DEFAULT_WALL_OPENING_DENSITY
+        if not 0 <= wall_opening_density <= 1:
+            raise MazeError("Wall opening density must be between 0 and 1!")
+        if dead_end_removal is None:
+            dead_end_removal = Maze.DEFAULT_DEAD_END_REMOVAL
+        if not 0 <= dead_end_removal <= 100:
+            raise MazeError("Dead end removal must be between 0 and 100!")
+        if dead_end_removal and perfect:
+            raise MazeError("Dead ends can't be removed from a perfect maze!")
 
         # Seed that will be used
-        if seed_num:
-            seed(seed_num)
+        seed_num = Maze.resolve_seed(seed_num)
+        self._seed = seed_num
+        self._rng = Random(seed_num)
 
         # Scaling logo
         self._ft_logo_scale = ft_logo_scale
 
         # Bases init
+        self._algorithm = algorithm
+        self._tile_size = tile_size
+        self._workers = workers
+        self._wall_opening_density = wall_opening_density
+        self._dead_end_removal = dead_end_removal
         self.__base_fields_init(width, height, ft_logo, entry, exit)
         self._output_file = output_file
+        self._binary_output = binary_output
         self._perfect = perfect
         self._pathway: Pathway
         self._directions_followed: list[str]
@@ -77,24 +135,29 @@ class Maze:
         # self._player = Player(self._cells[entry])
         self._possible_pathways: list[Pathway] = []
         self._pathfinder = path_finder
+        self._distance_fields: dict[Coords, tuple[int, array]] = {}
+        self._path_index: Optional[tuple[int, PathIndex]] = None
+        self._junction_graph: Optional[tuple[int, JunctionGraph]] = None
 
         # Generating cells with the algorithm in the Generator class
-        # if seed_num:
-        #     seed(seed_num)
         # cell_generation, self._pathway, self._directions_followed = (
         #     Generator.dfs_generation(self))
 
         # If not perfect:
         if not self._perfect:
 
+            # Removing dead ends
+            if dead_end_removal:
+                self.remove_dead_ends(dead_end_removal)
+
             # Open walls
-            self._cells = self.open_random_walls()
+            self.open_random_walls()
 
-            # Finding paths:
-            # Recursive
+            # Finding paths: the shortest ones, in order
             if path_finder:
                 # print("Looking for paths...")
-                self._possible_pathways = (PathFinder.path_finder_dfs(self))
+                self._possible_pathways = PathFinder.k_shortest_paths(
+                    self, Maze.PATHWAYS_FOUND)
                 return
             else:
                 # print("No pathfinder added!")
@@ -115,8 +178,80 @@ class Maze:
         self.set_entry(entry)
         self.set_exit(exit)
         self._ft_logo = ft_logo
-        (self._cells, self._pathway, self._directions_followed) = (
-            Generator.dfs_generation(self))
+        (self._grid, self._pathway, self._directions_followed) = (
+            Generator.generate(self))
+
+    @classmethod
+    def from_grid(cls, grid: CellGrid, entry: Coords, exit: Coords,
+                  directions: list[str],
+                  output_file: str = DEFAULT_OUTPUT_FILE,
+                  seed_num: int = 0,
+                  ft_logo: bool = True, perfect: bool = False,
+                  path_finder: bool = False,
+                  ft_logo_scale: bool = False,
+                  possible_pathways: Optional[list[Pathway]] = None,
+                  algorithm: str = DFS,
+                  binary_output: bool = False
+                  ) -> "Maze":
+        """
+        Builds a maze around an already generated ``CellGrid``, without
+        running any generation algorithm.
+
+        Parameters
+        ----------
+        grid: CellGrid
+            Buffers with the state of every cell.
+        entry, exit: Coords
+            Entry and exit points of the maze.
+        directions: list[str]
+            Directions followed from the entry to reach the exit. The
+            pathway of the maze is rebuilt from them.
+
+        Notes
+        -----
+        The random generator of the returned maze starts again from
+        ``seed_num``, it doesn't continue where the generation left it.
+        """
+        maze = cls.__new__(cls)
+        maze.set_width(grid.get_width())
+        maze.set_height(grid.get_height())
+        maze.set_entry(entry)
+        maze.set_exit(exit)
+        maze._seed = seed_num
+        maze._rng = Random(seed_num)
+        maze._ft_logo = ft_logo
+        maze._ft_logo_scale = ft_logo_scale
+        maze._output_file = output_file
+        maze._binary_output = binary_output
+        maze._algorithm = algorithm
+        maze._tile_size = Maze.DEFAULT_TILE_SIZE
+        maze._workers = Maze.DEFAULT_WORKERS
+        maze._wall_opening_density = Maze.DEFAULT_WALL_OPENING_DENSITY
+        maze._dead_end_removal = Maze.DEFAULT_DEAD_END_REMOVAL
+        maze._perfect = perfect
+        maze._pathfinder = path_finder
+        maze._grid = grid
+        maze._directions_followed = list(directions)
+        maze._pathway = maze.follow_directions(entry, directions)
+        maze._possible_pathways = possible_pathways or []
+        maze._distance_fields = {}
+        maze._path_index = None
+        maze._junction_graph = None
+        return maze
+
+    @classmethod
+    def from_file(cls, path: str) -> "Maze":
+        """
+        Loads a maze previously saved with ``print_output``, without
+        generating it again. Files ending in ``MazeIO.BINARY_EXTENSION``
+        are read with ``MazeIO.read_binary``, any other with
+        ``MazeIO.read_text``.
+        """
+        from .maze_io import MazeIO
+
+        if MazeIO.is_binary_path(path):
+            return MazeIO.read_binary(path)
+        return MazeIO.read_text(path)
 
     # WIDTH -------------------------------------------------------------------
     def set_width(self, width: int) -> None:
@@ -160,33 +295,78 @@ class Maze:
     def get_exit(self) -> Coords:
         return self._exit
 
+    # SEED --------------------------------------------------------------------
+    def get_seed(self) -> int:
+        return self._seed
+
+    @staticmethod
+    def resolve_seed(seed_num: int) -> int:
+        """
+        Returns the seed a maze built with ``seed_num`` will use. A 0 seed
+        picks a random one, which is kept so the same maze can be
+        generated again with ``get_seed``.
+        """
+        if not seed_num:
+            return SystemRandom().randint(1, Maze.MAX_RANDOM_SEED)
+        return seed_num
+
+    def get_rng(self) -> Random:
+        """
+        Returns the random generator owned by this maze.
+
+        Notes
+        -----
+        Generation, wall opening and path finding only draw from this
+        instance, never from the global ``random`` module, so mazes built
+        at the same time in different threads don't affect each other.
+        """
+        return self._rng
+
     # CELLS -------------------------------------------------------------------
-    def set_cells(self, cells: dict[Coords, Cell]) -> None:
-        self._cells = cells
+    def get_grid(self) -> CellGrid:
+        return self._grid
 
-    def get_cells(self) -> dict[Coords, Cell]:
-        return self._cells
+    def set_cells(self, cells: Mapping[Coords, Cell]) -> None:
+        """
+        Copies the state of every given ``Cell`` into the maze buffers.
+        """
+        for coord, cell in cells.items():
+            self.set_cell(coord, cell)
+
+    def get_cells(self) -> Mapping[Coords, Cell]:
+        """
+        Returns a read-only view of every cell of the maze.
+
+        Notes
+        -----
+        The cells are stored in a ``CellGrid``, the returned mapping only
+        reads from it. Use ``set_cell`` or ``set_cells`` to modify them.
+        """
+        return CellsView(self._grid)
 
     def set_cell(self, coord: Coords, new_cell: Cell) -> None:
         """
-        Sets the given ``Cell`` as the new instance in the given coordinate.
+        Copies the values of the given ``Cell`` into the given coordinate.
         """
-        if coord in self._cells.keys():
-            self._cells[coord] = new_cell
+        if self._grid.contains(coord):
+            self._grid.set_cell(coord, new_cell)
 
     def get_cell(self, coord: Coords) -> Optional[Cell]:
         """
-        Returns the ``Cell`` instance in the given coordinate if found.
+        Returns a read-only view of the ``Cell`` in the given coordinate
+        if found.
         """
-        if coord in self._cells.keys():
-            return self._cells[coord]
+        if self._grid.contains(coord):
+            return CellView(self._grid, self._grid.index(coord))
         return None
 
     def get_cell_position(self, cell: Cell) -> Optional[Coords]:
         """
         Returns the coordinate of the given ``Cell`` instance.
         """
-        for key, value in self._cells.items():
+        if isinstance(cell, CellView):
+            return cell.get_coords()
+        for key, value in self.get_cells().items():
             if value == cell:
                 return key
         return None
@@ -222,6 +402,29 @@ class Maze:
             adjacent_cells[SOUTH] = (point[0], point[1] + 1)
         return adjacent_cells
 
+    def follow_directions(self, start: Coords,
+                          directions: list[str]) -> Pathway:
+        """
+        Returns every coordinate visited when following the given
+        directions from ``start``, including ``start`` itself.
+
+        Notes
+        -----
+        Walls are ignored, only the maze borders are checked.
+        """
+        from .predefined import DIRECTION_OFFSETS
+
+        point = start
+        pathway: Pathway = [point]
+        for direction in directions:
+            offset = DIRECTION_OFFSETS[direction]
+            point = (point[0] + offset[0], point[1] + offset[1])
+            if not self._grid.contains(point):
+                raise MazeError(f"Direction '{direction}' leaves the maze "
+                                f"at {pathway[-1]}!")
+            pathway.append(point)
+        return pathway
+
     # PLAYER ------------------------------------------------------------------
     def set_player(self, player: Player) -> None:
         self._player = player
@@ -274,10 +477,10 @@ class Maze:
         False
             If there is a wall in the given direction.
         """
-        cell: Cell | None = self.get_cell(coords)
-        if not cell:
+        if not self._grid.contains(coords):
             return False
-        if cell["state"] & Maze.WALLS[direction]:
+        if self._grid.get_walls()[self._grid.index(coords)] & (
+                Maze.WALLS[direction]):
             return False
         return True
 
@@ -310,8 +513,7 @@ class Maze:
         This method completely ignores walls. It's a quick way
         to stablish the position of the player.
         """
-        cell = self.get_cell(coordinates)
-        if cell is not None:
+        if self._grid.contains(coordinates):
             self._player.set_coordinates(coordinates)
 
     def get_player_coordinates(self) -> Coords:
@@ -335,76 +537,252 @@ class Maze:
         """
         from .ft_logo_cells import FtLogoCells
 
-        scale = FtLogoCells.choose_logo_scale(self._width, self._height)
-        if scale == 0:
-            return None
-        if self._ft_logo_scale:
-            ft_logo = FtLogoCells.scale_logo(scale)
-        else:
-            ft_logo = FtLogoCells.scale_logo(1)
-        center_point = (ceil(self._width / 2),
-                        ceil(self._height / 2))
-        cells: list[Coords] = []
-        for cell in ft_logo:
-            cells.append((center_point[0] + cell[0],
-                         center_point[1] + cell[1]))
-        return tuple(cells)
+        return FtLogoCells.logo_cells(self._width, self._height,
+                                      self._ft_logo_scale)
 
     def get_ft_logo_scale(self) -> bool:
         return self._ft_logo_scale
 
+    # ALGORITHM ---------------------------------------------------------------
+    def get_algorithm(self) -> str:
+        return self._algorithm
+
+    def get_tile_size(self) -> int:
+        return self._tile_size
+
+    def get_workers(self) -> int:
+        return self._workers
+
+    def get_wall_opening_density(self) -> float:
+        return self._wall_opening_density
+
+    def get_dead_end_removal(self) -> float:
+        return self._dead_end_removal
+
     # PERFECT -----------------------------------------------------------------
     def get_perfect(self) -> bool:
         return self._perfect
 
-    def open_random_walls(self) -> dict[Coords, Cell]:
-        from .predefined import POSSIBLE_DIRECTIONS, OPPOSITE_DIRECTIONS
-
-        # Initializing variables
-        cells = self._cells
-        width = self._width
-        height = self._height
-        op = OPPOSITE_DIRECTIONS
-        broke_last = False
-
-        for y in range(1, height + 1):
-            for x in range(1, width + 1):
-                if broke_last:
-                    broke_last = False
-                    continue
-                if cells[(x, y)]["fixed"]:
-                    continue
-                dir = choice(POSSIBLE_DIRECTIONS)
-                if random() < Maze.WALL_OPENING_CHANCE:
-                    adjacents: dict[str, Coords | None] = (
-                        self.get_adjacent_cells((x, y)))
-                    to_move = adjacents[dir]
-                    if (to_move is not None and
-                            not cells[to_move]["fixed"] and
-                            cells[(x, y)]["state"] & Maze.WALLS[dir]):
-                        # If adjacent exists and has the wall desired to open:
-
-                        # Changing current cell state
-                        cells[(x, y)]["state"] -= Maze.WALLS[dir]
-
-                        # Changing adjacent cell state
-                        cells[to_move]["state"] -= (
-                            Maze.WALLS[op[dir]])
-
-                        broke_last = True
-        return cells
+    def open_random_walls(self) -> None:
+        """
+        Opens walls between free cells, each closed one with a
+        ``get_wall_opening_density`` chance, so the maze has loops.
+
+        Notes
+        -----
+        The walls are picked all at once with ``numpy``: a random number
+        for every east and south wall, masked to the closed ones between
+        two free cells. When the picked walls would leave the four cells
+        of a 2x2 square without walls between them, one of them is not
+        opened, so no open area is created. Both sides of every picked
+        wall are then cleared with fancy indexing.
+
+        At low densities the opened walls are then about the density times
+        the closed walls that don't close a square of three open walls on
+        their own. With ``DEFAULT_WALL_OPENING_DENSITY`` about as many
+        walls are picked as with the original ``WALL_OPENING_CHANCE`` per
+        cell, but the skipped ones leave about 20% (DFS mazes) to 35%
+        (mazes with more branches, like Wilson's) fewer walls open.
+        """
+        import numpy as np
+
+        grid = self._grid
+        width = grid.get_width()
+        height = grid.get_height()
+        north, east, south, west = CellGrid.WALL_BITS
+        cells = np.frombuffer(grid.get_walls(), dtype=np.uint8)
+        rows = cells.reshape(height, width)
+        free = ~np.frombuffer(grid.get_fixed(), dtype=np.bool_).reshape(
+            height, width)
+        rng = np.random.default_rng(self._rng.getrandbits(64))
+        density = self._wall_opening_density
+
+        # Closed walls between two free cells, randomly picked
+        east_closed = (rows[:, :-1] & east).astype(np.bool_)
+        south_closed = (rows[:-1] & south).astype(np.bool_)
+        open_east = (east_closed & free[:, :-1] & free[:, 1:]
+                     & (rng.random(east_closed.shape) < density))
+        open_south = (south_closed & free[:-1] & free[1:]
+                      & (rng.random(south_closed.shape) < density))
+
+        # Skipping one picked wall, at random, of every 2x2 square that
+        # would be open. Skipping only closes squares, so once is enough.
+        east_open = ~east_closed | open_east
+        south_open = ~south_closed | open_south
+        squares = (east_open[:-1] & east_open[1:]
+                   & south_open[:, :-1] & south_open[:, 1:])
+        sides = (open_east[:-1], open_east[1:],
+                 open_south[:, :-1], open_south[:, 1:])
+        skipped = np.stack([side & squares for side in sides]) * rng.random(
+            (len(sides),) + squares.shape)
+        picked = skipped.argmax(axis=0)
+        for i, side in enumerate(sides):
+            side &= ~(squares & (picked == i))
+
+        ys, xs = np.nonzero(open_east)
+        points = ys * width + xs
+        cells[points] -= east
+        cells[points + 1] -= west
+        ys, xs = np.nonzero(open_south)
+        points = ys * width + xs
+        cells[points] -= south
+        cells[points + width] -= north
+        grid.mark_changed()
+
+    def remove_dead_ends(self, percentage: float) -> int:
+        """
+        Braids the maze: opens one wall of dead ends, cells with three
+        walls, until the given percentage of them is gone.
+
+        Parameters
+        ----------
+        percentage: float
+            Share of the current dead ends to remove, from 0 to 100.
+
+        Returns
+        -------
+        removed: int
+            How many dead ends were removed. It can be lower than asked for
+            if the remaining ones have no wall that can be opened.
+
+        Notes
+        -----
+        Dead ends are found with ``numpy`` over the whole grid once and
+        visited in a random order drawn from the maze random generator,
+        so the result only depends on the seed. They are opened in rounds
+        of half the dead ends still to remove, towards a neighbor dead end
+        when there is one, since that removes both, so the target is
+        exceeded by one at most.
+
+        Only walls between free cells are opened and, like in
+        ``open_random_walls``, none that would leave a 2x2 square fully
+        open. Dead ends whose opening can't be done are skipped.
+        """
+        import numpy as np
+
+        if not 0 <= percentage <= 100:
+            raise MazeError("Dead end removal must be between 0 and 100!")
+        grid = self._grid
+        width = grid.get_width()
+        cells = np.frombuffer(grid.get_walls(), dtype=np.uint8)
+        free = ~np.frombuffer(grid.get_fixed(), dtype=np.bool_)
+        neighbors = np.stack([np.frombuffer(table, dtype=np.int32)
+                              for table in grid.get_neighbors()])
+        bits = np.array(CellGrid.WALL_BITS, dtype=np.uint8)
+        op_bits = np.array(CellGrid.OPPOSITE_WALL_BITS, dtype=np.uint8)
+        rng = np.random.default_rng(self._rng.getrandbits(64))
+
+        dead_ends = np.flatnonzero(free & (np.bitwise_count(cells) == 3))
+        target = round(len(dead_ends) * percentage / 100)
+        order = rng.permutation(dead_ends)
+        removed = 0
+        position = 0
+        while removed < target and position < len(order):
+            chunk = order[position:position + max(1, (target - removed) // 2)]
+            position += len(chunk)
+            chunk = chunk[np.bitwise_count(cells[chunk]) == 3]
+            if not len(chunk):
+                continue
+
+            # Picking a wall of every dead end, preferring neighbor dead ends
+            adjacent = neighbors[:, chunk]
+            inside = np.maximum(adjacent, 0)
+            valid = ((adjacent >= 0) & free[inside]
+                     & (cells[chunk] & bits[:, None]).astype(np.bool_))
+            valid &= ~Maze.__opens_square(
+                cells, width, np.tile(chunk, 4), inside.ravel(),
+                np.repeat(np.arange(4), len(chunk))).reshape(valid.shape)
+            score = valid * (1 + 2 * (np.bitwise_count(cells[inside]) == 3)
+                             + rng.random(valid.shape))
+            dirs = score.argmax(axis=0)
+            columns = np.arange(len(chunk))
+            picked = score[dirs, columns] > 0
+            points = chunk[picked]
+            dirs = dirs[picked]
+            others = adjacent[dirs, columns[picked]]
+
+            # Two dead ends facing each other pick the same wall
+            _, first = np.unique(np.minimum(points, others) * 2 + dirs % 2,
+                                 return_index=True)
+            points = points[first]
+            dirs = dirs[first]
+            others = others[first]
+
+            touched = np.unique(np.concatenate((points, others)))
+            before = int((np.bitwise_count(cells[touched]) == 3).sum())
+            np.bitwise_and.at(cells, np.concatenate((points, others)),
+                              ~np.concatenate((bits[dirs], op_bits[dirs])))
+
+            # Closing again the walls that open a square together with
+            # another wall opened in the same round
+            undo = Maze.__opens_square(cells, width, points, others, dirs)
+            if undo.any():
+                np.bitwise_or.at(
+                    cells, np.concatenate((points[undo], others[undo])),
+                    np.concatenate((bits[dirs[undo]], op_bits[dirs[undo]])))
+            after = int((np.bitwise_count(cells[touched]) == 3).sum())
+            removed += before - after
+        grid.mark_changed()
+        return removed
+
+    @staticmethod
+    def __opens_square(cells: Any, width: int, points: Any, others: Any,
+                       dirs: Any) -> Any:
+        """
+        Returns, for every wall between ``points`` and ``others`` in the
+        direction ``dirs`` (``numpy`` arrays), whether every other wall
+        between the cells of a 2x2 square around it is open. Walls on the
+        border of the maze, with an index out of it in ``others``, give
+        ``False``.
+        """
+        import numpy as np
+
+        north, east, south, west = CellGrid.WALL_BITS
+        height = len(cells) // width
+        vertical = dirs % 2 == 0
+        low = np.minimum(points, others)
+        x = low % width
+        y = low // width
+        result = np.zeros(len(points), dtype=np.bool_)
+        # Walls of a square from its top left cell: east and south of it,
+        # east of the cell below it and south of the one at its right
+        for corners, exists, own in (
+                (np.where(vertical, low - 1, low - width),
+                 np.where(vertical, x > 0, y > 0)
+                 & (np.where(vertical, y < height - 1, x < width - 1)),
+                 np.where(vertical, 0b1000, 0b0100)),
+                (low,
+                 (x < width - 1) & (y < height - 1),
+                 np.where(vertical, 0b0010, 0b0001))):
+            corners = np.where(exists, corners, 0)
+            closed = (((cells[corners] & east) != 0)
+                      | ((cells[corners] & south) != 0) << 1
+                      | ((cells[np.minimum(corners + width, len(cells) - 1)]
+                          & east) != 0) << 2
+                      | ((cells[np.minimum(corners + 1, len(cells) - 1)]
+                          & south) != 0) << 3)
+            result |= exists & ((closed & ~own) == 0)
+        return result
 
     # PATHFINDER --------------------------------------------------------------
+    def get_path_finder(self) -> bool:
+        return self._pathfinder
+
     def get_shortest_path(self) -> Optional[Pathway]:
         """
-        Gets the shortest path from all of the found ones.
+        Gets the shortest path from the entry to the exit.
 
         Notes
         -----
         it only makes sense to use this method if the pathfinder
         was used. Otherwise, no paths were searched so ``None``
-        will be returned.
+        will be returned. With the pathfinder, the path is found with
+        ``PathFinder.shortest_path``, so it is always an optimal one.
         """
+        from .pathfinder import PathFinder
+
+        if self._pathfinder:
+            return PathFinder.shortest_path(self, self._entry, self._exit)
         if len(self._possible_pathways) > 0:
             return min(self._possible_pathways, key=len)
         return None
@@ -412,54 +790,190 @@ class Maze:
     def get_pathway(self) -> Pathway:
         return self._pathway
 
+    def distance_field(self, target: Optional[Coords] = None) -> array:
+        """
+        Returns the distance from every cell to ``target`` (the exit by
+        default), indexed like the ``CellGrid`` buffers.
+
+        Notes
+        -----
+        The field is computed once with ``PathFinder.distance_field`` and
+        cached until the walls of the maze change. Cells that can't reach
+        the target hold ``CellGrid.NO_NEIGHBOR``.
+        """
+        from .pathfinder import PathFinder
+
+        if target is None:
+            target = self._exit
+        version = self._grid.get_version()
+        cached = self._distance_fields.get(target)
+        if cached is None or cached[0] != version:
+            cached = (version, PathFinder.distance_field(self, target))
+            self._distance_fields[target] = cached
+        return cached[1]
+
+    def distance_to(self, coords: Coords,
+                    target: Optional[Coords] = None) -> Optional[int]:
+        """
+        Returns the number of steps of the shortest route from ``coords``
+        to ``target`` (the exit by default), or ``None`` if there is none.
+        """
+        if not self._grid.contains(coords):
+            return None
+        distance = int(self.distance_field(target)[self._grid.index(coords)])
+        if distance < 0:
+            return None
+        return distance
+
+    def path_to(self, coords: Coords,
+                target: Optional[Coords] = None) -> Optional[Pathway]:
+        """
+        Returns a shortest route from ``coords`` to ``target`` (the exit by
+        default), both included, or ``None`` if there is none.
+
+        Notes
+        -----
+        The route is a greedy descent over the cached distance field: each
+        step moves to an open neighbor one step closer to the target.
+        """
+        if not self._grid.contains(coords):
+            return None
+        grid = self._grid
+        distances = self.distance_field(target)
+        walls = grid.get_walls()
+        moves = tuple(zip(CellGrid.WALL_BITS, grid.get_neighbors()))
+        point = grid.index(coords)
+        if distances[point] < 0:
+            return None
+
+        pathway: Pathway = [coords]
+        while distances[point] > 0:
+            state = walls[point]
+            closer = distances[point] - 1
+            for bit, table in moves:
+                adjacent = table[point]
+                if (not state & bit and adjacent >= 0 and
+                        distances[adjacent] == closer):
+                    point = adjacent
+                    break
+            pathway.append(grid.coords(point))
+        return pathway
+
+    def build_path_index(self) -> PathIndex:
+        """
+        Returns the ``PathIndex`` of this maze, rooted at the entry, to
+        find the path between any two cells without searching the maze.
+
+        Notes
+        -----
+        The index is built once and cached until the walls of the maze
+        change, like ``distance_field``.
+
+        Raises
+        ------
+        MazeError
+            If the maze has loops.
+        """
+        version = self._grid.get_version()
+        cached = self._path_index
+        if cached is None or cached[0] != version:
+            cached = (version, PathIndex(self._grid, self._entry))
+            self._path_index = cached
+        return cached[1]
+
+    def path_length(self, a: Coords, b: Coords) -> Optional[int]:
+        """
+        Returns the number of steps between two cells of a perfect maze, or
+        ``None`` if they are not connected, see ``build_path_index``.
+        """
+        return self.build_path_index().path_length(a, b)
+
+    def path(self, a: Coords, b: Coords) -> Optional[Pathway]:
+        """
+        Returns the cells of the path between two cells of a perfect maze,
+        both included, or ``None`` if they are not connected, see
+        ``build_path_index``.
+        """
+        return self.build_path_index().path(a, b)
+
+    def junction_graph(self) -> JunctionGraph:
+        """
+        Returns the ``JunctionGraph`` of this maze, with the entry and the
+        exit as nodes, to search many paths faster than over the cells.
+
+        Notes
+        -----
+        The graph is built once and cached until the walls of the maze
+        change, like ``distance_field``.
+        """
+        version = self._grid.get_version()
+        cached = self._junction_graph
+        if cached is None or cached[0] != version:
+            cached = (version, JunctionGraph(self._grid,
+                                             (self._entry, self._exit)))
+            self._junction_graph = cached
+        return cached[1]
+
+    def get_directions_followed(self) -> list[str]:
+        return self._directions_followed
+
+    def get_possible_pathways(self) -> list[Pathway]:
+        return self._possible_pathways
+
     # OUTPUT_FILE -------------------------------------------------------------
     def get_output_file(self) -> str:
         return self._output_file
 
+    def get_binary_output(self) -> bool:
+        return self._binary_output
+
     def print_output(self) -> None:
         """
         Writes in the given ``output_file`` the maze in a format which
         turns the wall state from each cell to hexadecimal.
         It also writes the original pathway found.
+
+        If ``output_file`` ends in ``MazeIO.BINARY_EXTENSION`` the maze is
+        written in the binary format instead. With ``binary_output`` the
+        binary file is also written next to the text one.
+
+        Notes
+        -----
+        The grid is translated to hexadecimal in blocks of rows and every
+        section is written with a single call, see ``MazeIO``.
         """
+        from .maze_io import MazeIO
+
+        if MazeIO.is_binary_path(self._output_file):
+            MazeIO.write_binary(self, self._output_file)
+            return
+        if self._binary_output:
+            MazeIO.write_binary(self, MazeIO.binary_path(self._output_file))
+
         try:
-            with open(self._output_file, "w") as f:
-                for height in range(1, self._height + 1):
-                    for width in range(1, self._width + 1):
-                        f.write(
-                            str(format(self._cells[(width, height)]["state"],
-                                'X')))
-                    f.write("\n")
-                f.write("\n")
-                # Entry point
-                f.write(f"{self._entry[0]}, {self._entry[1]}\n")
-
-                # Exit point
-                f.write(f"{self._exit[0]}, {self._exit[1]}\n")
-
-                # Directions followed
-                for direction in self._directions_followed:
-                    f.write(direction)
-                f.write("\n")
+            with open(self._output_file, "wb") as f:
+                MazeIO.write_hex_rows(f, self._grid.get_walls(), self._width)
+
+                # Entry point, exit point and directions followed
+                f.write((f"\n{self._entry[0]}, {self._entry[1]}\n"
+                         f"{self._exit[0]}, {self._exit[1]}\n"
+                         f"{''.join(self._directions_followed)}\n"
+                         ).encode())
 
                 if not self._perfect and self._pathfinder:
-                    f.write("Original Pathway----------------------\n")
-                    for coord in self._pathway:
-                        f.write(f"{coord} | ")
-                    f.write("\n")
-                    f.write("Pathways found------------------------\n")
-                    i = 0
-                    for path in self._possible_pathways:
-                        f.write(f"=== {i} ===\n")
-                        for coord in path:
-                            f.write(f"{coord} | ")
-                        f.write("\n")
-                        i += 1
-                    f.write("Shortest path-------------------------\n")
+                    sections: list[str] = [
+                        "Original Pathway----------------------\n",
+                        MazeIO.format_pathway(self._pathway), "\n",
+                        "Pathways found------------------------\n"]
+                    for i, path in enumerate(self._possible_pathways):
+                        sections.append(f"=== {i} ===\n")
+                        sections.append(MazeIO.format_pathway(path))
+                        sections.append("\n")
+                    sections.append("Shortest path-------------------------\n")
                     shortest_path = self.get_shortest_path()
                     if shortest_path:
-                        for coord in shortest_path:
-                            f.write(f"{coord} | ")
+                        sections.append(MazeIO.format_pathway(shortest_path))
+                    f.write("".join(sections).encode())
         except FileNotFoundError:
             # This error should never happen, since open with 'w' doesn't raise
             # FileNotFoundError, it creates it in case it doesn't exist.
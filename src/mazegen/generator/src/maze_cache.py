@@ -0,0 +1,365 @@
+#!/bin/env python3
+
+# Main imports
+from .maze import Maze
+from .maze_io import MazeIO, BinaryMazeFile
+from .exceptions import MazeError
+from .predefined import TILED
+
+# Other imports
+from collections import OrderedDict
+from hashlib import sha256
+from importlib.metadata import version, PackageNotFoundError
+from threading import Lock
+from typing import Any, Optional
+import json
+import os
+import tempfile
+
+
+class MazeCache:
+    """
+    Directory of already generated mazes, saved in the binary format of
+    ``MazeIO.write_binary`` and named after a hash of everything their
+    cells depend on, so the same configuration is never generated twice.
+
+    Parameters
+    ----------
+    directory: str
+        Where the mazes are saved, created if missing. Many processes can
+        share it: every file is written under a temporary name and moved
+        into place when complete.
+    max_bytes: int
+        Size cap of the directory. When it is exceeded, the least recently
+        used mazes are removed.
+
+    Notes
+    -----
+    Only mazes with an explicit seed are cached, since any other one is
+    random. Imperfect mazes with the pathfinder on aren't cached either,
+    the pathways it finds are not stored in the binary format.
+
+    A maze loaded from the cache has the same cells, pathway and flags as
+    a generated one, but its random generator starts again from the seed
+    (see ``Maze.from_grid``).
+    """
+
+    DEFAULT_MAX_BYTES = 256 << 20
+
+    # Parameters of ``Maze`` that change the cells of the maze. The tile
+    # size only does with tiled generation, and the wall opening density
+    # and the dead end removal with imperfect mazes.
+    KEY_FIELDS = ("width", "height", "entry", "exit", "seed_num", "perfect",
+                  "ft_logo", "ft_logo_scale", "algorithm", "tile_size",
+                  "wall_opening_density", "dead_end_removal")
+
+    def __init__(self, directory: str,
+                 max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 0:
+            raise MazeError("Cache size can't be negative!")
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_bytes = max_bytes
+
+    def get_directory(self) -> str:
+        return self._directory
+
+    def get_max_bytes(self) -> int:
+        return self._max_bytes
+
+    # KEYS --------------------------------------------------------------------
+    @staticmethod
+    def library_version() -> str:
+        """
+        Returns the installed version of the library, part of every key
+        so an upgrade never loads mazes of another generator.
+        """
+        try:
+            return version("mazegen")
+        except PackageNotFoundError:
+            return "unknown"
+
+    @classmethod
+    def is_cacheable(cls, parameters: dict[str, Any]) -> bool:
+        """
+        Whether the maze built with the given ``Maze`` keyword arguments
+        can be cached, see ``MazeCache``.
+        """
+        return bool(parameters.get("seed_num")) and (
+            bool(parameters.get("perfect"))
+            or not parameters.get("path_finder"))
+
+    @classmethod
+    def key(cls, parameters: dict[str, Any]) -> str:
+        """
+        Returns the hash of the given ``Maze`` keyword arguments, only
+        taking the ones in ``KEY_FIELDS``.
+        """
+        normalized = {field: parameters.get(field)
+                      for field in cls.KEY_FIELDS}
+        normalized["entry"] = list(parameters["entry"])
+        normalized["exit"] = list(parameters["exit"])
+        if normalized["algorithm"] != TILED:
+            normalized["tile_size"] = None
+        if normalized["perfect"]:
+            normalized["wall_opening_density"] = None
+            normalized["dead_end_removal"] = None
+        normalized["version"] = cls.library_version()
+        normalized["format"] = MazeIO.BINARY_VERSION
+        return sha256(json.dumps(normalized, sort_keys=True).encode()
+                      ).hexdigest()
+
+    def path_of(self, key: str) -> str:
+        return os.path.join(self._directory, key + MazeIO.BINARY_EXTENSION)
+
+    # ACCESS ------------------------------------------------------------------
+    def get(self, parameters: dict[str, Any]) -> Optional[Maze]:
+        """
+        Returns the cached maze built with the given ``Maze`` keyword
+        arguments, or ``None`` if it isn't cached.
+
+        Files that can't be read are removed and taken as missing.
+        """
+        if not self.is_cacheable(parameters):
+            return None
+        path = self.path_of(self.key(parameters))
+        try:
+            # Marking it as recently used
+            os.utime(path)
+            maze_file = BinaryMazeFile(path)
+            walls = maze_file.region((1, 1)).tobytes()
+            directions = list(maze_file.get_directions())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, MazeError):
+            self.__remove(path)
+            return None
+        return Maze.from_grid(
+            MazeIO.grid_from_walls(maze_file.get_width(),
+                                   maze_file.get_height(), walls),
+            maze_file.get_entry(), maze_file.get_exit(), directions,
+            output_file=parameters.get("output_file")
+            or Maze.DEFAULT_OUTPUT_FILE,
+            seed_num=maze_file.get_seed(),
+            ft_logo=bool(parameters.get("ft_logo", True)),
+            perfect=bool(parameters.get("perfect")),
+            path_finder=bool(parameters.get("path_finder")),
+            ft_logo_scale=bool(parameters.get("ft_logo_scale")),
+            algorithm=maze_file.get_algorithm(),
+            binary_output=bool(parameters.get("binary_output")))
+
+    def put(self, parameters: dict[str, Any], maze: Maze) -> bool:
+        """
+        Saves the given maze, built with the given ``Maze`` keyword
+        arguments, and removes the least recently used mazes if the size
+        cap is exceeded.
+
+        Returns
+        -------
+        cached: bool
+            ``False`` if the maze can't be cached.
+        """
+        if not self.is_cacheable(parameters):
+            return False
+        fd, temp_path = tempfile.mkstemp(dir=self._directory,
+                                         suffix=".tmp")
+        os.close(fd)
+        try:
+            MazeIO.write_binary(maze, temp_path)
+            os.replace(temp_path, self.path_of(self.key(parameters)))
+        except BaseException:
+            self.__remove(temp_path)
+            raise
+        self.evict()
+        return True
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used mazes until the directory is under
+        its size cap.
+        """
+        entries: list[tuple[float, int, str]] = []
+        total = 0
+        with os.scandir(self._directory) as scan:
+            for entry in scan:
+                if not entry.name.endswith(MazeIO.BINARY_EXTENSION):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        if total <= self._max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self._max_bytes:
+                break
+            self.__remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        """
+        Removes every cached maze.
+        """
+        with os.scandir(self._directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(MazeIO.BINARY_EXTENSION):
+                    self.__remove(entry.path)
+
+    @staticmethod
+    def __remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class MemoryMazeCache:
+    """
+    Least recently used mazes of a long running process, kept in memory.
+
+    The parameters read from every config file are kept too, keyed by
+    the resolved path of the file, its modification time and its size, so
+    a file is only parsed again when it changes. Mazes are keyed by those
+    parameters, so different files with the same values share them.
+
+    Parameters
+    ----------
+    max_entries: int
+        Most mazes kept at once, the least recently used one is dropped
+        when a new one doesn't fit.
+
+    Notes
+    -----
+    Mazes are kept packed with ``MazeIO.pack`` and every hit unpacks a new
+    copy, so the returned mazes can be modified without touching the
+    cache. The cache can be shared between threads.
+
+    Unlike ``MazeCache``, imperfect mazes with the pathfinder on are
+    cached too, since ``MazeIO.pack`` keeps their possible pathways; see
+    ``is_cacheable``.
+    """
+
+    DEFAULT_MAX_ENTRIES = 128
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 0:
+            raise MazeError("Cache size can't be negative!")
+        self._max_entries = max_entries
+        self._mazes: OrderedDict[tuple[Any, ...], bytes] = OrderedDict()
+        self._configs: OrderedDict[tuple[str, int, int],
+                                   dict[str, Any]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_max_entries(self) -> int:
+        return self._max_entries
+
+    def get_hits(self) -> int:
+        return self._hits
+
+    def get_misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._mazes)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the counters of the cache, for monitoring.
+        """
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses,
+                    "entries": len(self._mazes),
+                    "bytes": sum(map(len, self._mazes.values()))}
+
+    def clear(self) -> None:
+        """
+        Drops every maze and config file, and resets the counters.
+        """
+        with self._lock:
+            self._mazes.clear()
+            self._configs.clear()
+            self._hits = 0
+            self._misses = 0
+
+    # CONFIG FILES ------------------------------------------------------------
+    def read_parameters(self, config_file: str) -> dict[str, Any]:
+        """
+        Same as ``MazeGenerator.read_parameters``, only parsing the file
+        again if it changed since the last time.
+        """
+        from ..main import MazeGenerator
+
+        path = os.path.realpath(config_file)
+        try:
+            stat = os.stat(path)
+            key = (path, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            # Letting the config reader report it
+            return MazeGenerator.read_parameters(config_file)
+        with self._lock:
+            parameters = self._configs.get(key)
+            if parameters is not None:
+                self._configs.move_to_end(key)
+                return dict(parameters)
+        parameters = MazeGenerator.read_parameters(config_file)
+        with self._lock:
+            self._configs[key] = dict(parameters)
+            while len(self._configs) > self._max_entries:
+                self._configs.popitem(last=False)
+        return parameters
+
+    # MAZES -------------------------------------------------------------------
+    @staticmethod
+    def is_cacheable(parameters: dict[str, Any]) -> bool:
+        """
+        Whether the maze built with the given ``Maze`` keyword arguments
+        can be kept, that is whether it has an explicit seed.
+        """
+        return bool(parameters.get("seed_num"))
+
+    @staticmethod
+    def key(parameters: dict[str, Any]) -> tuple[Any, ...]:
+        return tuple(sorted(parameters.items()))
+
+    def get(self, parameters: dict[str, Any]) -> Optional[Maze]:
+        """
+        Returns a copy of the cached maze built with the given ``Maze``
+        keyword arguments, or ``None`` if it isn't cached.
+        """
+        if not self.is_cacheable(parameters):
+            return None
+        key = self.key(parameters)
+        with self._lock:
+            packed = self._mazes.get(key)
+            if packed is None:
+                self._misses += 1
+                return None
+            self._mazes.move_to_end(key)
+            self._hits += 1
+        return MazeIO.unpack(packed)
+
+    def put(self, parameters: dict[str, Any], maze: Maze) -> bool:
+        """
+        Keeps a copy of the given maze, built with the given ``Maze``
+        keyword arguments.
+
+        Returns
+        -------
+        cached: bool
+            ``False`` if the maze can't be cached.
+        """
+        if not self.is_cacheable(parameters) or not self._max_entries:
+            return False
+        packed = MazeIO.pack(maze)
+        key = self.key(parameters)
+        with self._lock:
+            self._mazes[key] = packed
+            self._mazes.move_to_end(key)
+            while len(self._mazes) > self._max_entries:
+                self._mazes.popitem(last=False)
+        return True
@@ -0,0 +1,696 @@
+#!/bin/env python3
+
+# Main imports
+from .maze import Maze
+from .cell_grid import CellGrid
+from .exceptions import MazeError
+from .gen_types import ByteBuffer, Coords, Pathway
+from .predefined import ALGORITHMS, DIRECTION_OFFSETS, POSSIBLE_DIRECTIONS
+
+# Other imports
+from array import array
+from collections.abc import Iterable
+from struct import Struct, error as StructError
+from typing import Any, BinaryIO, Optional
+import os
+import re
+
+
+class MazeIO:
+
+    # Compact format used to move whole mazes between processes:
+    # header, output file name, seed, walls, visited, fixed, directions
+    # followed and every possible pathway as cell indices.
+    PACK_MAGIC = b"MZPK"
+    PACK_HEADER = Struct("<4sIIIIIIBHHHII")
+    PACK_PATHWAY_LEN = Struct("<I")
+
+    FLAG_FT_LOGO = 0b0001
+    FLAG_FT_LOGO_SCALE = 0b0010
+    FLAG_PERFECT = 0b0100
+    FLAG_PATH_FINDER = 0b1000
+    FLAG_BINARY_OUTPUT = 0b10000
+
+    # Binary output format: a fixed size header followed by every row of
+    # the grid with two cells per byte (the first one in the high nibble)
+    # and the directions followed. See ``write_binary``.
+    BINARY_EXTENSION = ".mzb"
+    BINARY_MAGIC = b"MZB1"
+    BINARY_VERSION = 2
+    BINARY_HEADER = Struct("<4sHHIIIIIIQ16sB3xQ4x")
+
+    # Translation table from a wall state (0 - 15) to its hexadecimal digit
+    HEX_DIGITS = b"0123456789ABCDEF"
+    HEX_TABLE = bytes.maketrans(bytes(range(len(HEX_DIGITS))), HEX_DIGITS)
+
+    # Translation table from a hexadecimal digit to its wall state
+    DIGITS_TABLE = bytes.maketrans(HEX_DIGITS + HEX_DIGITS[10:].lower(),
+                                   bytes(range(16)) + bytes(range(10, 16)))
+
+    # Translation tables from a wall state to the number of walls it has
+    # and to whether it is fully closed
+    WALL_COUNT_TABLE = bytes(bin(c & 0b1111).count("1") for c in range(256))
+    CLOSED_TABLE = bytes(int(c == CellGrid.CLOSED) for c in range(256))
+
+    # Headers of the sections written only with the pathfinder
+    ORIGINAL_PATHWAY_HEADER = "Original Pathway"
+    PATHWAYS_FOUND_HEADER = "Pathways found"
+    SHORTEST_PATH_HEADER = "Shortest path"
+    COORDS_PATTERN = re.compile(r"\((\d+), (\d+)\)")
+
+    # Approximated amount of bytes sent to the file on every write
+    WRITE_CHUNK_SIZE = 1 << 20
+
+    @classmethod
+    def write_hex_rows(cls, file: BinaryIO, walls: ByteBuffer,
+                       width: int) -> None:
+        """
+        Writes the given walls as rows of ``width`` hexadecimal digits.
+
+        Whole blocks of rows are translated at once with ``bytes.translate``
+        and sent to the file in chunks of about ``WRITE_CHUNK_SIZE`` bytes,
+        instead of writing every cell on its own.
+        """
+        rows_per_chunk = max(1, cls.WRITE_CHUNK_SIZE // (width + 1))
+        chunk_size = rows_per_chunk * width
+        view = memoryview(walls)
+        for start in range(0, len(view), chunk_size):
+            digits = view[start:start + chunk_size].tobytes().translate(
+                cls.HEX_TABLE)
+            rows = [digits[i:i + width] for i in range(0, len(digits), width)]
+            rows.append(b"")
+            file.write(b"\n".join(rows))
+
+    @classmethod
+    def format_pathway(cls, pathway: Pathway) -> str:
+        """
+        Returns the pathway in the ``(x, y) | (x, y) | `` format used by
+        the output file.
+        """
+        return "".join([f"{coord} | " for coord in pathway])
+
+    @classmethod
+    def pack(cls, maze: Maze) -> bytes:
+        """
+        Serializes the given maze into a single ``bytes`` object.
+
+        The cells are copied as raw buffers and the pathways as arrays of
+        cell indices, so no per-cell Python object is created. The result
+        is meant to be unpacked on the same machine with ``unpack``.
+        """
+        grid = maze.get_grid()
+        entry = maze.get_entry()
+        exit = maze.get_exit()
+        output_file = maze.get_output_file().encode()
+        seed = str(maze.get_seed()).encode()
+        directions = "".join(maze.get_directions_followed()).encode()
+        pathways = maze.get_possible_pathways()
+
+        flags = 0
+        if maze.get_ft_logo():
+            flags |= cls.FLAG_FT_LOGO
+        if maze.get_ft_logo_scale():
+            flags |= cls.FLAG_FT_LOGO_SCALE
+        if maze.get_perfect():
+            flags |= cls.FLAG_PERFECT
+        if maze.get_path_finder():
+            flags |= cls.FLAG_PATH_FINDER
+        if maze.get_binary_output():
+            flags |= cls.FLAG_BINARY_OUTPUT
+        algorithm = maze.get_algorithm().encode()
+
+        chunks: list[bytes] = [
+            cls.PACK_HEADER.pack(cls.PACK_MAGIC,
+                                 grid.get_width(), grid.get_height(),
+                                 entry[0], entry[1], exit[0], exit[1],
+                                 flags, len(output_file), len(seed),
+                                 len(algorithm), len(directions),
+                                 len(pathways)),
+            output_file, seed, algorithm,
+            bytes(grid.get_walls()), bytes(grid.get_visited()),
+            bytes(grid.get_fixed()), directions
+        ]
+        for pathway in pathways:
+            indices = array("i", [grid.index(coord) for coord in pathway])
+            chunks.append(cls.PACK_PATHWAY_LEN.pack(len(indices)))
+            chunks.append(indices.tobytes())
+        return b"".join(chunks)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> Maze:
+        """
+        Rebuilds a maze serialized with ``pack``.
+
+        Raises
+        ------
+        MazeError
+            If the data is not a packed maze or is truncated.
+        """
+        try:
+            (magic, width, height, entry_x, entry_y, exit_x, exit_y,
+             flags, output_len, seed_len, algorithm_len, directions_len,
+             pathways_count) = cls.PACK_HEADER.unpack_from(data)
+        except StructError:
+            raise MazeError("Packed maze is truncated!")
+        if magic != cls.PACK_MAGIC:
+            raise MazeError("Given data is not a packed maze!")
+
+        view = memoryview(data)
+        offset = cls.PACK_HEADER.size
+        size = width * height
+
+        def take(length: int) -> memoryview:
+            nonlocal offset
+            if offset + length > len(view):
+                raise MazeError("Packed maze is truncated!")
+            chunk = view[offset:offset + length]
+            offset += length
+            return chunk
+
+        output_file = bytes(take(output_len)).decode()
+        seed = int(bytes(take(seed_len)))
+        algorithm = bytes(take(algorithm_len)).decode()
+        grid = CellGrid.from_buffers(width, height,
+                                     take(size), take(size), take(size))
+        directions = bytes(take(directions_len)).decode()
+
+        pathways: list[Pathway] = []
+        for _ in range(pathways_count):
+            (length,) = cls.PACK_PATHWAY_LEN.unpack(
+                take(cls.PACK_PATHWAY_LEN.size))
+            indices = array("i")
+            indices.frombytes(take(length * indices.itemsize))
+            pathways.append([grid.coords(i) for i in indices])
+
+        return Maze.from_grid(
+            grid, (entry_x, entry_y), (exit_x, exit_y), list(directions),
+            output_file=output_file,
+            seed_num=seed,
+            ft_logo=bool(flags & cls.FLAG_FT_LOGO),
+            perfect=bool(flags & cls.FLAG_PERFECT),
+            path_finder=bool(flags & cls.FLAG_PATH_FINDER),
+            ft_logo_scale=bool(flags & cls.FLAG_FT_LOGO_SCALE),
+            possible_pathways=pathways,
+            algorithm=algorithm,
+            binary_output=bool(flags & cls.FLAG_BINARY_OUTPUT))
+
+    @classmethod
+    def read_hex_grid(cls, rows: list[bytes]) -> CellGrid:
+        """
+        Turns the hexadecimal rows of an output file into a ``CellGrid``.
+
+        All the rows are translated at once with ``bytes.translate``, see
+        ``grid_from_walls``.
+
+        Raises
+        ------
+        MazeError
+            If the rows have different lengths or contain anything that is
+            not a hexadecimal digit.
+        """
+        if not rows or not rows[0]:
+            raise MazeError("Maze file has no cells!")
+        width = len(rows[0])
+        for row in rows:
+            if len(row) != width:
+                raise MazeError("Every row of the maze must have the same "
+                                "amount of cells!")
+        digits = b"".join(rows)
+        if digits.translate(None, cls.HEX_DIGITS + cls.HEX_DIGITS.lower()):
+            raise MazeError("Maze rows can only contain hexadecimal "
+                            "digits!")
+        return cls.grid_from_walls(width, len(rows),
+                                   digits.translate(cls.DIGITS_TABLE))
+
+    @classmethod
+    def check_walls(cls, grid: CellGrid) -> None:
+        """
+        Checks that a grid read from a file is consistent: every wall on
+        the border of the maze is closed and both cells at the sides of
+        every other wall agree on it being open or closed.
+
+        Raises
+        ------
+        MazeError
+            With the first cell found breaking any of them.
+        """
+        import numpy as np
+
+        north, east, south, west = CellGrid.WALL_BITS
+        cells = np.frombuffer(grid.get_walls(), dtype=np.uint8).reshape(
+            grid.get_height(), grid.get_width())
+
+        # Walls every cell must have closed for being on a border
+        border = np.zeros_like(cells)
+        border[0] |= north
+        border[-1] |= south
+        border[:, 0] |= west
+        border[:, -1] |= east
+        rows, columns = np.nonzero(cells & border != border)
+        if len(rows):
+            x = int(columns[0]) + 1
+            y = int(rows[0]) + 1
+            raise MazeError(f"Cell {(x, y)} has a wall open on the border "
+                            "of the maze!")
+
+        sides = ((cells[:, :-1] & east, cells[:, 1:] & west, "east"),
+                 (cells[:-1] & south, cells[1:] & north, "south"))
+        for first, second, name in sides:
+            rows, columns = np.nonzero((first == 0) != (second == 0))
+            if len(rows):
+                x = int(columns[0]) + 1
+                y = int(rows[0]) + 1
+                raise MazeError(f"Cell {(x, y)} and its {name} neighbor "
+                                "don't agree on the wall between them!")
+
+    @classmethod
+    def check_directions(cls, grid: CellGrid, entry: Coords, exit: Coords,
+                         directions: list[str]) -> None:
+        """
+        Checks that the directions read from a file go from the entry to
+        the exit of the grid, every step through an open wall.
+
+        Raises
+        ------
+        MazeError
+            With the first step breaking it, or if the exit isn't reached.
+        """
+        for point in (entry, exit):
+            if not grid.contains(point):
+                raise MazeError(f"{point} is outside of the maze!")
+        walls = grid.get_walls()
+        bits = dict(zip(POSSIBLE_DIRECTIONS, CellGrid.WALL_BITS))
+        point = entry
+        for step, direction in enumerate(directions, 1):
+            if direction not in bits:
+                raise MazeError(f"Unknown direction '{direction}' at step "
+                                f"{step}!")
+            if walls[grid.index(point)] & bits[direction]:
+                raise MazeError(f"Direction '{direction}' at step {step} "
+                                f"goes through a wall of {point}!")
+            offset = DIRECTION_OFFSETS[direction]
+            point = (point[0] + offset[0], point[1] + offset[1])
+        if point != exit:
+            raise MazeError(f"Directions end at {point} instead of the exit "
+                            f"{exit}!")
+
+    @classmethod
+    def grid_from_walls(cls, width: int, height: int,
+                        walls: ByteBuffer) -> CellGrid:
+        """
+        Builds a ``CellGrid`` from the walls of a saved maze. Cells with
+        every wall closed are marked as fixed, since that is how the 42
+        logo cells are written, and every other cell as visited.
+        """
+        walls = bytes(walls)
+        fixed = walls.translate(cls.CLOSED_TABLE)
+        visited = fixed.translate(bytes.maketrans(b"\x00\x01", b"\x01\x00"))
+        return CellGrid.from_buffers(width, height, walls, visited, fixed)
+
+    @classmethod
+    def __parse_coords(cls, line: str) -> tuple[int, int]:
+        split = line.split(",")
+        if len(split) != 2:
+            raise MazeError(f"'{line}' is not a valid coordinate!")
+        try:
+            return (int(split[0]), int(split[1]))
+        except ValueError:
+            raise MazeError(f"'{line}' is not a valid coordinate!")
+
+    @classmethod
+    def __parse_pathways(cls, lines: list[str]) -> list[Pathway]:
+        """
+        Reads the coordinates of every pathway listed after the
+        ``Pathways found`` header, up to the ``Shortest path`` one.
+        """
+        pathways: list[Pathway] = []
+        inside = False
+        for line in lines:
+            if line.startswith(cls.PATHWAYS_FOUND_HEADER):
+                inside = True
+            elif line.startswith(cls.SHORTEST_PATH_HEADER):
+                break
+            elif inside and not line.startswith("==="):
+                pathways.append([(int(x), int(y)) for x, y in
+                                 cls.COORDS_PATTERN.findall(line)])
+        return pathways
+
+    @classmethod
+    def read_text(cls, path: str) -> Maze:
+        """
+        Loads a maze written by ``Maze.print_output``.
+
+        The grid, entry and exit are read back and the pathway is rebuilt
+        by following the directions line from the entry. If the file has
+        the pathfinder sections, the pathways found are read too.
+
+        Notes
+        -----
+        The file doesn't store the seed nor the logo settings: the seed of
+        the loaded maze is 0, fully closed cells are taken as fixed and the
+        maze is considered perfect when its open walls form a tree.
+
+        Files written by ``MazeGenerator.stream`` have an empty directions
+        line, their pathway is found again with
+        ``PathFinder.grid_shortest_path``.
+
+        Raises
+        ------
+        MazeError
+            If the file doesn't follow the output format, its walls are
+            not consistent (see ``check_walls``) or its directions don't
+            lead from the entry to the exit (see ``check_directions``).
+        """
+        from .pathfinder import PathFinder
+
+        with open(path, "rb") as f:
+            content = f.read()
+        grid_part, separator, rest = content.partition(b"\n\n")
+        if not separator:
+            raise MazeError("Maze file has no entry, exit and directions!")
+        grid = cls.read_hex_grid(grid_part.split(b"\n"))
+
+        lines = rest.decode().split("\n")
+        if len(lines) < 3:
+            raise MazeError("Maze file has no entry, exit and directions!")
+        entry = cls.__parse_coords(lines[0])
+        exit = cls.__parse_coords(lines[1])
+        directions = list(lines[2])
+        cls.check_walls(grid)
+        if directions:
+            cls.check_directions(grid, entry, exit, directions)
+        else:
+            pathway = PathFinder.grid_shortest_path(grid, entry, exit)
+            if pathway is None:
+                raise MazeError("EXIT point can't be reached from ENTRY "
+                                "point!")
+            directions = PathFinder.directions_of(pathway)
+        path_finder = any(line.startswith(cls.ORIGINAL_PATHWAY_HEADER)
+                          for line in lines[3:])
+
+        # Every open wall is counted from both of its sides
+        size = grid.get_size()
+        open_walls = 4 * size - sum(
+            grid.get_walls().translate(cls.WALL_COUNT_TABLE))
+        free_cells = size - sum(grid.get_fixed())
+        perfect = open_walls // 2 == free_cells - 1
+
+        return Maze.from_grid(
+            grid, entry, exit, directions,
+            output_file=path,
+            ft_logo=any(grid.get_fixed()),
+            perfect=perfect,
+            path_finder=path_finder,
+            possible_pathways=(cls.__parse_pathways(lines[3:])
+                               if path_finder else None))
+
+    # BINARY FORMAT -----------------------------------------------------------
+    @classmethod
+    def is_binary_path(cls, path: str) -> bool:
+        return path.lower().endswith(cls.BINARY_EXTENSION)
+
+    @classmethod
+    def binary_path(cls, path: str) -> str:
+        """
+        Returns the path of the binary file written next to the given
+        text output file.
+        """
+        return os.path.splitext(path)[0] + cls.BINARY_EXTENSION
+
+    @classmethod
+    def write_binary(cls, maze: Maze, path: str) -> None:
+        """
+        Writes the given maze in the binary format.
+
+        Layout (little endian)
+        ----------------------
+        ``BINARY_HEADER``:
+            magic, format version, header size, width, height, entry x,
+            entry y, exit x, exit y, seed, algorithm name (16 bytes, NUL
+            padded, one of ``ALGORITHMS``), flags (see ``FLAG_*``) and
+            length of the directions.
+        Cells:
+            ``height`` rows of ``(width + 1) // 2`` bytes. The cell with
+            the lower x of every pair goes in the high nibble, the last
+            low nibble of odd widths is 0.
+        Directions:
+            The directions followed from the entry to the exit, one ASCII
+            letter each.
+
+        Notes
+        -----
+        The cells start right after the header and every row has the same
+        size, so any cell can be read without parsing the rest of the file
+        (see ``BinaryMazeFile``). Pathways found by the pathfinder are not
+        stored, they can be computed again from the grid.
+        """
+        directions = "".join(maze.get_directions_followed()).encode()
+
+        flags = 0
+        if maze.get_ft_logo():
+            flags |= cls.FLAG_FT_LOGO
+        if maze.get_ft_logo_scale():
+            flags |= cls.FLAG_FT_LOGO_SCALE
+        if maze.get_perfect():
+            flags |= cls.FLAG_PERFECT
+        if maze.get_path_finder():
+            flags |= cls.FLAG_PATH_FINDER
+
+        with open(path, "wb") as f:
+            f.write(cls.binary_header(
+                maze.get_width(), maze.get_height(), maze.get_entry(),
+                maze.get_exit(), maze.get_seed(), maze.get_algorithm(),
+                flags, len(directions)))
+            f.write(cls.pack_nibbles(maze.get_grid().get_walls(),
+                                     maze.get_width()))
+            f.write(directions)
+
+    @classmethod
+    def binary_header(cls, width: int, height: int,
+                      entry: Coords, exit: Coords, seed: int,
+                      algorithm: str, flags: int,
+                      directions_len: int) -> bytes:
+        """
+        Returns the header of a binary maze file, see ``write_binary``.
+        Seeds that don't fit in the header are stored as 0.
+
+        Raises
+        ------
+        MazeError
+            If the algorithm is not one of ``ALGORITHMS``.
+        """
+        if algorithm not in ALGORITHMS:
+            raise MazeError(f"Unknown algorithm '{algorithm}'!")
+        return cls.BINARY_HEADER.pack(
+            cls.BINARY_MAGIC, cls.BINARY_VERSION, cls.BINARY_HEADER.size,
+            width, height, entry[0], entry[1], exit[0], exit[1],
+            seed if 0 <= seed < 1 << 64 else 0,
+            algorithm.encode(), flags, directions_len)
+
+    @classmethod
+    def pack_nibbles(cls, walls: ByteBuffer, width: int) -> bytes:
+        """
+        Packs whole rows of walls with two cells per byte, as stored in
+        the binary format.
+        """
+        import numpy as np
+
+        cells = np.frombuffer(walls, dtype=np.uint8).reshape(-1, width)
+        if width % 2:
+            cells = np.pad(cells, ((0, 0), (0, 1)))
+        return ((cells[:, 0::2] << 4) | cells[:, 1::2]).tobytes()
+
+    @classmethod
+    def write_stream(cls, path: str, rows: Iterable[ByteBuffer],
+                     width: int, height: int, entry: Coords, exit: Coords,
+                     binary_path: Optional[str] = None,
+                     seed: int = 0, algorithm: str = "",
+                     flags: int = 0) -> None:
+        """
+        Writes the rows of a maze as they are generated, like the ones of
+        ``Generator.eller_rows``, without keeping the whole maze in memory.
+
+        The text file has the same format as ``Maze.print_output``, but the
+        directions line is left empty, since the pathway can't be known
+        until the whole maze exists. If ``binary_path`` is given, the
+        binary format is written there at the same time.
+
+        Notes
+        -----
+        Rows are grouped in blocks of about ``WRITE_CHUNK_SIZE`` cells
+        before being written, so memory only depends on ``width``.
+        """
+        rows_per_chunk = max(1, cls.WRITE_CHUNK_SIZE // (width + 1))
+        binary_file: Optional[BinaryIO] = None
+        with open(path, "wb") as f:
+            try:
+                if binary_path is not None:
+                    binary_file = open(binary_path, "wb")
+                    binary_file.write(cls.binary_header(
+                        width, height, entry, exit, seed, algorithm,
+                        flags, 0))
+                chunk: list[ByteBuffer] = []
+                written = 0
+                for row in rows:
+                    chunk.append(row)
+                    written += 1
+                    if len(chunk) == rows_per_chunk or written == height:
+                        block = b"".join(chunk)
+                        cls.write_hex_rows(f, block, width)
+                        if binary_file is not None:
+                            binary_file.write(cls.pack_nibbles(block, width))
+                        chunk.clear()
+                if written != height:
+                    raise MazeError(f"Expected {height} rows, "
+                                    f"got {written}!")
+            finally:
+                if binary_file is not None:
+                    binary_file.close()
+            f.write((f"\n{entry[0]}, {entry[1]}\n"
+                     f"{exit[0]}, {exit[1]}\n\n").encode())
+
+    @classmethod
+    def read_binary(cls, path: str) -> Maze:
+        """
+        Loads a maze written by ``write_binary``.
+
+        Raises
+        ------
+        MazeError
+            If the file is not a binary maze or is truncated.
+        """
+        return BinaryMazeFile(path).read_maze()
+
+
+class BinaryMazeFile:
+    """
+    Random access to a maze saved with ``MazeIO.write_binary``.
+
+    Only the header is read when it is opened, the cells are mapped with
+    ``numpy.memmap`` so reading a cell or a region of a huge maze only
+    touches the pages holding them.
+
+    Coordinates are 1-based ``(x, y)`` like in ``Maze``.
+    """
+
+    def __init__(self, path: str) -> None:
+        import numpy as np
+
+        self._path = path
+        header = MazeIO.BINARY_HEADER
+        with open(path, "rb") as f:
+            data = f.read(header.size)
+        try:
+            (magic, version, header_size, width, height, entry_x, entry_y,
+             exit_x, exit_y, seed, algorithm, flags,
+             directions_len) = header.unpack(data)
+        except StructError:
+            raise MazeError("Binary maze file is truncated!")
+        if magic != MazeIO.BINARY_MAGIC:
+            raise MazeError(f"'{path}' is not a binary maze file!")
+        if version != MazeIO.BINARY_VERSION:
+            raise MazeError(f"Unsupported binary maze version {version}!")
+        if width < 1 or height < 1:
+            raise MazeError("Maze file has no cells!")
+
+        self._width: int = width
+        self._height: int = height
+        self._entry = (entry_x, entry_y)
+        self._exit = (exit_x, exit_y)
+        self._seed: int = seed
+        self._algorithm: str = algorithm.rstrip(b"\x00").decode(
+            errors="replace")
+        if self._algorithm not in ALGORITHMS:
+            raise MazeError(f"Unknown algorithm '{self._algorithm}' in "
+                            f"'{path}'!")
+        self._flags: int = flags
+        self._row_size = (width + 1) // 2
+        self._cells_offset: int = header_size
+        self._directions_offset = header_size + self._row_size * height
+        self._directions_len: int = directions_len
+        if (os.path.getsize(path)
+                < self._directions_offset + directions_len):
+            raise MazeError("Binary maze file is truncated!")
+        self._cells: Any = np.memmap(path, dtype=np.uint8, mode="r",
+                                     offset=header_size,
+                                     shape=(height, self._row_size))
+
+    # HEADER ------------------------------------------------------------------
+    def get_width(self) -> int:
+        return self._width
+
+    def get_height(self) -> int:
+        return self._height
+
+    def get_entry(self) -> tuple[int, int]:
+        return self._entry
+
+    def get_exit(self) -> tuple[int, int]:
+        return self._exit
+
+    def get_seed(self) -> int:
+        return self._seed
+
+    def get_algorithm(self) -> str:
+        return self._algorithm
+
+    def get_flags(self) -> int:
+        return self._flags
+
+    def get_directions(self) -> str:
+        with open(self._path, "rb") as f:
+            f.seek(self._directions_offset)
+            return f.read(self._directions_len).decode()
+
+    # CELLS -------------------------------------------------------------------
+    def cell(self, coords: tuple[int, int]) -> int:
+        """
+        Returns the wall state of a single cell.
+        """
+        x, y = coords
+        if not (1 <= x <= self._width and 1 <= y <= self._height):
+            raise MazeError(f"{coords} is outside of the maze!")
+        byte = int(self._cells[y - 1, (x - 1) >> 1])
+        return byte >> 4 if x % 2 else byte & 0b1111
+
+    def region(self, top_left: tuple[int, int],
+               bottom_right: Optional[tuple[int, int]] = None) -> Any:
+        """
+        Returns the wall state of every cell between both corners, both
+        included, as a ``numpy`` array of ``(rows, columns)``. Without
+        ``bottom_right`` the region goes up to the end of the maze.
+        """
+        import numpy as np
+
+        x0, y0 = top_left
+        x1, y1 = bottom_right or (self._width, self._height)
+        if not (1 <= x0 <= x1 <= self._width
+                and 1 <= y0 <= y1 <= self._height):
+            raise MazeError(f"Region {top_left} - {bottom_right} is not "
+                            "inside of the maze!")
+        first = (x0 - 1) >> 1
+        packed = self._cells[y0 - 1:y1, first:((x1 - 1) >> 1) + 1]
+        cells = np.empty((packed.shape[0], packed.shape[1] * 2),
+                         dtype=np.uint8)
+        cells[:, 0::2] = packed >> 4
+        cells[:, 1::2] = packed & 0b1111
+        start = x0 - 1 - first * 2
+        return cells[:, start:start + x1 - x0 + 1]
+
+    def read_maze(self) -> Maze:
+        """
+        Loads the whole maze. Fully closed cells are taken as fixed.
+        """
+        walls = self.region((1, 1)).tobytes()
+        flags = self._flags
+        return Maze.from_grid(
+            MazeIO.grid_from_walls(self._width, self._height, walls),
+            self._entry, self._exit, list(self.get_directions()),
+            output_file=self._path,
+            seed_num=self._seed,
+            ft_logo=bool(flags & MazeIO.FLAG_FT_LOGO),
+            perfect=bool(flags & MazeIO.FLAG_PERFECT),
+            path_finder=bool(flags & MazeIO.FLAG_PATH_FINDER),
+            ft_logo_scale=bool(flags & MazeIO.FLAG_FT_LOGO_SCALE),
+            algorithm=self._algorithm,
+            binary_output=True)
@@ -0,0 +1,254 @@
+#!/bin/env python3
+
+# Main imports
+from .cell_grid import CellGrid
+from .gen_types import Coords, Pathway
+from .exceptions import MazeError
+
+# Other imports
+from array import array
+from collections.abc import Sequence
+from typing import Any, Optional
+
+
+class PathIndex:
+    """
+    Lowest common ancestor index of a perfect maze, to find the path
+    between any two cells without searching the maze.
+
+    A perfect maze is a tree. Rooted at ``root``, the path between two
+    cells goes up from both of them to their lowest common ancestor, so
+    its length only depends on the depth of the three cells.
+
+    Parameters
+    ----------
+    grid: CellGrid
+        Cells of a perfect maze.
+    root: Coords
+        Cell the tree is rooted at, usually the entry.
+
+    Raises
+    ------
+    MazeError
+        If the root is not a free cell or the cells connected to it have a
+        loop.
+
+    Notes
+    -----
+    Building the index is a breadth-first search from the root plus the
+    binary lifting table: the ancestor ``2 ** k`` levels up of every cell,
+    for every ``k`` up to the depth of the tree, built with ``numpy`` one
+    level from the previous one. ``path_length`` then jumps up from both
+    cells in ``O(log n)`` steps and ``path`` walks up in
+    ``O(path length)``.
+
+    References
+    ----------
+    https://en.wikipedia.org/wiki/Level_ancestor_problem#Jump_pointer_algorithm
+    """
+
+    def __init__(self, grid: CellGrid, root: Coords) -> None:
+        import numpy as np
+
+        if not grid.contains(root):
+            raise MazeError(f"{root} is outside of the maze!")
+        root_i = grid.index(root)
+        if grid.get_fixed()[root_i]:
+            raise MazeError(f"{root} is a protected cell!")
+
+        size = grid.get_size()
+        walls = grid.get_walls()
+        moves = tuple(zip(CellGrid.WALL_BITS, grid.get_neighbors()))
+        parents = array("i", [CellGrid.NO_NEIGHBOR]) * size
+        depths = array("i", [CellGrid.NO_NEIGHBOR]) * size
+        parents[root_i] = root_i
+        depths[root_i] = 0
+
+        # Breadth-first search, every cell found twice means a loop
+        order = array("i", [root_i])
+        position = 0
+        while position < len(order):
+            point = order[position]
+            position += 1
+            state = walls[point]
+            parent = parents[point]
+            depth = depths[point] + 1
+            for bit, table in moves:
+                if state & bit:
+                    continue
+                adjacent = table[point]
+                if adjacent < 0 or adjacent == parent:
+                    continue
+                if depths[adjacent] >= 0:
+                    raise MazeError("Path index needs a perfect maze!")
+                parents[adjacent] = point
+                depths[adjacent] = depth
+                order.append(adjacent)
+
+        # Cells out of the tree point to the root, so jumps never leave it
+        up = np.frombuffer(parents, dtype=np.int32).copy()
+        up[up < 0] = root_i
+        levels = [up]
+        for _ in range(max(1, max(depths).bit_length()) - 1):
+            levels.append(levels[-1][levels[-1]])
+
+        self._grid = grid
+        self._root = root_i
+        self._size = len(order)
+        self._depths = depths
+        self._table: Any = np.stack(levels)
+        self._depths_np: Any = np.frombuffer(depths, dtype=np.int32)
+        self._levels = [memoryview(level) for level in self._table]
+        self._parents = self._levels[0]
+
+    def get_grid(self) -> CellGrid:
+        return self._grid
+
+    def get_root(self) -> Coords:
+        return self._grid.coords(self._root)
+
+    def get_size(self) -> int:
+        """
+        Returns how many cells are connected to the root.
+        """
+        return self._size
+
+    def depth(self, coords: Coords) -> Optional[int]:
+        """
+        Returns the distance from the root to the given cell, or ``None``
+        if they are not connected.
+        """
+        point = self.__point(coords)
+        return None if point is None else self._depths[point]
+
+    # QUERIES -----------------------------------------------------------------
+    def lowest_common_ancestor(self, a: Coords, b: Coords
+                               ) -> Optional[Coords]:
+        """
+        Returns the cell where the paths from ``a`` and ``b`` to the root
+        meet, or ``None`` if any of them is not connected to it.
+        """
+        first = self.__point(a)
+        second = self.__point(b)
+        if first is None or second is None:
+            return None
+        return self._grid.coords(self.__lca(first, second))
+
+    def path_length(self, a: Coords, b: Coords) -> Optional[int]:
+        """
+        Returns the number of steps between ``a`` and ``b``, or ``None``
+        if they are not connected.
+        """
+        first = self.__point(a)
+        second = self.__point(b)
+        if first is None or second is None:
+            return None
+        depths = self._depths
+        return (depths[first] + depths[second]
+                - 2 * depths[self.__lca(first, second)])
+
+    def path(self, a: Coords, b: Coords) -> Optional[Pathway]:
+        """
+        Returns the cells of the path from ``a`` to ``b``, both included,
+        or ``None`` if they are not connected.
+        """
+        first = self.__point(a)
+        second = self.__point(b)
+        if first is None or second is None:
+            return None
+        meet = self.__lca(first, second)
+        parents = self._parents
+        coords = self._grid.coords
+
+        pathway: Pathway = []
+        point = first
+        while point != meet:
+            pathway.append(coords(point))
+            point = parents[point]
+        pathway.append(coords(meet))
+        back: Pathway = []
+        point = second
+        while point != meet:
+            back.append(coords(point))
+            point = parents[point]
+        back.reverse()
+        pathway.extend(back)
+        return pathway
+
+    def path_lengths(self, sources: Sequence[Coords],
+                     targets: Sequence[Coords]) -> Any:
+        """
+        Returns the number of steps between every pair of cells of
+        ``sources`` and ``targets`` as a ``numpy`` array, with -1 for the
+        pairs that are not connected.
+
+        Notes
+        -----
+        Every jump is done for all the pairs at once, so this is much
+        faster than calling ``path_length`` for many pairs.
+        """
+        import numpy as np
+
+        if len(sources) != len(targets):
+            raise MazeError("Sources and targets must have the same length!")
+        width = self._grid.get_width()
+        height = self._grid.get_height()
+        first = np.asarray(sources, dtype=np.int64).reshape(-1, 2)
+        second = np.asarray(targets, dtype=np.int64).reshape(-1, 2)
+        inside = np.ones(len(first), dtype=np.bool_)
+        for pairs in (first, second):
+            inside &= ((pairs[:, 0] >= 1) & (pairs[:, 0] <= width)
+                       & (pairs[:, 1] >= 1) & (pairs[:, 1] <= height))
+        a = np.where(inside, (first[:, 1] - 1) * width + first[:, 0] - 1, 0)
+        b = np.where(inside, (second[:, 1] - 1) * width + second[:, 0] - 1,
+                     0)
+        depths = self._depths_np
+        valid = inside & (depths[a] >= 0) & (depths[b] >= 0)
+
+        # Always going up from the deepest cell
+        swap = depths[a] < depths[b]
+        a, b = np.where(swap, b, a), np.where(swap, a, b)
+        diff = depths[a] - depths[b]
+        total = depths[a] + depths[b]
+        table = self._table
+        for k in range(len(table)):
+            jump = (diff >> k & 1).astype(np.bool_)
+            a[jump] = table[k][a[jump]]
+        for k in range(len(table) - 1, -1, -1):
+            apart = table[k][a] != table[k][b]
+            a[apart] = table[k][a[apart]]
+            b[apart] = table[k][b[apart]]
+        meet = np.where(a == b, a, table[0][a])
+        return np.where(valid, total - 2 * depths[meet], -1)
+
+    def __point(self, coords: Coords) -> Optional[int]:
+        grid = self._grid
+        if not grid.contains(coords):
+            return None
+        point = grid.index(coords)
+        if self._depths[point] < 0:
+            return None
+        return point
+
+    def __lca(self, a: int, b: int) -> int:
+        """
+        Returns the lowest common ancestor of two cell indices of the tree.
+        """
+        depths = self._depths
+        levels = self._levels
+        if depths[a] < depths[b]:
+            a, b = b, a
+        diff = depths[a] - depths[b]
+        k = 0
+        while diff:
+            if diff & 1:
+                a = levels[k][a]
+            diff >>= 1
+            k += 1
+        if a == b:
+            return a
+        for level in reversed(levels):
+            if level[a] != level[b]:
+                a = level[a]
+                b = level[b]
+        return self._parents[a]
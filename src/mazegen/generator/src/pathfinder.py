@@ -2,95 +2,898 @@
 
 # Main imports
 from .maze import Maze
-from .gen_types import Coords, Pathway
-from .predefined import POSSIBLE_DIRECTIONS
+from .cell_grid import CellGrid
+from .exceptions import MazeError
+from .gen_types import ByteBuffer, Coords, Pathway
+from .predefined import DIRECTION_OFFSETS
 
 # Other imports
-from random import shuffle
+from array import array
+from collections import deque
+from collections.abc import Collection, Iterable
+from heapq import heappush, heappop
+from threading import local
+from typing import Any, Optional, TypeAlias
+
+# Path of ``k_shortest_paths`` a candidate branched from, position of its
+# spur in it, cells of its detour and position where it joins it again
+PathCandidate: TypeAlias = tuple[int, int, list[int], int]
+
+
+class SearchBuffers:
+    """
+    Flat arrays reused by the point to point searches of ``PathFinder``,
+    so a search doesn't allocate or clear buffers the size of the maze.
+
+    Every search takes new stamps from ``begin`` and a cell only counts
+    as seen or closed if its entry in ``seen`` or ``closed`` holds one of
+    them. Entries left by older searches have older stamps, so they are
+    ignored without being cleared. ``parents`` and ``costs`` are only
+    meaningful for the cells seen with the current stamps.
+
+    Parameters
+    ----------
+    size: int
+        Number of cells of the largest maze searched.
+    """
+
+    # Largest stamp, the buffers are cleared when it's reached
+    MAX_STAMP = 0xFFFFFFFF
+
+    def __init__(self, size: int) -> None:
+        self.seen = array("I", [0]) * size
+        self.closed = array("I", [0]) * size
+        self.parents = array("i", [CellGrid.NO_NEIGHBOR]) * size
+        self.costs = array("i", [0]) * size
+        self._stamp = 0
+
+    def __len__(self) -> int:
+        return len(self.seen)
+
+    def begin(self, stamps: int = 1) -> int:
+        """
+        Returns the first of ``stamps`` new consecutive stamps, never used
+        before in these buffers.
+        """
+        if self._stamp + stamps > SearchBuffers.MAX_STAMP:
+            size = len(self.seen)
+            self.seen = array("I", [0]) * size
+            self.closed = array("I", [0]) * size
+            self._stamp = 0
+        first = self._stamp + 1
+        self._stamp += stamps
+        return first
 
 
 class PathFinder:
 
+    # Search buffers of every thread, see ``search_buffers``
+    _buffers = local()
+
+    # Dead end filling rounds with fewer dead ends are finished one cell at
+    # a time, see ``dead_end_filling``
+    MIN_FILLING_ROUND = 64
+
+    # Rolling hash of the candidate paths of ``k_shortest_paths``, modulo a
+    # Mersenne prime
+    PATH_HASH_BASE = 0x5DEECE66D
+    PATH_HASH_MODULUS = (1 << 61) - 1
+
     @classmethod
-    def path_finder_dfs(cls, maze: Maze) -> list[Pathway]:
+    def k_shortest_paths(cls, maze: Maze, k: int) -> list[Pathway]:
         """
-        Find possible paths from the maze entry to the exit.
-
-        This method explores the maze using a randomized depth-first traversal
-        constrained by the current cell wall configuration. Multiple distinct
-        paths may be discovered, up to a predefined attempt limit.
+        Find the ``k`` shortest paths from the maze entry to the exit that
+        never go through the same cell twice, with Yen's algorithm.
 
         Parameters
         ----------
         maze : Maze
-            Maze instance providing dimensions and entry/exit coordinates.
-        cells : dict[Coords, Cell_State]
-            Mapping of cell coordinates to their current state, including wall
-            configuration.
+            Maze instance providing the walls and the entry and exit.
+        k : int
+            Most paths returned.
 
         Returns
         -------
         pathways : list[Pathway]
-            List of unique paths from entry to exit. Each path is represented
-            as an ordered sequence of coordinates. At least one path will
-            always be found if the cell states were not changed.
+            Distinct paths from entry to exit, shortest first. Fewer than
+            ``k`` are returned if the maze doesn't have that many, so a
+            perfect maze always gives its only path.
+
+        Raises
+        ------
+        MazeError
+            If ``k`` is lower than 1.
 
         Notes
         -----
-        - The search is bounded by ``Maze.PATH_ATTEMPTS`` to avoid infinite
-        loops.
-        - Paths are discovered using random direction ordering, so results
-        are non-deterministic.
-        - Cells marked as dead ends are temporarily excluded from exploration
-        to improve performance.
+        Every path after the first one branches from one of the cells of
+        the previous path, its spur, with the cells before it and the
+        branches already taken by the found paths blocked. Each spur is an
+        A* search guided by the exact distance to the exit, computed once
+        with ``distance_field``, over the walls left by dead end filling
+        since a path never goes through a dead end. It stops as soon as it
+        reaches a cell of the previous path from which the rest of that
+        path is a shortest path to the exit, so it only walks the detour.
+
+        A candidate path is only kept as the path it branched from, the
+        position of its spur, its detour and the position where it joins
+        that path again, and is only built when it is taken from the
+        heap. Candidates are deduplicated with a rolling hash of their
+        cells, computed from the prefix hashes of the path they branched
+        from, and compared cell by cell when two hashes are equal.
+
+        With Lawler's refinement, a path only branches from the cells
+        after the one where it branched from its own previous path: the
+        branches from the cells before are the ones already found for
+        that previous path.
+
+        At most ``k`` times the length of the paths spur searches are run,
+        each one visiting every cell at most once, so the running time is
+        bounded and doesn't depend on the random generator of the maze.
+
+        References
+        ----------
+        https://en.wikipedia.org/wiki/Yen%27s_algorithm
 
         See Also
         --------
-        dfs_generation : Maze generation using depth-first search.
-        """
-        # Initializing variables
-        entry = maze.get_entry()
-        exit = maze.get_exit()
-        cells = maze.get_cells()
-
-        attempts = 0
-        point = entry
-
-        directions = list(POSSIBLE_DIRECTIONS)
-        pathways: list[Pathway] = []
-        passed_cells: list[Coords] = [point]
-        wrong_cells: set[Coords] = set()
-        adjacents = maze.get_adjacent_cells(point)
-
-        print("Finding possible paths...")
-        while attempts < Maze.PATH_ATTEMPTS:
-            moved = False
-            shuffle(directions)
-
-            for dir in directions:
-                adjacent = adjacents[dir]
-                if not adjacent or adjacent in passed_cells:
+        shortest_path : The shortest path only.
+        """
+        if k < 1:
+            raise MazeError("Number of paths can't be lower than 1!")
+        grid = maze.get_grid()
+        start = grid.index(maze.get_entry())
+        goal = grid.index(maze.get_exit())
+        field = maze.distance_field(maze.get_exit())
+        if field[start] < 0:
+            return []
+        if start == goal:
+            return [[maze.get_entry()]]
+        buffers = cls.search_buffers(grid.get_size())
+        base = cls.PATH_HASH_BASE
+        modulus = cls.PATH_HASH_MODULUS
+        # No path goes through a dead end, so the spurs don't look there
+        walls = cls.__fill_dead_ends(grid, start, goal)[1].tobytes()
+
+        first = cls.__spur_search(grid, walls, field, buffers,
+                                  buffers.begin(), start, (), {goal: 0})
+        if first is None:
+            return []
+        found = [first[0] + [goal]]
+        # Cell where every found path branched from the one it came from
+        branches = [0]
+        # Candidates by hash, the found paths being their own candidate
+        known: dict[int, list[PathCandidate]] = {
+            cls.__path_hash(found[0]): [(0, 0, [], 0)]}
+        candidates: list[tuple[int, int, int, list[int], int]] = []
+        while len(found) < k:
+            parent = len(found) - 1
+            previous = found[parent]
+            length = len(previous)
+            # How many first cells every found path shares with the last one
+            shared = []
+            for path in found:
+                same = 0
+                for a, b in zip(path, previous):
+                    if a != b:
+                        break
+                    same += 1
+                shared.append(same)
+
+            prefixes = [0]
+            for point in previous:
+                prefixes.append((prefixes[-1] * base + point + 1) % modulus)
+            # Cells from which the rest of the path is a shortest one
+            rest = length - 1
+            while rest > 0 and field[previous[rest - 1]] == length - rest:
+                rest -= 1
+            tail = {previous[m]: m for m in range(rest, length)}
+
+            # The spurs are searched from the last cell back, each with a
+            # newer stamp, and every cell of the path is marked closed once
+            # with the stamp of the spur at its position: for a spur, the
+            # cells before it hold newer stamps and count as closed
+            stamp = buffers.begin(length)
+            closed = buffers.closed
+            for i in range(length - 1):
+                closed[previous[i]] = stamp + length - 2 - i
+            for j in range(length - 2, branches[-1] - 1, -1):
+                # Branches already taken from this same root
+                taken = {path[j + 1] for path, same in zip(found, shared)
+                         if same > j and len(path) > j + 1}
+                spur = cls.__spur_search(grid, walls, field, buffers,
+                                         stamp + length - 2 - j, previous[j],
+                                         taken, tail)
+                if spur is None:
                     continue
-                if cells[point]["state"] & Maze.WALLS[dir]:
+                detour, rejoin = spur
+                key = prefixes[j]
+                for point in detour:
+                    key = (key * base + point + 1) % modulus
+                power = pow(base, length - rejoin, modulus)
+                key = (key * power + prefixes[length]
+                       - prefixes[rejoin] * power) % modulus
+
+                candidate: PathCandidate = (parent, j, detour, rejoin)
+                same_hash = known.setdefault(key, [])
+                if same_hash:
+                    path = cls.__candidate_path(found, candidate)
+                    if any(cls.__candidate_path(found, other) == path
+                           for other in same_hash):
+                        continue
+                same_hash.append(candidate)
+                heappush(candidates, (j + len(detour) + length - rejoin,
+                                      parent, j, detour, rejoin))
+            if not candidates:
+                break
+            _, parent, branch, detour, rejoin = heappop(candidates)
+            found.append(cls.__candidate_path(
+                found, (parent, branch, detour, rejoin)))
+            branches.append(branch)
+        return [[grid.coords(i) for i in path] for path in found]
+
+    @classmethod
+    def __path_hash(cls, path: Iterable[int]) -> int:
+        """
+        Returns the rolling hash of the given cells, see
+        ``k_shortest_paths``.
+        """
+        key = 0
+        for point in path:
+            key = (key * cls.PATH_HASH_BASE + point + 1) % (
+                cls.PATH_HASH_MODULUS)
+        return key
+
+    @staticmethod
+    def __candidate_path(found: list[list[int]],
+                         candidate: PathCandidate) -> list[int]:
+        """
+        Builds the cells of a candidate path of ``k_shortest_paths``.
+        """
+        parent, branch, detour, rejoin = candidate
+        path = found[parent]
+        return path[:branch] + detour + path[rejoin:]
+
+    @staticmethod
+    def __spur_search(grid: CellGrid, walls: ByteBuffer, field: array,
+                      buffers: SearchBuffers, stamp: int, start: int,
+                      taken: Collection[int],
+                      tail: dict[int, int]) -> Optional[tuple[list[int],
+                                                              int]]:
+        """
+        Returns a shortest path from ``start`` to the goal through the
+        given ``walls`` of the grid, that avoids the cells marked closed
+        in ``buffers`` with ``stamp`` or a newer one and doesn't leave
+        ``start`` through the ``taken`` ones, or ``None``.
+
+        ``tail`` gives the position, in a path to the goal, of the cells
+        from which the rest of that path is a shortest path. The search
+        stops at the first of them it reaches, other than ``start``, and
+        returns the cells before it with its position.
+
+        Same two stacks A* as ``astar``, with the distances to the goal of
+        ``field`` as the estimate: in a grid two adjacent cells are always
+        one step closer or further from any cell. Every cell taken from
+        the stacks has the lowest estimate of the search, so joining the
+        rest of the path from it gives a shortest path.
+        """
+        moves = tuple(zip(CellGrid.WALL_BITS, grid.get_neighbors()))
+        seen = buffers.seen
+        closed = buffers.closed
+        parents = buffers.parents
+        costs = buffers.costs
+
+        seen[start] = stamp
+        closed[start] = 0
+        parents[start] = start
+        costs[start] = 0
+        current = array("i", [start])
+        later = array("i")
+        while current:
+            while current:
+                point = current.pop()
+                if closed[point] >= stamp:
                     continue
-                elif (adjacent not in wrong_cells):
-                    point = adjacent
-                    passed_cells.append(point)
-                    adjacents = maze.get_adjacent_cells(point)
-                    moved = True
+                closed[point] = stamp
+                rejoin = tail.get(point) if point != start else None
+                if rejoin is not None:
+                    detour = array("i")
+                    while point != start:
+                        point = parents[point]
+                        detour.append(point)
+                    return (detour.tolist()[::-1], rejoin)
+                state = walls[point]
+                cost = costs[point] + 1
+                distance = field[point]
+                for bit, table in moves:
+                    if state & bit:
+                        continue
+                    adjacent = table[point]
+                    if adjacent < 0 or closed[adjacent] >= stamp:
+                        continue
+                    if point == start and adjacent in taken:
+                        continue
+                    if seen[adjacent] == stamp and costs[adjacent] <= cost:
+                        continue
+                    seen[adjacent] = stamp
+                    parents[adjacent] = point
+                    costs[adjacent] = cost
+                    if field[adjacent] < distance:
+                        current.append(adjacent)
+                    else:
+                        later.append(adjacent)
+            current, later = later, current
+        return None
+
+    @classmethod
+    def shortest_path(cls, maze: Maze, src: Coords,
+                      dst: Coords) -> Optional[Pathway]:
+        """
+        Find the shortest path between two cells with a breadth-first
+        search over the wall buffer.
+
+        Parameters
+        ----------
+        maze : Maze
+            Maze instance whose walls will be followed.
+        src : Coords
+            Starting cell of the path.
+        dst : Coords
+            Cell to be reached.
+
+        Returns
+        -------
+        pathway : Pathway or None
+            Ordered coordinates from ``src`` to ``dst``, both included, or
+            ``None`` if ``dst`` can't be reached from ``src``.
+
+        Raises
+        ------
+        MazeError
+            If ``src`` or ``dst`` are not inside the maze.
+
+        Notes
+        -----
+        Every cell is visited at most once, with its parent stored in a
+        flat ``array``, so the search is O(cells) and the returned path is
+        always one of the shortest ones, even in mazes with loops.
+
+        See Also
+        --------
+        k_shortest_paths : The shortest paths from the entry to the exit.
+        """
+        return cls.grid_shortest_path(maze.get_grid(), src, dst)
+
+    @classmethod
+    def grid_shortest_path(cls, grid: CellGrid, src: Coords,
+                           dst: Coords) -> Optional[Pathway]:
+        """
+        Same as ``shortest_path``, but over a bare ``CellGrid``, so it can
+        be used by the generators before the ``Maze`` has its grid.
+        """
+        if not grid.contains(src) or not grid.contains(dst):
+            raise MazeError("Path endpoints must be inside the maze!")
+        walls = grid.get_walls()
+        moves = tuple(zip(CellGrid.WALL_BITS, grid.get_neighbors()))
+        start = grid.index(src)
+        goal = grid.index(dst)
+
+        parents = array("i", [CellGrid.NO_NEIGHBOR]) * grid.get_size()
+        parents[start] = start
+        queue = deque([start])
+        while queue:
+            point = queue.popleft()
+            if point == goal:
+                break
+            state = walls[point]
+            for bit, table in moves:
+                if state & bit:
+                    continue
+                adjacent = table[point]
+                if adjacent >= 0 and parents[adjacent] < 0:
+                    parents[adjacent] = point
+                    queue.append(adjacent)
+        if parents[goal] < 0:
+            return None
+
+        # Going back from the goal through the parents
+        point = goal
+        pathway: Pathway = [dst]
+        while point != start:
+            point = parents[point]
+            pathway.append(grid.coords(point))
+        pathway.reverse()
+        return pathway
+
+    @classmethod
+    def search_buffers(cls, size: int) -> SearchBuffers:
+        """
+        Returns the ``SearchBuffers`` of the current thread, grown to at
+        least ``size`` cells if needed.
+        """
+        buffers: Optional[SearchBuffers] = getattr(cls._buffers, "buffers",
+                                                   None)
+        if buffers is None or len(buffers) < size:
+            buffers = SearchBuffers(size)
+            cls._buffers.buffers = buffers
+        return buffers
+
+    @classmethod
+    def astar(cls, maze: Maze, src: Coords, dst: Coords) -> Optional[Pathway]:
+        """
+        Find the shortest path between two cells with an A* search guided
+        by the Manhattan distance to ``dst``.
+
+        Parameters
+        ----------
+        maze : Maze
+            Maze instance whose walls will be followed.
+        src : Coords
+            Starting cell of the path.
+        dst : Coords
+            Cell to be reached.
+
+        Returns
+        -------
+        pathway : Pathway or None
+            Ordered coordinates from ``src`` to ``dst``, both included, or
+            ``None`` if ``dst`` can't be reached from ``src``.
+
+        Raises
+        ------
+        MazeError
+            If ``src`` or ``dst`` are not inside the maze.
+
+        Notes
+        -----
+        Every step costs 1 and changes the Manhattan distance by 1, so the
+        estimate of a neighbour is either the same as the one of the cell
+        or 2 more. The open cells are then kept in two flat ``array``
+        stacks, one per estimate, instead of a binary heap: pushing and
+        popping are O(1) and the cells are still expanded from the lowest
+        estimate up. Cells of the current estimate are expanded last in
+        first out, which goes deeper first on ties.
+
+        The distance is only a good guide when the maze has loops. In a
+        perfect maze the search still returns the only path, but it's not
+        faster than ``shortest_path``.
+
+        See Also
+        --------
+        shortest_path : Breadth-first search.
+        bidirectional_search : Breadth-first search from both ends.
+        """
+        grid = maze.get_grid()
+        if not grid.contains(src) or not grid.contains(dst):
+            raise MazeError("Path endpoints must be inside the maze!")
+        walls = grid.get_walls()
+        moves = tuple(zip(range(4), CellGrid.WALL_BITS, grid.get_neighbors()))
+        width = grid.get_width()
+        start = grid.index(src)
+        goal = grid.index(dst)
+        # Zero based, like the rows and columns of the cell indices
+        goal_x = dst[0] - 1
+        goal_y = dst[1] - 1
+
+        buffers = cls.search_buffers(grid.get_size())
+        stamp = buffers.begin()
+        seen = buffers.seen
+        closed = buffers.closed
+        parents = buffers.parents
+        costs = buffers.costs
+
+        seen[start] = stamp
+        parents[start] = start
+        costs[start] = 0
+        current = array("i", [start])
+        later = array("i")
+        found = False
+        while current:
+            while current:
+                point = current.pop()
+                if closed[point] == stamp:
+                    continue
+                closed[point] = stamp
+                if point == goal:
+                    found = True
                     break
-            if not moved:
-                passed_cells.pop()
-                if point != exit:
-                    wrong_cells.add(point)
-                point = passed_cells[-1]
-                adjacents = maze.get_adjacent_cells(point)
-            elif point == exit:
-                attempts += 1
-                if passed_cells not in pathways:
-                    pathways.append(passed_cells.copy())
-                passed_cells.clear()
-                point = entry
-                passed_cells.append(entry)
-                adjacents = maze.get_adjacent_cells(point)
-        return pathways
+                state = walls[point]
+                cost = costs[point] + 1
+                # Directions getting closer to the goal: N, E, S, W
+                y, x = divmod(point, width)
+                closer = (y > goal_y, x < goal_x, y < goal_y, x > goal_x)
+                for dir, bit, table in moves:
+                    if state & bit:
+                        continue
+                    adjacent = table[point]
+                    if adjacent < 0 or closed[adjacent] == stamp:
+                        continue
+                    if seen[adjacent] == stamp and costs[adjacent] <= cost:
+                        continue
+                    seen[adjacent] = stamp
+                    parents[adjacent] = point
+                    costs[adjacent] = cost
+                    # Getting closer to the goal keeps the same estimate
+                    if closer[dir]:
+                        current.append(adjacent)
+                    else:
+                        later.append(adjacent)
+            if found:
+                break
+            current, later = later, current
+        if not found:
+            return None
+        return cls.__follow_parents(grid, parents, start, goal)
+
+    @classmethod
+    def bidirectional_search(cls, maze: Maze, src: Coords,
+                             dst: Coords) -> Optional[Pathway]:
+        """
+        Find the shortest path between two cells with two breadth-first
+        searches, one from each end, until they meet.
+
+        Parameters
+        ----------
+        maze : Maze
+            Maze instance whose walls will be followed.
+        src : Coords
+            Starting cell of the path.
+        dst : Coords
+            Cell to be reached.
+
+        Returns
+        -------
+        pathway : Pathway or None
+            Ordered coordinates from ``src`` to ``dst``, both included, or
+            ``None`` if ``dst`` can't be reached from ``src``.
+
+        Raises
+        ------
+        MazeError
+            If ``src`` or ``dst`` are not inside the maze.
+
+        Notes
+        -----
+        The side with the smallest frontier expands a whole level at a
+        time. Both sides share the buffers of ``search_buffers``, each one
+        with its own stamp in ``seen``, so meeting the other side is a
+        single comparison. When they meet, the shortest of the joins found
+        in that level is kept.
+
+        In a maze with loops each side only has to reach about half the
+        distance, so far fewer cells are visited than with
+        ``shortest_path``.
+
+        See Also
+        --------
+        shortest_path : Breadth-first search from ``src`` only.
+        astar : Search guided by the distance to ``dst``.
+        """
+        grid = maze.get_grid()
+        if not grid.contains(src) or not grid.contains(dst):
+            raise MazeError("Path endpoints must be inside the maze!")
+        walls = grid.get_walls()
+        moves = tuple(zip(CellGrid.WALL_BITS, grid.get_neighbors()))
+        start = grid.index(src)
+        goal = grid.index(dst)
+        if start == goal:
+            return [src]
+
+        buffers = cls.search_buffers(grid.get_size())
+        forward_stamp = buffers.begin(2)
+        backward_stamp = forward_stamp + 1
+        seen = buffers.seen
+        parents = buffers.parents
+        costs = buffers.costs
+
+        for point, stamp in ((start, forward_stamp), (goal, backward_stamp)):
+            seen[point] = stamp
+            parents[point] = point
+            costs[point] = 0
+        frontiers = {forward_stamp: array("i", [start]),
+                     backward_stamp: array("i", [goal])}
+        best = -1
+        meeting = (CellGrid.NO_NEIGHBOR, CellGrid.NO_NEIGHBOR)
+        while best < 0 and frontiers[forward_stamp] and \
+                frontiers[backward_stamp]:
+            # Expanding the smallest frontier
+            stamp = (forward_stamp if len(frontiers[forward_stamp])
+                     <= len(frontiers[backward_stamp]) else backward_stamp)
+            other_stamp = backward_stamp if stamp == forward_stamp \
+                else forward_stamp
+            next_frontier = array("i")
+            for point in frontiers[stamp]:
+                state = walls[point]
+                cost = costs[point] + 1
+                for bit, table in moves:
+                    if state & bit:
+                        continue
+                    adjacent = table[point]
+                    if adjacent < 0:
+                        continue
+                    mark = seen[adjacent]
+                    if mark == other_stamp:
+                        length = cost + costs[adjacent]
+                        if best < 0 or length < best:
+                            best = length
+                            meeting = (point, adjacent) \
+                                if stamp == forward_stamp \
+                                else (adjacent, point)
+                    elif mark != stamp:
+                        seen[adjacent] = stamp
+                        parents[adjacent] = point
+                        costs[adjacent] = cost
+                        next_frontier.append(adjacent)
+            frontiers[stamp] = next_frontier
+        if best < 0:
+            return None
+
+        # Joining both halves through the cells where they met
+        pathway = cls.__follow_parents(grid, parents, start, meeting[0])
+        back = cls.__follow_parents(grid, parents, goal, meeting[1])
+        back.reverse()
+        pathway.extend(back)
+        return pathway
+
+    @staticmethod
+    def __follow_parents(grid: CellGrid, parents: array, start: int,
+                         point: int) -> Pathway:
+        """
+        Returns the pathway from ``start`` to ``point`` going back through
+        the parents left by a search from ``start``.
+        """
+        pathway: Pathway = [grid.coords(point)]
+        while point != start:
+            point = parents[point]
+            pathway.append(grid.coords(point))
+        pathway.reverse()
+        return pathway
+
+    @classmethod
+    def dead_end_filling(cls, maze: Maze) -> Any:
+        """
+        Solve the maze without searching it: every dead end, a cell with
+        three walls, is sealed and the cells behind it become dead ends in
+        turn, until only the ways between the entry and the exit are left.
+
+        Parameters
+        ----------
+        maze : Maze
+            Maze instance whose walls will be followed. It isn't modified.
+
+        Returns
+        -------
+        remaining : numpy.ndarray
+            Boolean array of ``(height, width)`` with the cells that were
+            not filled. In a perfect maze those are the cells of the path
+            from the entry to the exit. In a maze with loops they are every
+            cell of the loops and corridors that can be part of a path
+            between them.
+
+        Notes
+        -----
+        Every round is done with ``numpy`` over all the dead ends found at
+        once: their only open wall is closed from the other side too, on a
+        copy of the walls. The first round checks the whole grid, and the
+        next ones only the cells next to the ones just filled, since no
+        other cell gained a wall.
+
+        The number of rounds is the length of the longest dead end branch,
+        which can be most of the maze in long corridors, like the ones of
+        ``dfs_generation``, with only a few cells each. Once a round has
+        fewer than ``MIN_FILLING_ROUND`` dead ends, the rest are filled one
+        by one from a plain list, which costs less than a round per cell.
+
+        The entry and the exit are never filled, and neither are the cells
+        of the 42 logo counted as part of the maze.
+
+        See Also
+        --------
+        dead_end_solution : The path left in a perfect maze.
+        shortest_path : Breadth-first search of the shortest path.
+        """
+        grid = maze.get_grid()
+        return cls.__fill_dead_ends(
+            grid, grid.index(maze.get_entry()), grid.index(maze.get_exit())
+        )[0].reshape(maze.get_height(), maze.get_width())
+
+    @classmethod
+    def dead_end_solution(cls, maze: Maze) -> Optional[Pathway]:
+        """
+        Returns the path from the entry to the exit left by
+        ``dead_end_filling`` in a perfect maze, or ``None`` if they are not
+        connected.
+
+        Raises
+        ------
+        MazeError
+            If the cells left have more than one way, because the maze has
+            loops between the entry and the exit.
+        """
+        return cls.grid_dead_end_solution(maze.get_grid(), maze.get_entry(),
+                                          maze.get_exit())
+
+    @classmethod
+    def grid_dead_end_solution(cls, grid: CellGrid, src: Coords,
+                               dst: Coords) -> Optional[Pathway]:
+        """
+        Same as ``dead_end_solution`` between any two cells of a bare
+        ``CellGrid``, so the generators of perfect mazes can use it before
+        the ``Maze`` has its grid.
+        """
+        if not grid.contains(src) or not grid.contains(dst):
+            raise MazeError("Path endpoints must be inside the maze!")
+        neighbors = grid.get_neighbors()
+        bits = CellGrid.WALL_BITS
+        start = grid.index(src)
+        goal = grid.index(dst)
+        walls = cls.__fill_dead_ends(grid, start, goal)[1]
+
+        # Walking the cells left, never going back
+        pathway: Pathway = [src]
+        previous = CellGrid.NO_NEIGHBOR
+        point = start
+        while point != goal:
+            state = int(walls[point])
+            ways = [neighbors[dir][point] for dir in range(4)
+                    if not state & bits[dir]
+                    and neighbors[dir][point] >= 0
+                    and neighbors[dir][point] != previous]
+            if not ways:
+                return None
+            if len(ways) > 1:
+                raise MazeError("Dead end filling only leaves a single path "
+                                "in perfect mazes!")
+            previous, point = point, ways[0]
+            pathway.append(grid.coords(point))
+        return pathway
+
+    @staticmethod
+    def __fill_dead_ends(grid: CellGrid, start: int,
+                         goal: int) -> tuple[Any, Any]:
+        """
+        Returns the flat boolean array of the cells not filled by
+        ``dead_end_filling``, keeping the ``start`` and ``goal`` cell
+        indices, and the walls with the filled ones sealed.
+        """
+        import numpy as np
+
+        walls = np.frombuffer(grid.get_walls(), dtype=np.uint8).copy()
+        remaining = ~np.frombuffer(grid.get_fixed(), dtype=np.bool_)
+        neighbors = [np.frombuffer(table, dtype=np.int32)
+                     for table in grid.get_neighbors()]
+        ends = np.array([start, goal])
+        # Walls open on the border lead nowhere, so they count as closed
+        for bit, table in zip(CellGrid.WALL_BITS, neighbors):
+            walls[table < 0] |= bit
+        kept = np.zeros(len(walls), dtype=np.bool_)
+        kept[ends] = True
+
+        candidates = np.flatnonzero(remaining & ~kept)
+        while len(candidates):
+            dead = candidates[remaining[candidates] & ~kept[candidates]
+                              & (np.bitwise_count(walls[candidates]) >= 3)]
+            if len(dead) < PathFinder.MIN_FILLING_ROUND:
+                return PathFinder.__fill_one_by_one(
+                    grid, walls, remaining, dead.tolist(),
+                    ends.tolist())
+            remaining[dead] = False
+
+            # Closing the only open wall of every dead end from the other
+            # side. Cells sealed from many sides get one direction at once,
+            # so no cell is written twice in the same assignment. Walls open
+            # on the border have no other side
+            sealed = []
+            state = walls[dead]
+            for bit, op_bit, table in zip(CellGrid.WALL_BITS,
+                                          CellGrid.OPPOSITE_WALL_BITS,
+                                          neighbors):
+                others = table[dead[(state & bit) == 0]]
+                others = others[others >= 0]
+                walls[others] |= op_bit
+                sealed.append(others)
+            candidates = np.concatenate(sealed)
+        return remaining, walls
+
+    @staticmethod
+    def __fill_one_by_one(grid: CellGrid, walls: Any, remaining: Any,
+                          dead: list[int], ends: list[int]
+                          ) -> tuple[Any, Any]:
+        """
+        Finishes ``__fill_dead_ends`` from the given dead ends, one cell at a
+        time over plain buffers.
+        """
+        import numpy as np
+
+        cells = bytearray(walls.tobytes())
+        left = bytearray(remaining.tobytes())
+        moves = tuple(zip(CellGrid.WALL_BITS, CellGrid.OPPOSITE_WALL_BITS,
+                          grid.get_neighbors()))
+        counts = [bin(state).count("1") for state in range(16)]
+        while dead:
+            point = dead.pop()
+            if not left[point] or point in ends:
+                continue
+            state = cells[point]
+            if counts[state] < 3:
+                continue
+            left[point] = False
+            for bit, op_bit, table in moves:
+                if not state & bit:
+                    adjacent = table[point]
+                    if adjacent < 0:
+                        continue
+                    cells[adjacent] |= op_bit
+                    dead.append(adjacent)
+        return (np.frombuffer(left, dtype=np.bool_),
+                np.frombuffer(cells, dtype=np.uint8))
+
+    @classmethod
+    def directions_of(cls, pathway: Pathway) -> list[str]:
+        """
+        Returns the directions followed to walk the given pathway, the
+        inverse of ``Maze.follow_directions``.
+
+        Raises
+        ------
+        MazeError
+            If two consecutive cells of the pathway are not adjacent.
+        """
+        by_offset = {offset: direction
+                     for direction, offset in DIRECTION_OFFSETS.items()}
+        directions: list[str] = []
+        for (x0, y0), (x1, y1) in zip(pathway, pathway[1:]):
+            direction = by_offset.get((x1 - x0, y1 - y0))
+            if direction is None:
+                raise MazeError(f"Cells {(x0, y0)} and {(x1, y1)} of the "
+                                "pathway are not adjacent!")
+            directions.append(direction)
+        return directions
+
+    @classmethod
+    def distance_field(cls, maze: Maze, target: Coords) -> array:
+        """
+        Computes the distance from every cell to the given target with a
+        single breadth-first search.
+
+        Parameters
+        ----------
+        maze : Maze
+            Maze instance whose walls will be followed.
+        target : Coords
+            Cell every distance is measured to.
+
+        Returns
+        -------
+        distances : array
+            Flat ``array`` indexed like the ``CellGrid`` buffers, with the
+            number of steps from each cell to ``target``, or
+            ``CellGrid.NO_NEIGHBOR`` for cells that can't reach it.
+
+        Raises
+        ------
+        MazeError
+            If ``target`` is not inside the maze.
+        """
+        grid = maze.get_grid()
+        if not grid.contains(target):
+            raise MazeError("Distance target must be inside the maze!")
+        walls = grid.get_walls()
+        moves = tuple(zip(CellGrid.WALL_BITS, grid.get_neighbors()))
+        start = grid.index(target)
+
+        distances = array("i", [CellGrid.NO_NEIGHBOR]) * grid.get_size()
+        distances[start] = 0
+        queue = deque([start])
+        while queue:
+            point = queue.popleft()
+            state = walls[point]
+            distance = distances[point] + 1
+            for bit, table in moves:
+                if state & bit:
+                    continue
+                adjacent = table[point]
+                if adjacent >= 0 and distances[adjacent] < 0:
+                    distances[adjacent] = distance
+                    queue.append(adjacent)
+        return distances
@@ -1,5 +1,7 @@
 #!/bin/env python3
 
+from itertools import permutations
+
 NORTH = "N"
 SOUTH = "S"
 EAST = "E"
@@ -7,3 +9,19 @@ WEST = "W"
 POSSIBLE_DIRECTIONS = (NORTH, EAST, SOUTH, WEST)
 OPPOSITE_DIRECTIONS = {NORTH: SOUTH, EAST: WEST,
                        SOUTH: NORTH, WEST: EAST}
+DIRECTION_OFFSETS = {NORTH: (0, -1), EAST: (1, 0),
+                     SOUTH: (0, 1), WEST: (-1, 0)}
+
+# Every possible order of the direction indices (0: N, 1: E, 2: S, 3: W),
+# so a random order can be picked with a single random call.
+DIRECTION_ORDERS = tuple(permutations(range(len(POSSIBLE_DIRECTIONS))))
+
+# Generation algorithms
+DFS = "dfs"
+ELLER = "eller"
+BINARY_TREE = "binary_tree"
+SIDEWINDER = "sidewinder"
+KRUSKAL = "kruskal"
+WILSON = "wilson"
+TILED = "tiled"
+ALGORITHMS = (DFS, ELLER, BINARY_TREE, SIDEWINDER, KRUSKAL, WILSON, TILED)
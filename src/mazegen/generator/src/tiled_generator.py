@@ -0,0 +1,261 @@
+#!/bin/env python3
+
+# Main imports
+from .maze import Maze
+from .cell_grid import CellGrid
+from .gen_types import Pathway
+from .exceptions import MazeError
+
+# Other imports
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from random import Random
+from threading import active_count
+from typing import Any, TypeAlias
+
+# Name of the shared block with the whole grid, width and height of the
+# grid, and position, width, height and seed of a tile
+TileTask: TypeAlias = tuple[str, int, int, int, int, int, int, int]
+
+
+def _shared_views(buffer: Any, width: int,
+                  height: int) -> tuple[Any, Any, Any, Any]:
+    """
+    Returns the walls, visited flags, fixed flags and group labels of a
+    grid stored in a shared block, as ``(height, width)`` ``numpy`` views.
+
+    The block holds the three byte buffers one after the other, followed
+    by the labels as 32 bit integers.
+    """
+    import numpy as np
+
+    size = width * height
+    walls, visited, fixed = (
+        np.frombuffer(buffer, dtype=np.uint8, count=size,
+                      offset=i * size).reshape(height, width)
+        for i in range(3))
+    labels = np.frombuffer(buffer, dtype=np.int32, count=size,
+                           offset=3 * size).reshape(height, width)
+    return (walls, visited, fixed, labels)
+
+
+def _generate_tile(task: TileTask) -> int:
+    """
+    Process pool worker: carves every group of free cells of one tile with
+    ``Generator.dfs_forest``, writing its walls, visited flags and group
+    labels straight into the shared grid.
+
+    Returns how many groups the tile has.
+    """
+    from .generator import Generator
+    import numpy as np
+
+    name, width, height, x0, y0, tile_width, tile_height, seed = task
+    block = SharedMemory(name=name)
+    try:
+        walls, visited, fixed, labels = _shared_views(block.buf, width,
+                                                      height)
+        region = (slice(y0, y0 + tile_height), slice(x0, x0 + tile_width))
+        size = tile_width * tile_height
+        grid = CellGrid.from_buffers(tile_width, tile_height,
+                                     bytearray([CellGrid.CLOSED]) * size,
+                                     bytes(size), fixed[region].tobytes())
+        tile_labels, groups = Generator.dfs_forest(grid, Random(seed))
+        shape = (tile_height, tile_width)
+        walls[region] = np.frombuffer(grid.get_walls(),
+                                      dtype=np.uint8).reshape(shape)
+        visited[region] = np.frombuffer(grid.get_visited(),
+                                        dtype=np.uint8).reshape(shape)
+        labels[region] = np.frombuffer(tile_labels,
+                                       dtype=np.int32).reshape(shape)
+        # The views must be gone before the block is closed
+        del walls, visited, fixed, labels
+    finally:
+        block.close()
+    return groups
+
+
+class TiledGenerator:
+    """
+    Generation of giant mazes split in square tiles, carved in parallel
+    in a pool of processes.
+
+    Every tile is carved on its own as a perfect maze of each group of its
+    free cells (more than one when the logo cuts the tile). Those groups
+    are then joined with Kruskal's algorithm over the walls along the
+    tile borders, which only opens a wall between two groups that are not
+    connected yet, so the whole maze stays perfect.
+
+    Notes
+    -----
+    Every tile gets its own seed, derived from the maze random generator
+    and from the position of the tile, so the maze only depends on the
+    seed and on the tile size, never on the number of workers.
+
+    The whole grid lives in a ``SharedMemory`` block while the tiles are
+    carved, and every worker writes its tile right into it, so only the
+    number of groups of every tile goes back through the pool.
+    """
+
+    @classmethod
+    def tile_seed(cls, base_seed: int, column: int, row: int) -> int:
+        """
+        Returns the seed of the tile at the given position.
+        """
+        return Random(f"{base_seed}:{column}:{row}").getrandbits(64)
+
+    @classmethod
+    def tiled_generation(cls, maze: Maze) -> tuple[
+                CellGrid, Pathway, list[str]]:
+        """
+        Generate a perfect maze tile by tile, see ``TiledGenerator``.
+
+        Parameters
+        ----------
+        maze : Maze
+            Maze configuration. ``get_tile_size`` gives the side of the
+            tiles and ``get_workers`` the processes used, with 1 carving
+            every tile in the current process.
+
+        Returns
+        -------
+        The same as ``Generator.dfs_generation``.
+
+        Raises
+        ------
+        MazeError
+            If the exit can't be reached from the entry.
+
+        Notes
+        -----
+        Everything but the carving of the tiles is done with ``numpy``
+        over the whole grid: numbering the groups, picking the walls
+        opened along the tile borders with ``Generator.spanning_walls``
+        and finding the pathway, the only one of a perfect maze, with
+        ``PathFinder.grid_dead_end_solution``.
+        """
+        from .generator import Generator
+        from .pathfinder import PathFinder
+        import numpy as np
+
+        grid = Generator.init_grid(maze)
+        width = grid.get_width()
+        height = grid.get_height()
+        size = grid.get_size()
+        rng = maze.get_rng()
+        tile = maze.get_tile_size()
+        base_seed = rng.getrandbits(64)
+
+        block = SharedMemory(create=True, size=7 * size)
+        try:
+            walls, visited, fixed, labels = _shared_views(block.buf, width,
+                                                          height)
+            walls[:] = np.frombuffer(grid.get_walls(),
+                                     dtype=np.uint8).reshape(height, width)
+            fixed[:] = np.frombuffer(grid.get_fixed(),
+                                     dtype=np.uint8).reshape(height, width)
+
+            # Carving every tile
+            tasks: list[TileTask] = [
+                (block.name, width, height, x0, y0, min(tile, width - x0),
+                 min(tile, height - y0), cls.tile_seed(base_seed, tx, ty))
+                for ty, y0 in enumerate(range(0, height, tile))
+                for tx, x0 in enumerate(range(0, width, tile))]
+            tile_groups = list(cls.__carve_tiles(tasks, maze.get_workers()))
+
+            # Every group gets a global number
+            groups = labels.copy()
+            total_groups = 0
+            for task, count in zip(tasks, tile_groups):
+                _, _, _, x0, y0, tile_width, tile_height, _ = task
+                region = groups[y0:y0 + tile_height, x0:x0 + tile_width]
+                region[region >= 0] += total_groups
+                total_groups += count
+
+            grid.get_walls()[:] = walls.tobytes()
+            grid.get_visited()[:] = visited.tobytes()
+            del walls, visited, fixed, labels
+        finally:
+            block.close()
+            block.unlink()
+
+        cls.__join_tiles(grid, groups.ravel(), total_groups, tile, rng)
+
+        pathway = PathFinder.grid_dead_end_solution(grid, maze.get_entry(),
+                                                    maze.get_exit())
+        if pathway is None:
+            raise MazeError("EXIT point can't be reached from ENTRY point!")
+        return (grid, pathway, PathFinder.directions_of(pathway))
+
+    @classmethod
+    def __carve_tiles(cls, tasks: list[TileTask],
+                      workers: int) -> Iterator[int]:
+        """
+        Carves every tile, yielding how many groups each one has in the
+        same order as the tasks. With a single worker or tile, no process
+        is started.
+        """
+        if workers == 1 or len(tasks) == 1:
+            yield from map(_generate_tile, tasks)
+            return
+        with ProcessPoolExecutor(max_workers=workers or None,
+                                 mp_context=cls.__pool_context()) as executor:
+            yield from executor.map(_generate_tile, tasks,
+                                    chunksize=max(1, len(tasks) // 64))
+
+    @staticmethod
+    def __pool_context() -> BaseContext | None:
+        """
+        Returns how the worker processes are started. Forking while other
+        threads run (e.g. mazes built in a thread pool) can copy a lock
+        another thread holds and hang the child, so the processes are then
+        forked from a separate server instead.
+        """
+        if active_count() > 1 and "forkserver" in get_all_start_methods():
+            return get_context("forkserver")
+        return None
+
+    @classmethod
+    def __join_tiles(cls, grid: CellGrid, groups: Any, total_groups: int,
+                     tile: int, rng: Random) -> None:
+        """
+        Opens walls along the tile borders, in random order, until every
+        group that can be joined is.
+        """
+        from .generator import Generator
+        import numpy as np
+
+        width = grid.get_width()
+        height = grid.get_height()
+        north, east, south, west = CellGrid.WALL_BITS
+
+        # Walls between two tiles, 2 * i being the east wall of the cell i
+        # and 2 * i + 1 its south wall
+        east_cells = (np.arange(tile - 1, width - 1, tile)[:, None]
+                      + np.arange(height)[None, :] * width).ravel()
+        south_cells = (np.arange(tile - 1, height - 1, tile)[:, None]
+                       * width + np.arange(width)[None, :]).ravel()
+        east_cells = east_cells[(groups[east_cells] >= 0)
+                                & (groups[east_cells + 1] >= 0)]
+        south_cells = south_cells[(groups[south_cells] >= 0)
+                                  & (groups[south_cells + width] >= 0)]
+        borders = np.concatenate((2 * east_cells,
+                                  2 * south_cells + 1)).tolist()
+        rng.shuffle(borders)
+
+        order = np.array(borders, dtype=np.int64)
+        points = order >> 1
+        is_south = (order & 1).astype(np.bool_)
+        adjacents = points + np.where(is_south, width, 1)
+        opened = Generator.spanning_walls(groups[points], groups[adjacents],
+                                          total_groups, total_groups - 1)
+
+        # Every wall is opened once, so no cell is written twice per side
+        cells = np.frombuffer(grid.get_walls(), dtype=np.uint8)
+        for side, bit, op_bit in ((False, east, west), (True, south, north)):
+            selected = opened & (is_south == side)
+            cells[points[selected]] -= bit
+            cells[adjacents[selected]] -= op_bit
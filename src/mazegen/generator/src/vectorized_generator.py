@@ -0,0 +1,352 @@
+#!/bin/env python3
+
+# Main imports
+from .maze import Maze
+from .cell_grid import CellGrid
+from .gen_types import Pathway
+from .exceptions import MazeError
+
+# Other imports
+from typing import Any, Optional
+import numpy as np
+
+
+class VectorizedGenerator:
+    """
+    Generators written as whole-array ``numpy`` operations, with no Python
+    loop over the cells.
+
+    Both algorithms decide every passage at once and describe the result
+    as a forest of parent pointers. Fixed cells can leave some trees
+    without a way to the rest of the maze, so the few trees left are
+    joined with Kruskal's algorithm over the walls between them.
+
+    Notes
+    -----
+    This module imports ``numpy`` at import time, so it is only imported
+    when one of its algorithms is used (see ``Generator.generate``).
+    """
+
+    # Chances of carving north in the binary tree and of closing a run in
+    # the sidewinder
+    NORTH_CHANCE = 1 / 2
+    CLOSE_RUN_CHANCE = 1 / 2
+
+    @classmethod
+    def binary_tree_generation(cls, maze: Maze) -> tuple[
+                CellGrid, Pathway, list[str]]:
+        """
+        Generate a perfect maze with the binary tree algorithm: every cell
+        carves a passage to its north or to its west neighbor.
+
+        Parameters
+        ----------
+        maze : Maze
+            Maze configuration, its random generator seeds the ``numpy``
+            one.
+
+        Returns
+        -------
+        The same as ``Generator.dfs_generation``.
+
+        Raises
+        ------
+        MazeError
+            If the entry or the exit are fixed cells or the exit can't be
+            reached from the entry.
+
+        Notes
+        -----
+        Cells that can't carve the direction they picked carve the other
+        one. The result has the well known bias of the algorithm: the top
+        row and the left column are long corridors.
+        """
+        from .generator import Generator
+
+        grid = Generator.init_grid(maze)
+        width = grid.get_width()
+        height = grid.get_height()
+        rng = cls.__numpy_rng(maze)
+        free = cls.__free_cells(grid)
+
+        can_north = np.zeros_like(free)
+        can_north[1:] = free[1:] & free[:-1]
+        can_west = np.zeros_like(free)
+        can_west[:, 1:] = free[:, 1:] & free[:, :-1]
+        picked_north = rng.random((height, width)) < cls.NORTH_CHANCE
+        carve_north = can_north & (picked_north | ~can_west)
+        carve_west = can_west & ~carve_north
+
+        walls = cls.__walls(grid)
+        cls.__carve_north(walls, carve_north)
+        cls.__carve_west(walls, carve_west)
+
+        parents = np.arange(width * height, dtype=np.int64)
+        parents[carve_north.ravel()] -= width
+        parents[carve_west.ravel()] -= 1
+        return cls.__finish(maze, grid, walls, free, parents, rng)
+
+    @classmethod
+    def sidewinder_generation(cls, maze: Maze) -> tuple[
+                CellGrid, Pathway, list[str]]:
+        """
+        Generate a perfect maze with the sidewinder algorithm: every row is
+        split in runs of cells joined to the east, and every run carves a
+        passage to the north from one of its cells.
+
+        Parameters
+        ----------
+        maze : Maze
+            Maze configuration, its random generator seeds the ``numpy``
+            one.
+
+        Returns
+        -------
+        The same as ``Generator.dfs_generation``.
+
+        Raises
+        ------
+        MazeError
+            If the entry or the exit are fixed cells or the exit can't be
+            reached from the entry.
+
+        Notes
+        -----
+        Runs are closed before fixed cells and at the east border, the top
+        row is a single run per stretch of free cells. The cell carving to
+        the north is picked at random among the cells of its run, leaving
+        out the ones under a fixed cell.
+        """
+        from .generator import Generator
+
+        grid = Generator.init_grid(maze)
+        width = grid.get_width()
+        height = grid.get_height()
+        size = width * height
+        rng = cls.__numpy_rng(maze)
+        free = cls.__free_cells(grid)
+
+        # Runs of cells joined to the east
+        close = rng.random((height, width)) < cls.CLOSE_RUN_CHANCE
+        close[0] = False
+        close[:, -1] = True
+        close[:, :-1] |= ~free[:, 1:]
+        join_east = free & ~close
+        starts = free.copy()
+        starts[:, 1:] &= ~join_east[:, :-1]
+        flat_free = free.ravel()
+        run_ids = np.cumsum(starts.ravel()) - 1
+
+        # Cell of every run carving to the north, if there is one: a random
+        # rank among the cells of the run that can do it
+        can_north = np.zeros_like(free)
+        can_north[1:] = free[1:] & free[:-1]
+        cells = np.flatnonzero(flat_free)
+        candidates = cells[can_north.ravel()[cells]]
+        runs = int(run_ids[cells[-1]]) + 1
+        counts = np.bincount(run_ids[candidates], minlength=runs)
+        offsets = np.cumsum(counts) - counts
+        ranks = (rng.random(runs) * counts).astype(np.int64)
+        carvers = candidates[(offsets + ranks)[counts > 0]]
+        carve_north = np.zeros(size, dtype=bool)
+        carve_north[carvers] = True
+
+        walls = cls.__walls(grid)
+        cls.__carve_east(walls, join_east)
+        cls.__carve_north(walls, carve_north.reshape(height, width))
+
+        # Every cell points to the carver of its run, which points to its
+        # north neighbor. Runs without carver point to their first cell.
+        heads = np.flatnonzero(starts.ravel())
+        run_parents = heads.copy()
+        run_parents[run_ids[carvers]] = carvers
+        parents = np.arange(size, dtype=np.int64)
+        parents[cells] = run_parents[run_ids[cells]]
+        parents[carvers] = carvers - width
+        return cls.__finish(maze, grid, walls, free, parents, rng)
+
+    # HELPERS -----------------------------------------------------------------
+    @classmethod
+    def __numpy_rng(cls, maze: Maze) -> np.random.Generator:
+        """
+        Returns a ``numpy`` generator seeded from the maze one, so the
+        same seed always gives the same maze.
+        """
+        return np.random.default_rng(maze.get_rng().getrandbits(64))
+
+    @classmethod
+    def __free_cells(cls, grid: CellGrid) -> Any:
+        fixed = np.frombuffer(grid.get_fixed(), dtype=np.uint8)
+        return (fixed == 0).reshape(grid.get_height(), grid.get_width())
+
+    @classmethod
+    def __walls(cls, grid: CellGrid) -> Any:
+        """
+        Returns a writable ``(height, width)`` view of the grid walls.
+        """
+        return np.frombuffer(grid.get_walls(), dtype=np.uint8).reshape(
+            grid.get_height(), grid.get_width())
+
+    @classmethod
+    def __carve_north(cls, walls: Any, carve: Any) -> None:
+        north, _, south, _ = CellGrid.WALL_BITS
+        carve = carve.view(np.uint8)
+        walls -= carve * np.uint8(north)
+        walls[:-1] -= carve[1:] * np.uint8(south)
+
+    @classmethod
+    def __carve_west(cls, walls: Any, carve: Any) -> None:
+        _, east, _, west = CellGrid.WALL_BITS
+        carve = carve.view(np.uint8)
+        walls -= carve * np.uint8(west)
+        walls[:, :-1] -= carve[:, 1:] * np.uint8(east)
+
+    @classmethod
+    def __carve_east(cls, walls: Any, carve: Any) -> None:
+        _, east, _, west = CellGrid.WALL_BITS
+        carve = carve.view(np.uint8)
+        walls -= carve * np.uint8(east)
+        walls[:, 1:] -= carve[:, :-1] * np.uint8(west)
+
+    @classmethod
+    def __finish(cls, maze: Maze, grid: CellGrid, walls: Any, free: Any,
+                 parents: Any, rng: np.random.Generator) -> tuple[
+                CellGrid, Pathway, list[str]]:
+        """
+        Joins the trees left by the generation, marks the free cells as
+        visited and finds the pathway from the entry to the exit.
+        """
+        from .pathfinder import PathFinder
+
+        cls.__join_trees(walls, free, parents, rng)
+        grid.get_visited()[:] = free.astype(np.uint8).tobytes()
+
+        cells = cls.__tree_path(parents, grid.get_width(),
+                                grid.index(maze.get_entry()),
+                                grid.index(maze.get_exit()))
+        if cells is None:
+            raise MazeError("EXIT point can't be reached from ENTRY point!")
+        pathway = [grid.coords(i) for i in cells]
+        return (grid, pathway, PathFinder.directions_of(pathway))
+
+    @classmethod
+    def __join_trees(cls, walls: Any, free: Any, parents: Any,
+                     rng: np.random.Generator) -> None:
+        """
+        Finds the root of every cell by pointer jumping and, if there is
+        more than one tree of free cells, joins them by opening walls with
+        Kruskal's algorithm, in random order.
+
+        ``parents`` is kept as a single rooted forest: every joined tree is
+        re-rooted at the cell of the opened wall and hung from the cell at
+        the other side.
+
+        Notes
+        -----
+        Only walls between two different trees are candidates, and there
+        are just a few trees (the ones closed by fixed cells), so the
+        Python loop is short.
+        """
+        height, width = free.shape
+        roots = parents
+        while True:
+            grand_parents = roots[roots]
+            if np.array_equal(grand_parents, roots):
+                break
+            roots = grand_parents
+        grid_roots = roots.reshape(height, width)
+        if len(np.unique(grid_roots[free])) <= 1:
+            return
+
+        # Walls between free cells of different trees
+        east = np.zeros_like(free)
+        east[:, :-1] = (free[:, :-1] & free[:, 1:]
+                        & (grid_roots[:, :-1] != grid_roots[:, 1:]))
+        south = np.zeros_like(free)
+        south[:-1] = (free[:-1] & free[1:]
+                      & (grid_roots[:-1] != grid_roots[1:]))
+        edges = np.concatenate((np.flatnonzero(east) * 2,
+                                np.flatnonzero(south) * 2 + 1))
+        rng.shuffle(edges)
+
+        flat_walls = walls.reshape(-1)
+        north_bit, east_bit, south_bit, west_bit = CellGrid.WALL_BITS
+        sets: dict[int, int] = {}
+
+        def find(root: int) -> int:
+            while root in sets:
+                parent = sets[root]
+                if parent in sets:
+                    sets[root] = sets[parent]
+                root = parent
+            return root
+
+        for edge in edges.tolist():
+            cell, is_south = divmod(edge, 2)
+            other = cell + width if is_south else cell + 1
+            a = find(int(roots[cell]))
+            b = find(int(roots[other]))
+            if a == b:
+                continue
+            sets[b] = a
+            if is_south:
+                flat_walls[cell] -= south_bit
+                flat_walls[other] -= north_bit
+            else:
+                flat_walls[cell] -= east_bit
+                flat_walls[other] -= west_bit
+
+            # Re-rooting the tree of ``other`` by reversing its way up
+            child = other
+            node = int(parents[other])
+            while node != child:
+                next_node = int(parents[node])
+                parents[node] = child
+                if next_node == node:
+                    break
+                child, node = node, next_node
+            parents[other] = cell
+
+    @classmethod
+    def __tree_path(cls, parents: Any, width: int, src: int,
+                    dst: int) -> Optional[list[int]]:
+        """
+        Returns every cell of the way between two cells of the forest, or
+        ``None`` if they are in different trees.
+
+        Both cells go up to their common ancestor. Every jump between a
+        cell and its parent is a straight corridor (a whole sidewinder run
+        at most), so it is expanded cell by cell.
+        """
+        up_from_src = [src]
+        while parents[up_from_src[-1]] != up_from_src[-1]:
+            up_from_src.append(int(parents[up_from_src[-1]]))
+        position = {cell: i for i, cell in enumerate(up_from_src)}
+
+        up_from_dst = [dst]
+        while up_from_dst[-1] not in position:
+            parent = int(parents[up_from_dst[-1]])
+            if parent == up_from_dst[-1]:
+                return None
+            up_from_dst.append(parent)
+        jumps = (up_from_src[:position[up_from_dst[-1]]]
+                 + up_from_dst[::-1])
+
+        # Corridors of the same run can overlap, so the cells walked twice
+        # are erased
+        cells = [src]
+        seen = {src: 0}
+        for a, b in zip(jumps, jumps[1:]):
+            if a // width == b // width:
+                step = 1 if b > a else -1
+            else:
+                step = width if b > a else -width
+            for cell in range(a + step, b + step, step):
+                if cell in seen:
+                    for erased in cells[seen[cell] + 1:]:
+                        del seen[erased]
+                    del cells[seen[cell] + 1:]
+                else:
+                    seen[cell] = len(cells)
+                    cells.append(cell)
+        return cells
@@ -25,9 +25,14 @@ class MazeManager(BaseComponent):
         self.__maze_root.alt = next(self.__alt_iter)
         EventManager.add_listener("win", self.win_event)
         from ..nodes import CellNode
+        from ..main import MazeVisualizer
         try:
-            self.__maze = MazeGenerator.generate(sys.argv[1])
-            self.__maze.print_output()
+            if sys.argv[1] == MazeVisualizer.LOAD_ARGUMENT:
+                # Saved maze, nothing to generate nor to write
+                self.__maze = MazeGenerator.load(sys.argv[2])
+            else:
+                self.__maze = MazeGenerator.generate(sys.argv[1])
+                self.__maze.print_output()
         except FileNotFoundError as e:
             self.__maze_root.set_pos(0, 0)
             self.__maze_root.add_subnode(ErrorMessage())
@@ -108,11 +113,15 @@ class MazeManager(BaseComponent):
         if not self.__maze_generated or \
                 self.__maze_root.get_subnode("FootprintRoot"):
             return
+        # Shortest route from the entry, read from the exit distance field
+        pathway = self.__maze.path_to(self.__maze.get_entry())
+        if pathway is None:
+            pathway = self.__maze.get_pathway()
         self.__maze_root.add_subnode(
             FootprintRoot(
                 self.__sprite_size,
                 self.__scale,
-                self.__maze.get_pathway()))
+                pathway))
 
     def destroy_footprints(self) -> None:
         footprints = self.__maze_root.get_subnode("FootprintRoot")
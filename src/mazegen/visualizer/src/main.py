@@ -1,10 +1,15 @@
-from .core import EngineManager
-from .scenes import MainMenu, Maze
-
-
 class MazeVisualizer:
+    # Command line argument used to open a saved maze file instead of
+    # generating one from a config file
+    LOAD_ARGUMENT = "--load"
+
     @staticmethod
     def show_visualizer() -> None:
+        # The engine loads MLX, OpenCV and NumPy, so it is only imported
+        # once the visualizer is really going to be shown.
+        from .core import EngineManager
+        from .scenes import MainMenu, Maze
+
         EngineManager.init("a_maze_ing",
                            (1920, 1080),
                            [MainMenu, Maze])
@@ -0,0 +1,98 @@
+#!/bin/env python3
+
+# Main imports
+from mazegen.generator import CellGrid, Coords
+
+# Other imports
+from collections import deque
+from typing import Callable, Optional
+import pytest
+
+# Steps of the reference search, in the order of ``CellGrid.WALL_BITS``
+STEPS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+Distances = dict[Coords, int]
+
+
+def bfs_distances(grid: CellGrid, source: Coords) -> Distances:
+    """
+    Reference breadth-first search over the walls of a grid, written
+    without any helper of the library: returns the number of steps from
+    ``source`` to every cell reachable from it.
+    """
+    walls = grid.get_walls()
+    width = grid.get_width()
+    distances = {source: 0}
+    queue = deque([source])
+    while queue:
+        x, y = queue.popleft()
+        state = walls[(y - 1) * width + (x - 1)]
+        for bit, (dx, dy) in zip(CellGrid.WALL_BITS, STEPS):
+            adjacent = (x + dx, y + dy)
+            if state & bit or adjacent in distances \
+                    or not grid.contains(adjacent):
+                continue
+            distances[adjacent] = distances[(x, y)] + 1
+            queue.append(adjacent)
+    return distances
+
+
+def simple_paths(grid: CellGrid, source: Coords,
+                 target: Coords) -> list[list[Coords]]:
+    """
+    Every path from ``source`` to ``target`` that never goes through the
+    same cell twice, found by brute force. Only meant for tiny mazes.
+    """
+    walls = grid.get_walls()
+    width = grid.get_width()
+    paths: list[list[Coords]] = []
+    path = [source]
+
+    def extend() -> None:
+        x, y = path[-1]
+        if (x, y) == target:
+            paths.append(list(path))
+            return
+        state = walls[(y - 1) * width + (x - 1)]
+        for bit, (dx, dy) in zip(CellGrid.WALL_BITS, STEPS):
+            adjacent = (x + dx, y + dy)
+            if state & bit or adjacent in path \
+                    or not grid.contains(adjacent):
+                continue
+            path.append(adjacent)
+            extend()
+            path.pop()
+
+    extend()
+    return paths
+
+
+def is_valid_path(grid: CellGrid, path: list[Coords]) -> bool:
+    """
+    Whether every step of ``path`` goes to an adjacent cell through an
+    open wall.
+    """
+    walls = grid.get_walls()
+    for (x, y), adjacent in zip(path, path[1:]):
+        step = (adjacent[0] - x, adjacent[1] - y)
+        if step not in STEPS:
+            return False
+        bit = CellGrid.WALL_BITS[STEPS.index(step)]
+        if walls[grid.index((x, y))] & bit:
+            return False
+    return True
+
+
+@pytest.fixture
+def bfs() -> Callable[[CellGrid, Coords], Distances]:
+    return bfs_distances
+
+
+@pytest.fixture
+def all_paths() -> Callable[[CellGrid, Coords, Coords], list[list[Coords]]]:
+    return simple_paths
+
+
+@pytest.fixture
+def valid_path() -> Callable[[CellGrid, Optional[list[Coords]]], bool]:
+    return lambda grid, path: path is not None and is_valid_path(grid, path)
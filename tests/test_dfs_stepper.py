@@ -0,0 +1,81 @@
+#!/bin/env python3
+
+# Main imports
+from mazegen.generator import Maze, Generator, DfsStepper, MazeError
+
+# Other imports
+import pytest
+
+PARAMETERS = {"width": 30, "height": 20, "entry": (1, 1), "exit": (30, 20),
+              "seed_num": 5, "perfect": True}
+
+
+def test_steps_carve_the_generated_maze(bfs, valid_path) -> None:
+    maze = Maze(**PARAMETERS)
+    stepper = Generator.iter_steps(maze, batch_size=16)
+    passages = [passage for batch in stepper for passage in batch]
+    grid, pathway, directions = stepper.result()
+
+    assert stepper.is_done()
+    assert grid.get_walls() == maze.get_grid().get_walls()
+    assert pathway == maze.get_pathway()
+    assert directions == maze.get_directions_followed()
+
+    # A spanning tree of the free cells, one passage per batch item
+    free_cells = grid.get_size() - sum(grid.get_fixed())
+    assert len(passages) == free_cells - 1
+    assert all(valid_path(grid, list(passage)) for passage in passages)
+    distances = bfs(grid, maze.get_entry())
+    assert len(distances) == free_cells
+    assert len(pathway) - 1 == distances[maze.get_exit()]
+
+
+@pytest.mark.parametrize("batch_size", (1, 7, 64))
+@pytest.mark.parametrize("pause", (0, 1, 5, 40))
+def test_save_and_load_resume_the_same_maze(batch_size: int,
+                                            pause: int) -> None:
+    maze = Maze(**PARAMETERS)
+    stepper = Generator.iter_steps(maze, batch_size=batch_size)
+    carved = []
+    for _ in range(pause):
+        carved.extend(next(stepper, []))
+
+    saved = stepper.save()
+    resumed = Generator.iter_steps(maze, batch_size=batch_size, state=saved)
+    assert resumed.save() == saved
+    # Saving and loading again between every batch
+    batch = next(resumed, None)
+    while batch is not None:
+        carved.extend(batch)
+        resumed = DfsStepper.load(resumed.save())
+        batch = next(resumed, None)
+    grid, pathway, directions = resumed.result()
+
+    assert grid.get_walls() == maze.get_grid().get_walls()
+    assert pathway == maze.get_pathway()
+    assert directions == maze.get_directions_followed()
+    assert len(carved) == grid.get_size() - sum(grid.get_fixed()) - 1
+
+
+def test_run_after_load() -> None:
+    maze = Maze(**PARAMETERS)
+    stepper = Generator.iter_steps(maze, batch_size=10)
+    next(stepper)
+    resumed = DfsStepper.load(stepper.save())
+    resumed.run()
+    assert resumed.get_grid().get_walls() == maze.get_grid().get_walls()
+
+
+def test_stepper_errors() -> None:
+    maze = Maze(**PARAMETERS)
+    stepper = Generator.iter_steps(maze)
+    with pytest.raises(MazeError):
+        stepper.result()
+    with pytest.raises(MazeError):
+        stepper.set_batch_size(0)
+
+    saved = stepper.save()
+    with pytest.raises(MazeError):
+        DfsStepper.load(saved[:len(saved) // 2])
+    with pytest.raises(MazeError):
+        DfsStepper.load(b"NOPE" + saved[4:])
@@ -0,0 +1,179 @@
+#!/bin/env python3
+
+# Main imports
+from mazegen.generator import Maze, MazeGenerator, CellGrid, Generator
+from mazegen.generator.src.ft_logo_cells import FtLogoCells
+from mazegen.generator.src.predefined import ALGORITHMS
+
+# Other imports
+from pathlib import Path
+import pytest
+
+PARAMETERS = {"width": 45, "height": 32, "entry": (3, 2), "exit": (44, 30),
+              "seed_num": 21, "perfect": True}
+
+# Entry and exit pairs: corners, both on the same row and next to the logo
+ENDS = (((1, 1), (45, 32)), ((45, 1), (1, 32)), ((2, 16), (44, 16)),
+        ((20, 12), (26, 20)))
+
+CONFIG = """WIDTH=37
+HEIGHT=120
+ENTRY=37,1
+EXIT=1,120
+PERFECT=True
+OUTPUT_FILE={output}
+SEED=8
+FT_LOGO=True
+FT_LOGO_SCALE=True
+PATH_FINDER=False
+BINARY_OUTPUT=False
+ALGORITHM=dfs
+TILE_SIZE=256
+WORKERS=1
+WALL_OPENING_DENSITY=0.05
+DEAD_END_REMOVAL=0
+"""
+
+
+def open_walls(maze: Maze) -> int:
+    """
+    Returns how many walls between two cells of the maze are open.
+    """
+    closed = sum(bin(state).count("1")
+                 for state in maze.get_grid().get_walls())
+    return (4 * maze.get_grid().get_size() - closed) // 2
+
+
+def assert_perfect_maze(maze: Maze, bfs, valid_path) -> None:
+    """
+    Checks that the free cells of the maze form a tree with the logo cells
+    closed around it, and that the pathway joins the entry and the exit.
+    """
+    grid = maze.get_grid()
+    logo = maze.get_ft_logo() and FtLogoCells.logo_cells(
+        maze.get_width(), maze.get_height(), maze.get_ft_logo_scale())
+    fixed = {grid.coords(i) for i, flag in enumerate(grid.get_fixed())
+             if flag}
+    assert fixed == set(logo or ())
+    assert all(grid.get_walls()[grid.index(cell)] == CellGrid.CLOSED
+               for cell in fixed)
+
+    free_cells = grid.get_size() - len(fixed)
+    distances = bfs(grid, maze.get_entry())
+    assert len(distances) == free_cells
+    assert open_walls(maze) == free_cells - 1
+
+    pathway = maze.get_pathway()
+    assert valid_path(grid, pathway)
+    assert (pathway[0], pathway[-1]) == (maze.get_entry(), maze.get_exit())
+    assert len(pathway) - 1 == distances[maze.get_exit()]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("entry, exit", ENDS)
+def test_generators_keep_the_logo_and_ends(algorithm: str, entry: tuple,
+                                           exit: tuple, bfs,
+                                           valid_path) -> None:
+    maze = Maze(**{**PARAMETERS, "entry": entry, "exit": exit},
+                algorithm=algorithm, tile_size=8)
+    assert_perfect_maze(maze, bfs, valid_path)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("ft_logo, ft_logo_scale", ((False, False),
+                                                    (True, True)))
+def test_perfect_mazes_are_spanning_trees(algorithm: str, ft_logo: bool,
+                                          ft_logo_scale: bool, bfs,
+                                          valid_path) -> None:
+    maze = Maze(**PARAMETERS, algorithm=algorithm, tile_size=8,
+                ft_logo=ft_logo, ft_logo_scale=ft_logo_scale)
+    assert_perfect_maze(maze, bfs, valid_path)
+
+
+@pytest.mark.parametrize("tile_size", (1, 7, 16, 64))
+def test_tiled_mazes_do_not_depend_on_workers(tile_size: int) -> None:
+    mazes = [Maze(**PARAMETERS, algorithm="tiled", tile_size=tile_size,
+                  workers=workers) for workers in (1, 2)]
+    assert mazes[0].get_grid().get_walls() == mazes[1].get_grid().get_walls()
+    assert mazes[0].get_pathway() == mazes[1].get_pathway()
+
+
+@pytest.mark.parametrize("entry, exit", ENDS)
+@pytest.mark.parametrize("seed", (1, 2, 3))
+def test_kruskal_paths_open_the_same_walls(
+        entry: tuple, exit: tuple, seed: int, bfs, valid_path,
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    parameters = {**PARAMETERS, "entry": entry, "exit": exit,
+                  "seed_num": seed}
+    union_find = Maze(**parameters, algorithm="kruskal")
+    assert_perfect_maze(union_find, bfs, valid_path)
+
+    monkeypatch.setattr(Generator, "KRUSKAL_BORUVKA", True)
+    boruvka = Maze(**parameters, algorithm="kruskal")
+    assert (boruvka.get_grid().get_walls()
+            == union_find.get_grid().get_walls())
+    assert boruvka.get_pathway() == union_find.get_pathway()
+
+
+def test_stream_writes_a_perfect_maze(tmp_path: Path, bfs,
+                                      valid_path) -> None:
+    output = tmp_path / "maze.txt"
+    config = tmp_path / "config.txt"
+    config.write_text(CONFIG.format(output=output))
+    seed = MazeGenerator.stream(str(config))
+    streamed = Maze.from_file(str(output))
+
+    assert streamed.get_perfect()
+    assert (streamed.get_entry(), streamed.get_exit()) == ((37, 1), (1, 120))
+    # The loaded maze doesn't know the logo was scaled
+    assert_perfect_maze(
+        Maze.from_grid(streamed.get_grid(), streamed.get_entry(),
+                       streamed.get_exit(),
+                       streamed.get_directions_followed(),
+                       ft_logo_scale=True),
+        bfs, valid_path)
+
+    # The same cells as Eller's algorithm over a whole Maze
+    maze = Maze(37, 120, (37, 1), (1, 120), seed_num=seed, perfect=True,
+                ft_logo_scale=True, algorithm="eller")
+    assert streamed.get_grid().get_walls() == maze.get_grid().get_walls()
+
+
+# BATCH GENERATION ------------------------------------------------------------
+def test_batches_do_not_depend_on_workers(tmp_path: Path) -> None:
+    configs = []
+    for name, size, algorithm in (("small", 20, "dfs"),
+                                  ("large", 40, "kruskal")):
+        config = tmp_path / f"{name}.txt"
+        config.write_text(CONFIG.format(output=tmp_path / "maze.txt")
+                          .replace("WIDTH=37", f"WIDTH={size}")
+                          .replace("ENTRY=37,1", f"ENTRY={size},1")
+                          .replace("HEIGHT=120", "HEIGHT=30")
+                          .replace("EXIT=1,120", "EXIT=1,30")
+                          .replace("ALGORITHM=dfs", f"ALGORITHM={algorithm}"))
+        configs.append(str(config))
+    configs *= 3
+
+    batches = [MazeGenerator.generate_many(configs, workers=workers,
+                                           base_seed=42)
+               for workers in (1, 2)]
+    streamed = [dict(MazeGenerator.iter_generate_many(configs,
+                                                      workers=workers,
+                                                      base_seed=42))
+                for workers in (1, 2)]
+    for mazes in batches[1:] + [[batch[i] for i in range(len(configs))]
+                                for batch in streamed]:
+        assert len(mazes) == len(configs)
+        for maze, expected in zip(mazes, batches[0]):
+            assert maze.get_seed() == expected.get_seed()
+            assert (maze.get_grid().get_walls()
+                    == expected.get_grid().get_walls())
+            assert maze.get_pathway() == expected.get_pathway()
+
+    # Every maze gets its own seed, from its position only
+    seeds = [maze.get_seed() for maze in batches[0]]
+    assert seeds == [MazeGenerator.derive_seed(42, index)
+                     for index in range(len(configs))]
+    assert len(set(seeds)) == len(seeds)
+    other = MazeGenerator.generate_many(configs[:2], workers=1, base_seed=43)
+    assert [maze.get_seed() for maze in other] != seeds[:2]
@@ -0,0 +1,238 @@
+#!/bin/env python3
+
+# Main imports
+from mazegen.generator import (Maze, MazeGenerator, MazeIO, CellGrid,
+                               MazeError)
+from mazegen.generator.src.predefined import ALGORITHMS
+
+# Other imports
+from concurrent.futures import ThreadPoolExecutor
+from math import sqrt
+from pathlib import Path
+import random
+import pytest
+
+PARAMETERS = {"width": 60, "height": 45, "entry": (1, 1), "exit": (60, 45),
+              "seed_num": 13, "perfect": False}
+
+CONFIG = """WIDTH=20
+HEIGHT=15
+ENTRY=1,1
+EXIT=20,15
+PERFECT={perfect}
+OUTPUT_FILE={output}
+SEED=5
+DEAD_END_REMOVAL=50
+"""
+
+EAST, SOUTH = CellGrid.WALL_BITS[1], CellGrid.WALL_BITS[2]
+
+
+def is_open(grid: CellGrid, x: int, y: int, bit: int) -> bool:
+    """
+    Whether the east or south wall of the 0-based cell ``(x, y)`` is open.
+    """
+    return not grid.get_walls()[y * grid.get_width() + x] & bit
+
+
+def square_walls(x: int, y: int) -> tuple[tuple[int, int, int], ...]:
+    """
+    The four walls between the cells of the 2x2 square whose top left
+    0-based cell is ``(x, y)``.
+    """
+    return ((x, y, EAST), (x, y + 1, EAST), (x, y, SOUTH), (x + 1, y, SOUTH))
+
+
+def open_squares(grid: CellGrid) -> int:
+    """
+    Returns how many 2x2 squares have no walls between their cells.
+    """
+    return sum(all(is_open(grid, *wall) for wall in square_walls(x, y))
+               for y in range(grid.get_height() - 1)
+               for x in range(grid.get_width() - 1))
+
+
+def open_walls(grid: CellGrid) -> int:
+    closed = sum(bin(state).count("1") for state in grid.get_walls())
+    return (4 * grid.get_size() - closed) // 2
+
+
+def openable_walls(grid: CellGrid) -> int:
+    """
+    Returns how many closed walls between two free cells can be opened
+    without leaving a 2x2 square open.
+    """
+    width, height = grid.get_width(), grid.get_height()
+    fixed = grid.get_fixed()
+    count = 0
+    for y in range(height):
+        for x in range(width):
+            for bit, dx, dy in ((EAST, 1, 0), (SOUTH, 0, 1)):
+                if (x + dx >= width or y + dy >= height
+                        or is_open(grid, x, y, bit)
+                        or fixed[y * width + x]
+                        or fixed[(y + dy) * width + x + dx]):
+                    continue
+                corners = ((x, y - 1), (x, y)) if bit == EAST \
+                    else ((x - 1, y), (x, y))
+                count += not any(
+                    0 <= cx < width - 1 and 0 <= cy < height - 1
+                    and all(is_open(grid, *wall)
+                            for wall in square_walls(cx, cy)
+                            if wall != (x, y, bit))
+                    for cx, cy in corners)
+    return count
+
+
+def dead_ends(grid: CellGrid) -> int:
+    """
+    Returns how many free cells have three walls.
+    """
+    return sum(bin(state).count("1") == 3 and not fixed
+               for state, fixed in zip(grid.get_walls(), grid.get_fixed()))
+
+
+def assert_closed_around(maze: Maze) -> None:
+    """
+    Checks that the border and the fixed cells of the maze are closed and
+    that both sides of every wall agree.
+    """
+    grid = maze.get_grid()
+    MazeIO.check_walls(grid)
+    assert any(grid.get_fixed())
+    assert all(state == CellGrid.CLOSED
+               for state, fixed in zip(grid.get_walls(), grid.get_fixed())
+               if fixed)
+
+
+# WALL OPENING ----------------------------------------------------------------
+@pytest.mark.parametrize("algorithm", ("dfs", "kruskal", "wilson"))
+@pytest.mark.parametrize("density", (0.02, 0.05, 0.1))
+def test_opened_walls_follow_the_density(algorithm: str,
+                                         density: float) -> None:
+    tree = Maze(**PARAMETERS, algorithm=algorithm, wall_opening_density=0)
+    maze = Maze(**PARAMETERS, algorithm=algorithm,
+                wall_opening_density=density)
+    openable = openable_walls(tree.get_grid())
+    opened = open_walls(maze.get_grid()) - open_walls(tree.get_grid())
+
+    # Binomial count of the openable walls, with 4 standard deviations
+    expected = density * openable
+    assert abs(opened - expected) <= 4 * sqrt(expected * (1 - density))
+
+
+@pytest.mark.parametrize("density", (0, 0.05, 0.3, 0.6, 1))
+def test_opened_walls_never_open_squares(density: float) -> None:
+    maze = Maze(**PARAMETERS, wall_opening_density=density)
+    grid = maze.get_grid()
+    assert open_squares(grid) == 0
+    assert_closed_around(maze)
+    if density:
+        tree = Maze(**PARAMETERS, wall_opening_density=0)
+        assert open_walls(grid) > open_walls(tree.get_grid())
+    else:
+        free_cells = grid.get_size() - sum(grid.get_fixed())
+        assert open_walls(grid) == free_cells - 1
+
+
+def test_opened_walls_only_depend_on_the_seed() -> None:
+    first, second = (Maze(**PARAMETERS, wall_opening_density=0.2)
+                     for _ in range(2))
+    assert first.get_grid().get_walls() == second.get_grid().get_walls()
+    other = Maze(**{**PARAMETERS, "seed_num": 14}, wall_opening_density=0.2)
+    assert other.get_grid().get_walls() != first.get_grid().get_walls()
+
+
+# DEAD END REMOVAL ------------------------------------------------------------
+@pytest.mark.parametrize("algorithm", ("dfs", "kruskal", "wilson"))
+@pytest.mark.parametrize("percentage", (10, 50, 90))
+def test_dead_end_removal_reaches_the_target(algorithm: str,
+                                             percentage: float) -> None:
+    maze = Maze(**PARAMETERS, algorithm=algorithm, wall_opening_density=0)
+    grid = maze.get_grid()
+    before = dead_ends(grid)
+    target = round(before * percentage / 100)
+
+    removed = maze.remove_dead_ends(percentage)
+    # Two facing dead ends are removed at once, so one more at most
+    assert target <= removed <= target + 1
+    assert dead_ends(grid) == before - removed
+    assert open_squares(grid) == 0
+    assert_closed_around(maze)
+
+
+def test_dead_end_removal_of_every_dead_end() -> None:
+    maze = Maze(**PARAMETERS, wall_opening_density=0)
+    before = dead_ends(maze.get_grid())
+    removed = maze.remove_dead_ends(100)
+    # Only the ones that can't open a wall without opening a square stay
+    assert removed >= 0.95 * before
+    assert dead_ends(maze.get_grid()) == before - removed
+    assert maze.remove_dead_ends(0) == 0
+
+
+@pytest.mark.parametrize("percentage", (25, 75))
+def test_dead_end_removal_in_the_constructor(percentage: float) -> None:
+    tree = Maze(**PARAMETERS, wall_opening_density=0)
+    before = dead_ends(tree.get_grid())
+    first, second = (Maze(**PARAMETERS, wall_opening_density=0,
+                          dead_end_removal=percentage) for _ in range(2))
+    grid = first.get_grid()
+
+    # Same seed, same maze
+    assert grid.get_walls() == second.get_grid().get_walls()
+    removed = before - dead_ends(grid)
+    target = round(before * percentage / 100)
+    assert target <= removed <= target + 1
+    assert open_squares(grid) == 0
+    assert_closed_around(first)
+
+    # Opening walls afterwards only removes more dead ends
+    opened = Maze(**PARAMETERS, wall_opening_density=0.1,
+                  dead_end_removal=percentage).get_grid()
+    assert dead_ends(opened) <= dead_ends(grid)
+    assert open_squares(opened) == 0
+
+
+def test_dead_end_removal_errors(tmp_path: Path) -> None:
+    with pytest.raises(MazeError):
+        Maze(**{**PARAMETERS, "perfect": True}, dead_end_removal=50)
+    for percentage in (-1, 101):
+        with pytest.raises(MazeError):
+            Maze(**PARAMETERS, dead_end_removal=percentage)
+        with pytest.raises(MazeError):
+            Maze(**PARAMETERS).remove_dead_ends(percentage)
+
+    # Also from a config file
+    config = tmp_path / "config.txt"
+    for perfect in (False, True):
+        config.write_text(CONFIG.format(output=tmp_path / "maze.txt",
+                                        perfect=perfect))
+        if not perfect:
+            assert not MazeGenerator.generate(str(config)).get_perfect()
+            continue
+        with pytest.raises(MazeError, match="perfect"):
+            MazeGenerator.generate(str(config))
+
+
+# RANDOM GENERATORS -----------------------------------------------------------
+def test_mazes_built_in_threads_keep_their_sequence() -> None:
+    # Every algorithm drawing numbers at once, with the wall opening, the
+    # dead end removal and the path finder on as well
+    batch = [{**PARAMETERS, "seed_num": seed, "algorithm": algorithm,
+              "dead_end_removal": 30, "path_finder": True}
+             for seed in (3, 4) for algorithm in ALGORITHMS]
+
+    def build(parameters: dict) -> tuple:
+        maze = Maze(**parameters, tile_size=16)
+        return (bytes(maze.get_grid().get_walls()),
+                maze.get_possible_pathways())
+
+    sequential = [build(parameters) for parameters in batch]
+    random.seed(1)
+    state = random.getstate()
+    with ThreadPoolExecutor(max_workers=len(batch)) as executor:
+        for _ in range(3):
+            assert list(executor.map(build, batch)) == sequential
+    # The global generator is never touched
+    assert random.getstate() == state
@@ -0,0 +1,241 @@
+#!/bin/env python3
+
+# Main imports
+from mazegen.generator import (Maze, MazeGenerator, MazeCache,
+                               MemoryMazeCache, MazeError)
+
+# Other imports
+from pathlib import Path
+from typing import Any
+import os
+import pytest
+
+PARAMETERS: dict[str, Any] = {
+    "width": 25, "height": 18, "entry": (1, 1), "exit": (25, 18),
+    "output_file": "maze.txt", "seed_num": 9, "perfect": False,
+    "ft_logo": True, "ft_logo_scale": False, "path_finder": False,
+    "binary_output": False, "algorithm": "dfs", "tile_size": 256,
+    "workers": 1, "wall_opening_density": 0.05, "dead_end_removal": 0.5}
+
+CONFIG = """WIDTH={width}
+HEIGHT=15
+ENTRY=1,1
+EXIT={width},15
+PERFECT=True
+OUTPUT_FILE=maze.txt
+SEED=4
+FT_LOGO=True
+FT_LOGO_SCALE=False
+PATH_FINDER=False
+BINARY_OUTPUT=False
+ALGORITHM=dfs
+TILE_SIZE=256
+WORKERS=1
+WALL_OPENING_DENSITY=0.05
+DEAD_END_REMOVAL=0
+"""
+
+
+def assert_same_maze(loaded: Maze, maze: Maze) -> None:
+    assert loaded.get_grid().get_walls() == maze.get_grid().get_walls()
+    assert loaded.get_grid().get_fixed() == maze.get_grid().get_fixed()
+    assert loaded.get_entry() == maze.get_entry()
+    assert loaded.get_exit() == maze.get_exit()
+    assert loaded.get_pathway() == maze.get_pathway()
+    assert loaded.get_directions_followed() == maze.get_directions_followed()
+    assert loaded.get_seed() == maze.get_seed()
+    assert loaded.get_perfect() == maze.get_perfect()
+
+
+def write_config(path: Path, width: int) -> str:
+    path.write_text(CONFIG.format(width=width))
+    return str(path)
+
+
+# DISK CACHE ------------------------------------------------------------------
+def test_cache_round_trip(tmp_path: Path, bfs) -> None:
+    cache = MazeCache(str(tmp_path))
+    maze = Maze(**PARAMETERS)
+
+    assert cache.get(PARAMETERS) is None
+    assert cache.put(PARAMETERS, maze)
+    loaded = cache.get(PARAMETERS)
+    assert loaded is not None
+    assert_same_maze(loaded, maze)
+
+    distances = bfs(loaded.get_grid(), loaded.get_entry())
+    assert len(loaded.get_pathway()) - 1 >= distances[loaded.get_exit()]
+
+
+@pytest.mark.parametrize("field, value", (
+    ("width", 26), ("height", 17), ("entry", (2, 1)), ("exit", (24, 18)),
+    ("seed_num", 10), ("perfect", True), ("ft_logo", False),
+    ("ft_logo_scale", True), ("algorithm", "kruskal"),
+    ("wall_opening_density", 0.1), ("dead_end_removal", 0.25)))
+def test_key_changes_with_the_cells(field: str, value: Any) -> None:
+    assert MazeCache.key({**PARAMETERS, field: value}) != (
+        MazeCache.key(PARAMETERS))
+
+
+@pytest.mark.parametrize("field, value", (
+    ("output_file", "other.txt"), ("workers", 4), ("tile_size", 64),
+    ("binary_output", True), ("entry", [1, 1])))
+def test_key_ignores_everything_else(field: str, value: Any) -> None:
+    assert MazeCache.key({**PARAMETERS, field: value}) == (
+        MazeCache.key(PARAMETERS))
+
+
+def test_key_of_perfect_mazes_ignores_imperfections() -> None:
+    perfect = {**PARAMETERS, "perfect": True}
+    assert MazeCache.key({**perfect, "wall_opening_density": 0.3,
+                          "dead_end_removal": 1}) == MazeCache.key(perfect)
+    tiled = {**PARAMETERS, "algorithm": "tiled"}
+    assert MazeCache.key({**tiled, "tile_size": 64}) != (
+        MazeCache.key(tiled))
+
+
+def test_cache_is_invalidated_by_parameters_and_version(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = MazeCache(str(tmp_path))
+    cache.put(PARAMETERS, Maze(**PARAMETERS))
+
+    assert cache.get({**PARAMETERS, "seed_num": 10}) is None
+    assert cache.get({**PARAMETERS, "dead_end_removal": 0}) is None
+    assert cache.get(PARAMETERS) is not None
+    monkeypatch.setattr(MazeCache, "library_version",
+                        staticmethod(lambda: "0.0.0"))
+    assert cache.get(PARAMETERS) is None
+
+
+def test_cache_skips_random_mazes(tmp_path: Path) -> None:
+    cache = MazeCache(str(tmp_path))
+    for parameters in ({**PARAMETERS, "seed_num": 0},
+                       {**PARAMETERS, "path_finder": True}):
+        assert not cache.put(parameters, Maze(**parameters))
+        assert cache.get(parameters) is None
+    assert not os.listdir(tmp_path)
+
+
+def test_cache_removes_unreadable_files(tmp_path: Path) -> None:
+    cache = MazeCache(str(tmp_path))
+    cache.put(PARAMETERS, Maze(**PARAMETERS))
+    path = Path(cache.path_of(cache.key(PARAMETERS)))
+    path.write_bytes(path.read_bytes()[:20])
+
+    assert cache.get(PARAMETERS) is None
+    assert not path.exists()
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = MazeCache(str(tmp_path))
+    seeds = (1, 2, 3)
+    for seed in seeds:
+        parameters = {**PARAMETERS, "seed_num": seed}
+        cache.put(parameters, Maze(**parameters))
+    paths = [Path(cache.path_of(cache.key({**PARAMETERS, "seed_num": s})))
+             for s in seeds]
+    for age, path in enumerate(paths):
+        os.utime(path, (age, age))
+    # Reading the oldest one makes the second the least recently used
+    assert cache.get({**PARAMETERS, "seed_num": 1}) is not None
+
+    kept = paths[0].stat().st_size + paths[2].stat().st_size
+    small = MazeCache(str(tmp_path), max_bytes=kept)
+    small.evict()
+    assert [path.exists() for path in paths] == [True, False, True]
+
+    small.clear()
+    assert not any(path.exists() for path in paths)
+    with pytest.raises(MazeError):
+        MazeCache(str(tmp_path), max_bytes=-1)
+
+
+def test_generate_with_cache(tmp_path: Path) -> None:
+    config = write_config(tmp_path / "config.txt", 20)
+    cache = MazeCache(str(tmp_path / "cache"))
+
+    generated = MazeGenerator.generate(config, cache=cache)
+    assert len(os.listdir(cache.get_directory())) == 1
+    cached = MazeGenerator.generate(config, cache=cache)
+    assert_same_maze(cached, generated)
+
+
+# MEMORY CACHE ----------------------------------------------------------------
+def test_memory_cache_returns_copies() -> None:
+    memory = MemoryMazeCache()
+    maze = Maze(**PARAMETERS)
+
+    assert memory.get(PARAMETERS) is None
+    assert memory.put(PARAMETERS, maze)
+    first = memory.get(PARAMETERS)
+    assert first is not None
+    assert_same_maze(first, maze)
+
+    # Changing a returned maze doesn't touch the cached one
+    first.get_grid().get_walls()[0] = 0
+    second = memory.get(PARAMETERS)
+    assert second is not None and second is not first
+    assert_same_maze(second, maze)
+    stats = memory.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+    assert stats["bytes"] > 0
+
+
+def test_memory_cache_keys_and_limits() -> None:
+    memory = MemoryMazeCache(max_entries=2)
+    for seed in (1, 2, 3):
+        parameters = {**PARAMETERS, "seed_num": seed}
+        memory.put(parameters, Maze(**parameters))
+        if seed == 2:
+            # Using the first one makes the second the least recently used
+            memory.get({**PARAMETERS, "seed_num": 1})
+
+    assert len(memory) == 2
+    assert memory.get({**PARAMETERS, "seed_num": 2}) is None
+    assert memory.get({**PARAMETERS, "seed_num": 1}) is not None
+    assert memory.get({**PARAMETERS, "seed_num": 3}) is not None
+    assert memory.get({**PARAMETERS, "seed_num": 1, "workers": 2}) is None
+    assert not memory.put({**PARAMETERS, "seed_num": 0}, Maze(**PARAMETERS))
+    assert not MemoryMazeCache(0).put(PARAMETERS, Maze(**PARAMETERS))
+
+    assert not memory.is_cacheable({**PARAMETERS, "seed_num": 0})
+
+    memory.clear()
+    assert len(memory) == 0 and memory.get_hits() == 0
+    with pytest.raises(MazeError):
+        MemoryMazeCache(-1)
+
+
+def test_memory_cache_keeps_found_pathways() -> None:
+    memory = MemoryMazeCache()
+    parameters = {**PARAMETERS, "path_finder": True}
+    maze = Maze(**parameters)
+    assert len(maze.get_possible_pathways()) > 1
+
+    # Unlike the disk cache, the possible pathways are kept in memory
+    assert not MazeCache.is_cacheable(parameters)
+    assert memory.is_cacheable(parameters)
+    assert memory.put(parameters, maze)
+    cached = memory.get(parameters)
+    assert cached is not None
+    assert_same_maze(cached, maze)
+    assert cached.get_possible_pathways() == maze.get_possible_pathways()
+    assert (memory.get_hits(), memory.get_misses()) == (1, 0)
+
+
+def test_memory_cache_reads_changed_configs(tmp_path: Path) -> None:
+    memory = MemoryMazeCache()
+    path = tmp_path / "config.txt"
+    config = write_config(path, 20)
+
+    first = MazeGenerator.generate(config, memory=memory)
+    second = MazeGenerator.generate(config, memory=memory)
+    assert_same_maze(second, first)
+    assert (memory.get_hits(), memory.get_misses()) == (1, 1)
+
+    # A new size is only seen if the file is parsed again
+    write_config(path, 22)
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 10 ** 9))
+    third = MazeGenerator.generate(config, memory=memory)
+    assert third.get_width() == 22
+    assert (memory.get_hits(), memory.get_misses()) == (1, 2)
@@ -0,0 +1,275 @@
+#!/bin/env python3
+
+# Main imports
+from mazegen.generator import Maze, MazeIO, BinaryMazeFile, MazeError
+from mazegen.generator.src.pathfinder import PathFinder
+from mazegen.generator.src.predefined import ALGORITHMS
+
+# Other imports
+from pathlib import Path
+import pytest
+
+MAZES = (
+    # Odd width, so the last nibble of every binary row is padding
+    {"width": 21, "height": 14, "entry": (1, 1), "exit": (21, 14),
+     "seed_num": 7, "perfect": True},
+    {"width": 30, "height": 20, "entry": (2, 3), "exit": (29, 18),
+     "seed_num": 11, "perfect": False, "path_finder": True},
+    {"width": 40, "height": 25, "entry": (1, 25), "exit": (40, 1),
+     "seed_num": 3, "perfect": True, "algorithm": "kruskal",
+     "ft_logo_scale": True},
+)
+
+
+def assert_same_maze(loaded: Maze, maze: Maze) -> None:
+    grid, original = loaded.get_grid(), maze.get_grid()
+    assert (loaded.get_width(), loaded.get_height()) == (
+        maze.get_width(), maze.get_height())
+    assert grid.get_walls() == original.get_walls()
+    assert loaded.get_entry() == maze.get_entry()
+    assert loaded.get_exit() == maze.get_exit()
+    assert loaded.get_directions_followed() == maze.get_directions_followed()
+    assert loaded.get_pathway() == maze.get_pathway()
+    assert loaded.get_seed() == maze.get_seed()
+    assert loaded.get_algorithm() == maze.get_algorithm()
+    assert loaded.get_perfect() == maze.get_perfect()
+    assert loaded.get_ft_logo() == maze.get_ft_logo()
+    assert loaded.get_ft_logo_scale() == maze.get_ft_logo_scale()
+
+
+# PACKED MAZES ----------------------------------------------------------------
+@pytest.mark.parametrize("parameters", MAZES)
+def test_pack_round_trip(parameters: dict, bfs, valid_path) -> None:
+    maze = Maze(**parameters)
+    loaded = MazeIO.unpack(MazeIO.pack(maze))
+
+    assert_same_maze(loaded, maze)
+    grid = loaded.get_grid()
+    assert grid.get_visited() == maze.get_grid().get_visited()
+    assert grid.get_fixed() == maze.get_grid().get_fixed()
+    assert loaded.get_possible_pathways() == maze.get_possible_pathways()
+    assert valid_path(grid, loaded.get_pathway())
+    assert loaded.get_pathway()[-1] == loaded.get_exit()
+
+    # Searches on the loaded maze still give the true shortest distance
+    distance = bfs(grid, loaded.get_entry())[loaded.get_exit()]
+    shortest = PathFinder.shortest_path(loaded, loaded.get_entry(),
+                                        loaded.get_exit())
+    assert len(shortest) - 1 == distance
+
+
+def test_unpack_rejects_bad_data() -> None:
+    packed = MazeIO.pack(Maze(**MAZES[0]))
+    with pytest.raises(MazeError):
+        MazeIO.unpack(packed[:len(packed) // 2])
+    with pytest.raises(MazeError):
+        MazeIO.unpack(b"NOPE" + packed[4:])
+    with pytest.raises(MazeError):
+        MazeIO.unpack(b"")
+
+
+# BINARY FILES ----------------------------------------------------------------
+@pytest.mark.parametrize("parameters", MAZES)
+def test_binary_round_trip(parameters: dict, tmp_path: Path, bfs) -> None:
+    maze = Maze(**parameters)
+    path = str(tmp_path / "maze.mzb")
+    MazeIO.write_binary(maze, path)
+    loaded = MazeIO.read_binary(path)
+
+    assert_same_maze(loaded, maze)
+    assert Maze.from_file(path).get_grid().get_walls() == (
+        maze.get_grid().get_walls())
+    # The only path of a perfect maze is the shortest one
+    distances = bfs(loaded.get_grid(), loaded.get_entry())
+    steps = len(loaded.get_pathway()) - 1
+    if loaded.get_perfect():
+        assert steps == distances[loaded.get_exit()]
+    else:
+        assert steps >= distances[loaded.get_exit()]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_binary_keeps_every_algorithm(algorithm: str, tmp_path: Path) -> None:
+    maze = Maze(**MAZES[0], algorithm=algorithm, tile_size=8)
+    path = str(tmp_path / "maze.mzb")
+    MazeIO.write_binary(maze, path)
+
+    assert BinaryMazeFile(path).get_algorithm() == algorithm
+    loaded = Maze.from_file(path)
+    assert loaded.get_algorithm() == algorithm
+    assert loaded.get_grid().get_walls() == maze.get_grid().get_walls()
+
+
+def test_binary_rejects_unknown_algorithms(tmp_path: Path) -> None:
+    path = tmp_path / "maze.mzb"
+    MazeIO.write_binary(Maze(**MAZES[0]), str(path))
+    data = bytearray(path.read_bytes())
+    field = data.index(b"dfs\x00")
+    data[field:field + 3] = b"xyz"
+    path.write_bytes(data)
+    with pytest.raises(MazeError):
+        BinaryMazeFile(str(path))
+    with pytest.raises(MazeError):
+        MazeIO.binary_header(3, 3, (1, 1), (3, 3), 1, "binary_t", 0, 0)
+
+
+def test_binary_random_access(tmp_path: Path) -> None:
+    maze = Maze(**MAZES[0])
+    grid = maze.get_grid()
+    path = str(tmp_path / "maze.mzb")
+    MazeIO.write_binary(maze, path)
+    maze_file = BinaryMazeFile(path)
+
+    assert maze_file.get_directions() == "".join(
+        maze.get_directions_followed())
+    for y in range(1, maze.get_height() + 1):
+        for x in range(1, maze.get_width() + 1):
+            assert maze_file.cell((x, y)) == grid.get_walls()[
+                grid.index((x, y))]
+
+    # Regions starting and ending on both nibbles of a byte
+    for top_left, bottom_right in (((2, 3), (9, 8)), ((3, 1), (21, 14)),
+                                   ((1, 5), (20, 5)), ((21, 14), None)):
+        region = maze_file.region(top_left, bottom_right)
+        x1, y1 = bottom_right or (maze.get_width(), maze.get_height())
+        assert region.tolist() == [
+            [grid.get_walls()[grid.index((x, y))]
+             for x in range(top_left[0], x1 + 1)]
+            for y in range(top_left[1], y1 + 1)]
+
+    with pytest.raises(MazeError):
+        maze_file.cell((22, 1))
+    with pytest.raises(MazeError):
+        maze_file.region((5, 5), (4, 5))
+
+
+def test_binary_rejects_bad_files(tmp_path: Path) -> None:
+    path = tmp_path / "maze.mzb"
+    MazeIO.write_binary(Maze(**MAZES[0]), str(path))
+    data = path.read_bytes()
+
+    path.write_bytes(data[:-10])
+    with pytest.raises(MazeError):
+        MazeIO.read_binary(str(path))
+    path.write_bytes(b"NOPE" + data[4:])
+    with pytest.raises(MazeError):
+        MazeIO.read_binary(str(path))
+    path.write_bytes(data[:8])
+    with pytest.raises(MazeError):
+        MazeIO.read_binary(str(path))
+
+
+def test_binary_output_next_to_text(tmp_path: Path) -> None:
+    output = tmp_path / "maze.txt"
+    maze = Maze(**MAZES[0], output_file=str(output), binary_output=True)
+    maze.print_output()
+
+    assert output.exists()
+    binary = MazeIO.read_binary(MazeIO.binary_path(str(output)))
+    assert binary.get_grid().get_walls() == maze.get_grid().get_walls()
+
+
+# TEXT FILES ------------------------------------------------------------------
+@pytest.mark.parametrize("parameters", MAZES)
+def test_text_round_trip(parameters: dict, tmp_path: Path) -> None:
+    output = str(tmp_path / "maze.txt")
+    maze = Maze(**parameters, output_file=output)
+    maze.print_output()
+    loaded = MazeIO.read_text(output)
+
+    grid = loaded.get_grid()
+    assert grid.get_walls() == maze.get_grid().get_walls()
+    assert grid.get_fixed() == maze.get_grid().get_fixed()
+    assert loaded.get_entry() == maze.get_entry()
+    assert loaded.get_exit() == maze.get_exit()
+    assert loaded.get_pathway() == maze.get_pathway()
+    assert loaded.get_perfect() == maze.get_perfect()
+    assert loaded.get_path_finder() == maze.get_path_finder()
+    if maze.get_path_finder():
+        assert loaded.get_possible_pathways() == (
+            maze.get_possible_pathways())
+
+
+def rewrite_cell(path: Path, coords: tuple[int, int], state: int) -> None:
+    """
+    Replaces the hexadecimal digit of one cell of a text output file.
+    """
+    lines = path.read_text().split("\n")
+    x, y = coords
+    row = lines[y - 1]
+    lines[y - 1] = row[:x - 1] + "0123456789ABCDEF"[state] + row[x:]
+    path.write_text("\n".join(lines))
+
+
+def test_text_rejects_inconsistent_walls(tmp_path: Path) -> None:
+    output = tmp_path / "maze.txt"
+    maze = Maze(**MAZES[0], output_file=str(output))
+    grid = maze.get_grid()
+    maze.print_output()
+    text = output.read_text()
+
+    # Opening the north wall of a cell of the first row
+    for x in range(1, maze.get_width() + 1):
+        state = grid.get_walls()[grid.index((x, 1))]
+        if not grid.get_fixed()[grid.index((x, 1))]:
+            break
+    rewrite_cell(output, (x, 1), state & ~0b0001)
+    with pytest.raises(MazeError):
+        MazeIO.read_text(str(output))
+
+    # Closing only one side of an open wall between two cells
+    output.write_text(text)
+    index = next(i for i, state in enumerate(grid.get_walls())
+                 if not state & 0b0010)
+    rewrite_cell(output, grid.coords(index),
+                 grid.get_walls()[index] | 0b0010)
+    with pytest.raises(MazeError):
+        MazeIO.read_text(str(output))
+
+    # Untouched file
+    output.write_text(text)
+    assert MazeIO.read_text(str(output)).get_grid().get_walls() == (
+        grid.get_walls())
+
+
+def rewrite_directions(path: Path, directions: str) -> None:
+    """
+    Replaces the directions line of a text output file.
+    """
+    grid, separator, rest = path.read_text().partition("\n\n")
+    lines = rest.split("\n")
+    lines[2] = directions
+    path.write_text(grid + separator + "\n".join(lines))
+
+
+def test_text_rejects_wrong_directions(tmp_path: Path) -> None:
+    output = tmp_path / "maze.txt"
+    maze = Maze(**MAZES[0], output_file=str(output))
+    maze.print_output()
+    directions = "".join(maze.get_directions_followed())
+
+    # Through a wall, past the exit, short of it and unknown letters
+    first = directions[0]
+    blocked = next(d for d in "NESW" if d != first)
+    for wrong in (blocked + directions[1:], directions + "N",
+                  directions[:-1], "X" + directions[1:]):
+        rewrite_directions(output, wrong)
+        with pytest.raises(MazeError):
+            MazeIO.read_text(str(output))
+
+
+def test_text_without_directions(tmp_path: Path, bfs, valid_path) -> None:
+    # Like the files written by MazeGenerator.stream
+    output = tmp_path / "maze.txt"
+    maze = Maze(**{**MAZES[1], "path_finder": False}, output_file=str(output))
+    maze.print_output()
+    rewrite_directions(output, "")
+    loaded = MazeIO.read_text(str(output))
+
+    grid = loaded.get_grid()
+    pathway = loaded.get_pathway()
+    assert valid_path(grid, pathway)
+    assert (pathway[0], pathway[-1]) == (maze.get_entry(), maze.get_exit())
+    assert len(pathway) - 1 == bfs(grid, maze.get_entry())[maze.get_exit()]
+    assert loaded.follow_directions(
+        loaded.get_entry(), loaded.get_directions_followed()) == pathway
@@ -0,0 +1,341 @@
+#!/bin/env python3
+
+# Main imports
+from mazegen.generator import (Maze, CellGrid, Coords, PathIndex,
+                               JunctionGraph, MazeError)
+from mazegen.generator.src.pathfinder import PathFinder
+
+# Other imports
+from random import Random
+from time import perf_counter
+import pytest
+import tracemalloc
+
+PERFECT = {"width": 31, "height": 23, "entry": (1, 1), "exit": (31, 23),
+           "seed_num": 17, "perfect": True}
+IMPERFECT = {**PERFECT, "perfect": False, "wall_opening_density": 0.2}
+
+SEARCHES = (PathFinder.shortest_path, PathFinder.astar,
+            PathFinder.bidirectional_search)
+
+
+def random_cells(maze: Maze, count: int, seed: int = 0) -> list[Coords]:
+    """
+    Returns ``count`` random free cells of the maze.
+    """
+    grid = maze.get_grid()
+    rng = Random(seed)
+    cells: list[Coords] = []
+    while len(cells) < count:
+        coords = (rng.randint(1, maze.get_width()),
+                  rng.randint(1, maze.get_height()))
+        if not grid.get_fixed()[grid.index(coords)]:
+            cells.append(coords)
+    return cells
+
+
+def open_wall(maze: Maze, coords: Coords, side: int) -> Coords:
+    """
+    Opens the wall on the given side (index of ``CellGrid.WALL_BITS``) of
+    a cell from both of its sides, returning the cell behind it.
+    """
+    grid = maze.get_grid()
+    adjacent = grid.coords(grid.get_neighbors()[side][grid.index(coords)])
+    for cell, bit in ((coords, CellGrid.WALL_BITS[side]),
+                      (adjacent, CellGrid.OPPOSITE_WALL_BITS[side])):
+        state = grid.get_walls()[grid.index(cell)]
+        maze.set_cell(cell, {"state": state & ~bit})
+    return adjacent
+
+
+# DISTANCE FIELD --------------------------------------------------------------
+@pytest.mark.parametrize("parameters", (PERFECT, IMPERFECT))
+def test_distance_field(parameters: dict, bfs, valid_path) -> None:
+    maze = Maze(**parameters)
+    grid = maze.get_grid()
+    for target in (None, maze.get_entry(), (16, 2)):
+        distances = bfs(grid, target or maze.get_exit())
+        field = maze.distance_field(target)
+        for i in range(grid.get_size()):
+            assert field[i] == distances.get(grid.coords(i),
+                                             CellGrid.NO_NEIGHBOR)
+        for coords in random_cells(maze, 20):
+            path = maze.path_to(coords, target)
+            if coords not in distances:
+                assert path is None and maze.distance_to(coords) is None
+                continue
+            assert maze.distance_to(coords, target) == distances[coords]
+            assert valid_path(grid, path)
+            assert len(path) - 1 == distances[coords]
+
+
+def test_distance_field_follows_wall_changes(bfs) -> None:
+    maze = Maze(**PERFECT)
+    grid = maze.get_grid()
+    before = maze.distance_field()
+    assert maze.distance_field() is before
+
+    # Opening a closed wall of the entry
+    entry = maze.get_entry()
+    side = next(side for side, table in enumerate(grid.get_neighbors())
+                if table[grid.index(entry)] >= 0
+                and not grid.get_fixed()[table[grid.index(entry)]]
+                and grid.get_walls()[grid.index(entry)]
+                & CellGrid.WALL_BITS[side])
+    adjacent = open_wall(maze, entry, side)
+
+    after = maze.distance_field()
+    assert after is not before
+    distances = bfs(grid, maze.get_exit())
+    assert maze.distance_to(entry) == distances[entry]
+    assert maze.distance_to(entry) == min(
+        before[grid.index(entry)], before[grid.index(adjacent)] + 1)
+
+
+# PATH INDEX ------------------------------------------------------------------
+@pytest.mark.parametrize("algorithm", ("dfs", "kruskal", "wilson", "tiled"))
+def test_path_index_matches_bfs(algorithm: str, bfs, valid_path) -> None:
+    maze = Maze(**PERFECT, algorithm=algorithm, tile_size=8)
+    grid = maze.get_grid()
+    index = maze.build_path_index()
+    cells = random_cells(maze, 40)
+    sources, targets = cells[:20], cells[20:]
+
+    root_distances = bfs(grid, maze.get_entry())
+    assert index.get_size() == len(root_distances)
+    lengths = index.path_lengths(sources, targets)
+    for a, b, length in zip(sources, targets, lengths):
+        distance = bfs(grid, a)[b]
+        assert index.path_length(a, b) == distance == length
+        path = index.path(a, b)
+        assert valid_path(grid, path)
+        assert (path[0], path[-1], len(path) - 1) == (a, b, distance)
+        # The lowest common ancestor is the cell of the path nearest to
+        # the root
+        assert index.lowest_common_ancestor(a, b) == min(
+            path, key=root_distances.__getitem__)
+        assert index.depth(a) == root_distances[a]
+    assert maze.path(sources[0], targets[0]) == index.path(sources[0],
+                                                           targets[0])
+
+
+def test_path_index_unreachable_cells(bfs) -> None:
+    maze = Maze(**PERFECT)
+    grid = maze.get_grid()
+    fixed = grid.coords(grid.get_fixed().index(True))
+    index = maze.build_path_index()
+    assert index.path_length(fixed, maze.get_exit()) is None
+    assert index.path(maze.get_exit(), (0, 1)) is None
+    lengths = index.path_lengths([fixed, (0, 0), (2, 2)],
+                                 [(1, 1), (1, 1), (1, 1)]).tolist()
+    assert lengths == [-1, -1, bfs(grid, (1, 1))[(2, 2)]]
+
+    closed = CellGrid(4, 3)
+    isolated = PathIndex(closed, (2, 2))
+    assert isolated.get_size() == 1
+    assert isolated.path_length((2, 2), (2, 2)) == 0
+    assert isolated.path_length((2, 2), (1, 1)) is None
+
+
+def test_path_index_errors() -> None:
+    maze = Maze(**PERFECT)
+    grid = maze.get_grid()
+    with pytest.raises(MazeError):
+        PathIndex(grid, (0, 1))
+    with pytest.raises(MazeError):
+        PathIndex(grid, grid.coords(grid.get_fixed().index(True)))
+    with pytest.raises(MazeError):
+        maze.build_path_index().path_lengths([(1, 1)], [])
+    with pytest.raises(MazeError):
+        Maze(**IMPERFECT).build_path_index()
+
+
+def test_path_index_follows_wall_changes() -> None:
+    maze = Maze(**PERFECT)
+    index = maze.build_path_index()
+    assert maze.build_path_index() is index
+
+    # Any wall opened in a perfect maze makes a loop
+    entry = maze.get_entry()
+    grid = maze.get_grid()
+    neighbors = grid.get_neighbors()
+    side = next(side for side in range(4)
+                if neighbors[side][grid.index(entry)] >= 0
+                and not grid.get_fixed()[neighbors[side][grid.index(entry)]]
+                and grid.get_walls()[grid.index(entry)]
+                & CellGrid.WALL_BITS[side])
+    open_wall(maze, entry, side)
+    with pytest.raises(MazeError):
+        maze.build_path_index()
+
+
+# JUNCTION GRAPH --------------------------------------------------------------
+@pytest.mark.parametrize("parameters", (PERFECT, IMPERFECT))
+def test_junction_graph_matches_bfs(parameters: dict, bfs,
+                                    valid_path) -> None:
+    maze = Maze(**parameters)
+    grid = maze.get_grid()
+    graph = maze.junction_graph()
+    assert maze.junction_graph() is graph
+    assert {maze.get_entry(), maze.get_exit()} <= set(graph.nodes())
+
+    # Every corridor is a path of the maze between both of its nodes
+    for edge, (first, second, length) in enumerate(graph.edges()):
+        cells = graph.edge_cells(edge)
+        assert valid_path(grid, cells)
+        assert (cells[0], cells[-1], len(cells) - 1) == (first, second,
+                                                         length)
+
+    cells = random_cells(maze, 30)
+    for a, b in zip(cells[:15], cells[15:]):
+        distance = bfs(grid, a)[b]
+        path = graph.shortest_path(a, b)
+        assert valid_path(grid, path)
+        assert (path[0], path[-1], len(path) - 1) == (a, b, distance)
+    assert graph.shortest_path(cells[0], cells[0]) == [cells[0]]
+
+
+def test_junction_graph_unreachable_cells() -> None:
+    maze = Maze(**PERFECT)
+    grid = maze.get_grid()
+    fixed = grid.coords(grid.get_fixed().index(True))
+    graph = JunctionGraph(grid, (maze.get_entry(),))
+    assert graph.shortest_path(maze.get_entry(), fixed) is None
+    with pytest.raises(MazeError):
+        graph.edge_cells(graph.get_edge_count())
+
+
+# POINT TO POINT SEARCHES -----------------------------------------------------
+@pytest.mark.parametrize("search", SEARCHES)
+@pytest.mark.parametrize("parameters", (PERFECT, IMPERFECT))
+def test_searches_match_bfs(search, parameters: dict, bfs,
+                            valid_path) -> None:
+    maze = Maze(**parameters)
+    grid = maze.get_grid()
+    cells = random_cells(maze, 40, seed=1)
+    for a, b in zip(cells[:20], cells[20:]):
+        distance = bfs(grid, a)[b]
+        path = search(maze, a, b)
+        assert valid_path(grid, path)
+        assert (path[0], path[-1], len(path) - 1) == (a, b, distance)
+    assert search(maze, cells[0], cells[0]) == [cells[0]]
+
+
+@pytest.mark.parametrize("search", SEARCHES)
+def test_searches_unreachable_cells(search) -> None:
+    maze = Maze(**IMPERFECT)
+    grid = maze.get_grid()
+    fixed = grid.coords(grid.get_fixed().index(True))
+    assert search(maze, maze.get_entry(), fixed) is None
+    assert search(maze, fixed, maze.get_exit()) is None
+    with pytest.raises(MazeError):
+        search(maze, (0, 1), maze.get_exit())
+    with pytest.raises(MazeError):
+        search(maze, maze.get_entry(), (32, 1))
+
+
+# K SHORTEST PATHS ------------------------------------------------------------
+@pytest.mark.parametrize("seed", range(1, 9))
+def test_k_shortest_paths_match_brute_force(seed: int, all_paths) -> None:
+    maze = Maze(7, 6, (1, 1), (7, 6), seed_num=seed, perfect=False,
+                ft_logo=False, wall_opening_density=0.5)
+    grid = maze.get_grid()
+    every_path = all_paths(grid, maze.get_entry(), maze.get_exit())
+    lengths = sorted(map(len, every_path))
+
+    for k in (1, 3, len(every_path), len(every_path) + 2):
+        paths = PathFinder.k_shortest_paths(maze, k)
+        # Ties can be listed in any order, so only the lengths are compared
+        assert len(paths) == min(k, len(every_path))
+        assert list(map(len, paths)) == lengths[:k]
+        assert len({tuple(path) for path in paths}) == len(paths)
+        assert all(path in every_path for path in paths)
+
+
+def test_k_shortest_paths_of_a_perfect_maze() -> None:
+    maze = Maze(**PERFECT)
+    assert PathFinder.k_shortest_paths(maze, 5) == [maze.get_pathway()]
+    with pytest.raises(MazeError):
+        PathFinder.k_shortest_paths(maze, 0)
+
+
+def test_k_shortest_paths_size(valid_path) -> None:
+    # Long paths with few loops, where every path has thousands of spurs
+    maze = Maze(120, 120, (1, 1), (120, 120), seed_num=42, perfect=False,
+                wall_opening_density=0.05)
+    maze.distance_field(maze.get_exit())
+    PathFinder.search_buffers(maze.get_grid().get_size())
+
+    start = perf_counter()
+    paths = PathFinder.k_shortest_paths(maze, 10)
+    elapsed = perf_counter() - start
+    tracemalloc.start()
+    try:
+        PathFinder.k_shortest_paths(maze, 10)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert len(paths) == 10 and len(paths[0]) > 300
+    assert len({tuple(path) for path in paths}) == len(paths)
+    assert all(valid_path(maze.get_grid(), path) for path in paths)
+    # About 0.2 s and 1 MB, keeping every candidate whole took 3 MB
+    assert elapsed < 3
+    assert peak < 2 * 2 ** 20
+
+
+# DEAD END FILLING ------------------------------------------------------------
+@pytest.mark.parametrize("algorithm", ("dfs", "kruskal", "wilson", "tiled"))
+def test_dead_end_solution_matches_bfs(algorithm: str, bfs,
+                                       valid_path) -> None:
+    maze = Maze(**PERFECT, algorithm=algorithm, tile_size=8)
+    grid = maze.get_grid()
+    pathway = PathFinder.dead_end_solution(maze)
+    assert pathway == maze.get_pathway()
+    assert valid_path(grid, pathway)
+    assert len(pathway) - 1 == bfs(grid, maze.get_entry())[maze.get_exit()]
+
+    remaining = PathFinder.dead_end_filling(maze)
+    assert {(x + 1, y + 1) for y, x in zip(*remaining.nonzero())} == set(
+        pathway)
+
+    cells = random_cells(maze, 20, seed=2)
+    for a, b in zip(cells[:10], cells[10:]):
+        path = PathFinder.grid_dead_end_solution(grid, a, b)
+        assert valid_path(grid, path)
+        assert (path[0], path[-1], len(path) - 1) == (a, b, bfs(grid, a)[b])
+
+
+@pytest.mark.parametrize("seed", range(1, 9))
+def test_dead_end_filling_keeps_every_path(seed: int, all_paths) -> None:
+    maze = Maze(7, 6, (1, 1), (7, 6), seed_num=seed, perfect=False,
+                ft_logo=False, wall_opening_density=0.5)
+    remaining = PathFinder.dead_end_filling(maze)
+    for path in all_paths(maze.get_grid(), maze.get_entry(),
+                          maze.get_exit()):
+        assert all(remaining[y - 1, x - 1] for x, y in path)
+
+
+def test_dead_end_filling_ignores_open_borders() -> None:
+    maze = Maze(**PERFECT)
+    grid = maze.get_grid()
+    walls = grid.get_walls()
+    # Opening the outer walls of every border cell, only from the inside
+    for x in range(1, maze.get_width() + 1):
+        walls[grid.index((x, 1))] &= ~CellGrid.WALL_BITS[0]
+        walls[grid.index((x, maze.get_height()))] &= ~CellGrid.WALL_BITS[2]
+    for y in range(1, maze.get_height() + 1):
+        walls[grid.index((maze.get_width(), y))] &= ~CellGrid.WALL_BITS[1]
+        walls[grid.index((1, y))] &= ~CellGrid.WALL_BITS[3]
+    grid.mark_changed()
+
+    assert PathFinder.dead_end_solution(maze) == maze.get_pathway()
+
+
+def test_dead_end_solution_unreachable_cells() -> None:
+    closed = CellGrid(5, 4)
+    assert PathFinder.grid_dead_end_solution(closed, (1, 1), (5, 4)) is None
+    assert PathFinder.grid_dead_end_solution(closed, (2, 2), (2, 2)) == [
+        (2, 2)]
+    with pytest.raises(MazeError):
+        PathFinder.grid_dead_end_solution(closed, (0, 1), (5, 4))